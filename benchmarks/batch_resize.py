@@ -0,0 +1,74 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Benchmark of batch resizing against per-sample Resize.
+
+Resizes random MNIST-sized uint8 images to every requested size,
+once with ToTensor and Resize applied image by image (the default
+path of load_mnist_dataset) and once with resize_images on the
+whole stacked array, and reports the time of both.
+
+Usage:
+    python benchmarks/batch_resize.py --img-sizes 4 7 8 --num-images 60000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import torch
+import torchvision
+
+from piqture.data_loader import resize_images
+
+
+def per_sample_resize(images: np.ndarray, img_size: int) -> torch.Tensor:
+    """Resizes images one by one, like the per-sample transforms."""
+    transform = torchvision.transforms.Compose(
+        [torchvision.transforms.ToTensor(), torchvision.transforms.Resize(img_size)]
+    )
+    return torch.stack([transform(image) for image in images])
+
+
+def run(images: np.ndarray, img_sizes: list[int]):
+    """Times both resize paths for every image size."""
+    print(f"{'img_size':>8} {'per_sample_s':>12} {'batch_s':>8} {'speedup':>8}")
+    for img_size in img_sizes:
+        start = time.perf_counter()
+        per_sample_resize(images, img_size)
+        per_sample = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resize_images(images, img_size)
+        batch = time.perf_counter() - start
+        print(
+            f"{img_size:>8} {per_sample:>12.2f} {batch:>8.3f} "
+            f"{per_sample / batch:>7.0f}x"
+        )
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--img-sizes", nargs="+", default=[4, 7, 8], type=int)
+    parser.add_argument("--num-images", default=60000, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    images = rng.integers(0, 256, (args.num_images, 28, 28), dtype=np.uint8)
+    run(images, args.img_sizes)
+
+
+if __name__ == "__main__":
+    main()
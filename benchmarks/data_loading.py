@@ -0,0 +1,96 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Throughput benchmark for load_mnist_dataset.
+
+Iterates one epoch of the training DataLoader for every requested
+number of workers and reports samples per second. Without --root,
+seeded synthetic MNIST-like IDX files are written to a temporary
+directory.
+
+Usage:
+    python benchmarks/data_loading.py --workers 0 2 4 --img-size 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from piqture.data_loader import load_mnist_dataset, synthetic_images
+
+
+def write_random_mnist(root: str, num_train: int, num_test: int, seed: int):
+    """Writes synthetic uncompressed MNIST IDX files to root."""
+    splits = (("train", num_train, seed), ("t10k", num_test, seed + 1))
+    for prefix, num_samples, split_seed in splits:
+        images, labels = synthetic_images(num_samples, seed=split_seed)
+        arrays = {
+            "images-idx3-ubyte": images,
+            "labels-idx1-ubyte": labels.astype(np.uint8),
+        }
+        for suffix, array in arrays.items():
+            with open(os.path.join(root, f"{prefix}-{suffix}"), "wb") as file:
+                file.write(bytes([0, 0, 0x08, array.ndim]))
+                file.write(np.array(array.shape, dtype=">u4").tobytes())
+                file.write(array.tobytes())
+
+
+def run(root: str, workers: list[int], img_size: int, batch_size: int):
+    """Times one training epoch for every number of workers."""
+    print(f"{'num_workers':>11} {'samples':>8} {'epoch_s':>8} {'samples/s':>10}")
+    for num_workers in workers:
+        train_loader, _ = load_mnist_dataset(
+            img_size=img_size,
+            batch_size=batch_size,
+            normalize_min=1e-6,
+            normalize_max=np.pi / 2,
+            root=root,
+            download=False,
+            num_workers=num_workers,
+        )
+        num_samples = 0
+        start = time.perf_counter()
+        for images, _ in train_loader:
+            num_samples += len(images)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{num_workers:>11} {num_samples:>8} {elapsed:>8.2f} "
+            f"{num_samples / elapsed:>10.0f}"
+        )
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--root", default=None, type=str)
+    parser.add_argument("--workers", nargs="+", default=[0, 2, 4], type=int)
+    parser.add_argument("--img-size", default=8, type=int)
+    parser.add_argument("--batch-size", default=64, type=int)
+    parser.add_argument("--num-train", default=60000, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    if args.root is not None:
+        run(args.root, args.workers, args.img_size, args.batch_size)
+        return
+
+    with tempfile.TemporaryDirectory() as root:
+        write_random_mnist(root, args.num_train, 10000, args.seed)
+        run(root, args.workers, args.img_size, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Construction benchmark for image embedding circuits.
+
+Reports the time taken to build an embedding circuit along
+with its width, gate count and number of multi-controlled
+operations for growing square image sizes.
+
+Usage:
+    python benchmarks/embedding_construction.py --embeddings frqi neqr --sizes 8 16 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+
+from piqture.embeddings.image_embeddings.brqi import BRQI
+from piqture.embeddings.image_embeddings.frqi import FRQI
+from piqture.embeddings.image_embeddings.ineqr import INEQR
+from piqture.embeddings.image_embeddings.mcrqi import MCRQI
+from piqture.embeddings.image_embeddings.neqr import NEQR
+
+
+def build_frqi(img_size: int, rng: np.random.Generator):
+    """Builds an FRQI circuit for a random img_size x img_size image."""
+    pixel_vals = rng.uniform(0, np.pi / 2, img_size * img_size)
+    return FRQI((img_size, img_size), [pixel_vals.tolist()]).frqi()
+
+
+def build_neqr(img_size: int, rng: np.random.Generator):
+    """Builds an NEQR circuit for a random img_size x img_size image."""
+    pixel_vals = rng.integers(0, 256, img_size * img_size)
+    return NEQR((img_size, img_size), [pixel_vals.tolist()]).neqr()
+
+
+def build_ineqr(img_size: int, rng: np.random.Generator):
+    """Builds an INEQR circuit for a random img_size x img_size image."""
+    pixel_vals = rng.integers(0, 256, (img_size, img_size))
+    return INEQR((img_size, img_size), [pixel_vals.tolist()]).ineqr()
+
+
+def build_brqi(img_size: int, rng: np.random.Generator):
+    """Builds a BRQI circuit for a random img_size x img_size image."""
+    pixel_vals = rng.integers(0, 256, img_size * img_size)
+    return BRQI((img_size, img_size), [pixel_vals.tolist()]).brqi()
+
+
+def build_mcrqi(img_size: int, rng: np.random.Generator):
+    """Builds an MCRQI circuit for a random img_size x img_size RGBa image."""
+    pixel_vals = rng.uniform(0, np.pi / 2, (4, img_size * img_size))
+    return MCRQI((img_size, img_size), pixel_vals.tolist()).mcrqi()
+
+
+EMBEDDINGS = {
+    "frqi": build_frqi,
+    "neqr": build_neqr,
+    "ineqr": build_ineqr,
+    "brqi": build_brqi,
+    "mcrqi": build_mcrqi,
+}
+
+
+def run(embeddings: list[str], sizes: list[int], repeats: int, seed: int):
+    """Times circuit construction and prints one row per image size."""
+    rng = np.random.default_rng(seed)
+
+    print(
+        f"{'embedding':<10} {'img_size':>9} {'qubits':>7} {'gates':>8} "
+        f"{'mc_gates':>9} {'build_s':>10}"
+    )
+    for embedding, img_size in itertools.product(embeddings, sizes):
+        builder = EMBEDDINGS[embedding]
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            circuit = builder(img_size, rng)
+            timings.append(time.perf_counter() - start)
+
+        mc_gates = sum(
+            1 for instruction in circuit.data if instruction.operation.num_qubits > 2
+        )
+        print(
+            f"{embedding:<10} {f'{img_size}x{img_size}':>9} "
+            f"{circuit.num_qubits:>7} {circuit.size():>8} "
+            f"{mc_gates:>9} {min(timings):>10.4f}"
+        )
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--embeddings",
+        nargs="+",
+        choices=sorted(EMBEDDINGS),
+        default=["frqi"],
+        type=str,
+    )
+    parser.add_argument("--sizes", nargs="+", default=[8, 16, 32], type=int)
+    parser.add_argument("--repeats", default=3, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    run(args.embeddings, args.sizes, args.repeats, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,54 @@
 Data Loader (module: piqture.data_loader)
 """
 
+from .array_dataset import ImageArrayDataset
+from .batch_resize import resize_dataset, resize_images
+from .circuit_pipeline import encode_batches, encode_image, image_pixel_vals
+from .circuit_store import CircuitStore, encode_dataset
+from .collate import NormalizingCollate
+from .dataset_statistics import (
+    DatasetStatistics,
+    compute_statistics,
+    load_or_compute_statistics,
+)
+from .idx_dataset import IDXDataset, read_idx
+from .label_index import filter_labels, label_indices
+from .local_datasets import load_local_dataset, register_dataset
 from .mnist_data_loader import load_mnist_dataset
+from .prefetch import Prefetcher
+from .preprocessed_cache import PreprocessedDataset, load_or_preprocess
+from .sharding import ShardSampler, shard_indices
+from .stratified import StratifiedSampler, stratified_indices, stratified_subset
+from .synthetic import synthetic_dataset, synthetic_images
 
 __all__ = [
     "load_mnist_dataset",
+    "IDXDataset",
+    "read_idx",
+    "filter_labels",
+    "label_indices",
+    "PreprocessedDataset",
+    "load_or_preprocess",
+    "NormalizingCollate",
+    "DatasetStatistics",
+    "compute_statistics",
+    "load_or_compute_statistics",
+    "encode_batches",
+    "encode_image",
+    "image_pixel_vals",
+    "CircuitStore",
+    "encode_dataset",
+    "ShardSampler",
+    "shard_indices",
+    "ImageArrayDataset",
+    "load_local_dataset",
+    "register_dataset",
+    "StratifiedSampler",
+    "stratified_indices",
+    "stratified_subset",
+    "resize_images",
+    "resize_dataset",
+    "Prefetcher",
+    "synthetic_images",
+    "synthetic_dataset",
 ]
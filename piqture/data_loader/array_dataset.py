@@ -0,0 +1,121 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Datasets of images held in NumPy arrays"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+import torch.utils.data
+
+
+class ImageArrayDataset(torch.utils.data.Dataset):
+    """
+    Dataset of images held in one preallocated uint8 array of
+    shape (N, H, W) or (N, H, W, C), with integer labels.
+
+    An int index returns one transformed (image, label) sample.
+    A slice returns the raw images and labels as views of the
+    arrays, and an index array or list gathers them in a single
+    indexing operation, so whole batches are assembled without
+    per-sample tuples. See batch_loader.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        targets: np.ndarray,
+        transform: Optional[Callable] = None,
+        classes: Optional[list] = None,
+    ):
+        if len(data) != len(targets):
+            raise ValueError(
+                f"No. of images ({len(data)}) and labels "
+                f"({len(targets)}) must be equal."
+            )
+        self.data = data
+        self.targets = targets
+        self.transform = transform
+        self.classes = classes
+
+    @classmethod
+    def from_dataset(
+        cls, dataset: torch.utils.data.Dataset, transform: Optional[Callable] = None
+    ) -> ImageArrayDataset:
+        """
+        Wraps the data and targets arrays of a dataset, e.g.
+        torchvision's MNIST, without copying them.
+        """
+        return cls(
+            np.asarray(dataset.data),
+            np.asarray(dataset.targets),
+            transform=transform,
+            classes=getattr(dataset, "classes", None),
+        )
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __getitem__(self, index):
+        if isinstance(index, (torch.Tensor, np.ndarray)):
+            # 0-d indices select single samples, like ints.
+            index = index.item() if index.ndim == 0 else np.asarray(index)
+        if not isinstance(index, (int, np.integer)):
+            # Slices give views, index arrays a single gather.
+            return self.data[index], self.targets[index]
+
+        # Copy the single image so transforms get a writable array.
+        image = np.array(self.data[index])
+        if self.transform is not None:
+            image = self.transform(image)
+        return image, int(self.targets[index])
+
+    def get_batch(self, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the raw images and labels in [start, stop)
+        as views of the arrays.
+        """
+        return self[start:stop]
+
+    def batch_loader(
+        self,
+        batch_size: int,
+        sampler: Optional[torch.utils.data.Sampler] = None,
+        drop_last: bool = False,
+        **kwargs,
+    ) -> torch.utils.data.DataLoader:
+        """
+        Returns a DataLoader that fetches every batch of raw images
+        and labels with one indexing operation, instead of
+        collating batch_size samples.
+
+        Args:
+            batch_size (int): number of samples per batch.
+            sampler (torch.utils.data.Sampler, optional): sampler of
+            the sample order, e.g. a ShardSampler. Defaults to the
+            dataset order.
+            drop_last (bool): drops the last incomplete batch.
+            Defaults to False.
+            **kwargs: further DataLoader arguments, e.g. num_workers.
+
+        Returns:
+            torch.utils.data.DataLoader: loader of (images, labels)
+            tensors of the stored data types.
+        """
+        if sampler is None:
+            sampler = torch.utils.data.SequentialSampler(self)
+        return torch.utils.data.DataLoader(
+            self,
+            batch_size=None,
+            sampler=torch.utils.data.BatchSampler(sampler, batch_size, drop_last),
+            **kwargs,
+        )
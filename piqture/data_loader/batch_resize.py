@@ -0,0 +1,146 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Resizing of whole image arrays at once"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Union
+
+import numpy as np
+import torch
+import torch.utils.data
+
+from piqture.data_loader.array_dataset import ImageArrayDataset
+
+
+def output_size(
+    image_size: tuple[int, int], img_size: Union[int, tuple[int, int]]
+) -> tuple[int, int]:
+    """
+    Returns the (height, width) an image is resized to, following
+    torchvision.transforms.Resize: an int matches the smaller edge
+    and keeps the aspect ratio.
+    """
+    if isinstance(img_size, tuple):
+        return img_size
+    height, width = image_size
+    if height <= width:
+        return img_size, int(img_size * width / height)
+    return int(img_size * height / width), img_size
+
+
+def _resize_chunk(chunk: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """
+    Resizes uint8 images of shape (n, H, W, C) to float32 images
+    of shape (n, C, h, w) in [0, 255].
+    """
+    num_images, height, width, channels = chunk.shape
+    new_height, new_width = size
+    if height % new_height == 0 and width % new_width == 0:
+        # Area pooling: average every block of pixels.
+        blocks = chunk.reshape(
+            num_images,
+            new_height,
+            height // new_height,
+            new_width,
+            width // new_width,
+            channels,
+        )
+        return blocks.mean(axis=(2, 4), dtype=np.float32).transpose(0, 3, 1, 2)
+    tensor = torch.from_numpy(chunk.astype(np.float32)).permute(0, 3, 1, 2)
+    return torch.nn.functional.interpolate(
+        tensor, size=size, mode="bilinear", antialias=True
+    ).numpy()
+
+
+def resize_images(
+    images: np.ndarray,
+    img_size: Union[int, tuple[int, int]],
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """
+    Resizes a stack of uint8 images in a few vectorized operations
+    instead of one interpolation call per image.
+
+    Integer downscales average every block of pixels (area
+    pooling). Other sizes use antialiased bilinear interpolation
+    like torchvision.transforms.Resize. Images are processed in
+    chunks, so the float intermediates stay small.
+
+    Args:
+        images (np.ndarray): uint8 images of shape (N, H, W) or
+        (N, H, W, C).
+        img_size (int or tuple[int, int]): size the images are
+        resized to, as in torchvision.transforms.Resize.
+        chunk_size (int): number of images resized at once.
+        Defaults to 4096.
+
+    Returns:
+        np.ndarray: float32 images in [0, 1] of shape (N, C, h, w),
+        like the output of ToTensor.
+    """
+    images = np.asarray(images)
+    if images.ndim not in (3, 4):
+        raise ValueError("The input images must have the shape (N, H, W[, C]).")
+    if images.ndim == 3:
+        images = images[..., np.newaxis]
+    num_images, height, width, channels = images.shape
+    new_height, new_width = output_size((height, width), img_size)
+
+    resized = np.empty((num_images, channels, new_height, new_width), np.float32)
+    for start in range(0, num_images, chunk_size):
+        resized[start : start + chunk_size] = _resize_chunk(
+            images[start : start + chunk_size], (new_height, new_width)
+        )
+    resized /= 255
+    return resized
+
+
+def resize_dataset(
+    dataset: torch.utils.data.Dataset,
+    img_size: Optional[Union[int, tuple[int, int]]],
+    transform: Optional[Callable] = None,
+) -> ImageArrayDataset:
+    """
+    Resizes all images of a dataset once, with resize_images.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset with a uint8
+        data array and targets, e.g. an IDXDataset, an
+        ImageArrayDataset or torchvision's MNIST, or a Subset of
+        one, e.g. from filter_labels. Only the images of a Subset
+        are resized.
+        img_size (int or tuple[int, int], optional): size the
+        images are resized to. None keeps the stored size.
+        transform (Callable, optional): transform applied to every
+        resized float32 image of shape (C, h, w).
+
+    Returns:
+        ImageArrayDataset: dataset of the resized images.
+    """
+    indices = None
+    if isinstance(dataset, torch.utils.data.Subset):
+        indices = np.asarray(dataset.indices, dtype=np.int64)
+        dataset = dataset.dataset
+    if not hasattr(dataset, "data"):
+        raise TypeError("Batch resizing requires a dataset with a data array.")
+    data, targets = np.asarray(dataset.data), np.asarray(dataset.targets)
+    if indices is not None:
+        # Gather the selected rows before resizing.
+        data, targets = data[indices], targets[indices]
+    if img_size is None:
+        img_size = data.shape[1:3]
+    return ImageArrayDataset(
+        resize_images(data, img_size),
+        targets,
+        transform=transform,
+        classes=getattr(dataset, "classes", None),
+    )
@@ -0,0 +1,132 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming pipeline from image batches to embedding circuits"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import torch
+from qiskit.circuit import QuantumCircuit
+
+from piqture.data_loader.prefetch import Prefetcher
+from piqture.embeddings.angle_encoding import AngleEncoding
+from piqture.embeddings.image_embeddings.ineqr import INEQR
+
+
+def image_pixel_vals(embedding_cls: type, image: torch.Tensor) -> list:
+    """
+    Converts one image to the pixel_vals layout of an embedding.
+
+    Args:
+        embedding_cls (type): embedding class, e.g. FRQI.
+        image (torch.Tensor): image of shape (C, H, W) or (H, W).
+
+    Returns:
+        list: nested lists of pixel values. INEQR takes one (H, W)
+        list per channel, AngleEncoding takes W lists of H values
+        and all other embeddings take one flat list per channel.
+    """
+    image = torch.as_tensor(image)
+    height, width = image.shape[-2:]
+    if issubclass(embedding_cls, INEQR):
+        return image.reshape(-1, height, width).tolist()
+    if issubclass(embedding_cls, AngleEncoding):
+        return image.reshape(width, height).tolist()
+    return image.reshape(-1, height * width).tolist()
+
+
+def encode_image(
+    embedding_cls: type, image: torch.Tensor, **embedding_kwargs
+) -> QuantumCircuit:
+    """
+    Encodes one image with an embedding class.
+
+    Args:
+        embedding_cls (type): embedding class, e.g. FRQI.
+        image (torch.Tensor): image of shape (C, H, W) or (H, W),
+        already mapped to the values the embedding expects.
+        **embedding_kwargs: further arguments of embedding_cls,
+        e.g. max_color_intensity.
+
+    Returns:
+        QuantumCircuit: embedding circuit of the image.
+    """
+    img_dims = tuple(int(dim) for dim in image.shape[-2:])
+    embedding = embedding_cls(
+        img_dims, image_pixel_vals(embedding_cls, image), **embedding_kwargs
+    )
+    # Embeddings build their circuit with a method named after
+    # the class, e.g. FRQI.frqi(). AngleEncoding builds it on init.
+    build = getattr(embedding, embedding_cls.__name__.lower(), None)
+    return build() if callable(build) else embedding.circuit
+
+
+def encode_batches(
+    loader: Iterable,
+    embedding_cls: type,
+    transform: Optional[Callable] = None,
+    circuit_builder: Optional[Callable[[QuantumCircuit], QuantumCircuit]] = None,
+    prefetch: int = 0,
+    **embedding_kwargs,
+) -> Union[Iterator[tuple[list[QuantumCircuit], torch.Tensor]], Prefetcher]:
+    """
+    Lazily encodes batches of images into embedding circuits.
+
+    Every stage runs on demand: a batch is read from the loader
+    only when the previous one has been consumed, so at most one
+    encoded batch is held at a time, plus the batches a DataLoader
+    prefetches (num_workers * prefetch_factor). With prefetch > 0,
+    up to prefetch more batches are encoded ahead. Memory therefore
+    stays constant regardless of the size of the dataset.
+
+    Args:
+        loader (Iterable): iterable of (images, labels) batches,
+        e.g. a DataLoader from load_mnist_dataset.
+        embedding_cls (type): embedding class, e.g. FRQI or NEQR.
+        transform (Callable, optional): transform applied to each
+        whole batch of images, e.g. AngleMapping or Quantization.
+        circuit_builder (Callable, optional): function applied to
+        each embedding circuit, e.g. to append a classifier ansatz.
+        prefetch (int): number of batches encoded ahead in a
+        background thread, while the current batch is evaluated.
+        Defaults to 0, encoding every batch on demand.
+        **embedding_kwargs: further arguments of embedding_cls.
+
+    Returns:
+        An iterator of (circuits, labels) pairs: the circuits of a
+        batch as a list[QuantumCircuit] and its labels.
+    """
+    batches = _encode_batches(
+        loader, embedding_cls, transform, circuit_builder, embedding_kwargs
+    )
+    if prefetch:
+        return Prefetcher(batches, prefetch)
+    return batches
+
+
+def _encode_batches(
+    loader: Iterable,
+    embedding_cls: type,
+    transform: Optional[Callable],
+    circuit_builder: Optional[Callable[[QuantumCircuit], QuantumCircuit]],
+    embedding_kwargs: dict,
+) -> Iterator[tuple[list[QuantumCircuit], torch.Tensor]]:
+    """Encodes the batches of a loader one by one."""
+    for images, labels in loader:
+        if transform is not None:
+            images = transform(images)
+        circuits = [
+            encode_image(embedding_cls, image, **embedding_kwargs) for image in images
+        ]
+        if circuit_builder is not None:
+            circuits = [circuit_builder(circuit) for circuit in circuits]
+        yield circuits, labels
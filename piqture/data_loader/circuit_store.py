@@ -0,0 +1,261 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""On-disk store of encoded circuits in QPY shards"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+import torch.utils.data
+from qiskit import qpy
+from qiskit.circuit import QuantumCircuit
+
+from piqture.data_loader.circuit_pipeline import encode_image
+
+INDEX_FILE = "index.npz"
+META_FILE = "index.json"
+
+# Dataset and settings of the current worker process, sent
+# once per worker instead of once per shard.
+_WORKER_STATE = {}
+
+
+def shard_path(out_dir: str, shard: int) -> str:
+    """Returns the path of a QPY shard file."""
+    return os.path.join(out_dir, f"shard-{shard:05d}.qpy")
+
+
+def dataset_fingerprint(dataset: torch.utils.data.Dataset) -> str:
+    """
+    Returns a hash of the images, labels and transform of a dataset.
+
+    Datasets with data and targets arrays, e.g. ImageArrayDataset
+    or IDXDataset, are hashed from their arrays and the repr of
+    their transform. A Subset, e.g. from filter_labels, is hashed
+    from its indices and the dataset it selects from. Other
+    datasets are hashed sample by sample.
+    """
+    digest = hashlib.sha256()
+    indices = None
+    while isinstance(dataset, torch.utils.data.Subset):
+        # Nested subsets select from the indices of their parents.
+        subset_indices = np.asarray(dataset.indices, dtype=np.int64)
+        indices = subset_indices if indices is None else subset_indices[indices]
+        dataset = dataset.dataset
+
+    digest.update(type(dataset).__qualname__.encode())
+    digest.update(repr(getattr(dataset, "transform", None)).encode())
+    if hasattr(dataset, "data") and hasattr(dataset, "targets"):
+        arrays = (dataset.data, dataset.targets)
+        if indices is not None:
+            arrays += (indices,)
+    else:
+        samples = range(len(dataset)) if indices is None else indices.tolist()
+        arrays = (array for index in samples for array in dataset[index])
+    for array in arrays:
+        array = np.ascontiguousarray(np.asarray(array))
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        digest.update(array.data)
+    return digest.hexdigest()[:16]
+
+
+class CircuitStore(torch.utils.data.Dataset):
+    """
+    Random-access view of circuits written by encode_dataset.
+
+    The index holds the shard, byte offset and byte length of
+    every sample, so reading a sample loads only its own circuit.
+    """
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        with open(os.path.join(out_dir, META_FILE), encoding="utf-8") as file:
+            self.meta = json.load(file)
+        with np.load(os.path.join(out_dir, INDEX_FILE)) as index:
+            self.shards = np.asarray(index["shards"])
+            self.offsets = np.asarray(index["offsets"])
+            self.lengths = np.asarray(index["lengths"])
+            self.targets = np.asarray(index["targets"])
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __getitem__(self, index: int) -> tuple[QuantumCircuit, int]:
+        with open(shard_path(self.out_dir, int(self.shards[index])), "rb") as file:
+            file.seek(int(self.offsets[index]))
+            payload = file.read(int(self.lengths[index]))
+        # QPY payloads start at position 0 of their own buffer.
+        return qpy.load(io.BytesIO(payload))[0], int(self.targets[index])
+
+
+def _init_worker(
+    dataset: torch.utils.data.Dataset,
+    embedding_cls: type,
+    transform: Optional[Callable],
+    embedding_kwargs: dict,
+):
+    """Stores the encoding settings in a worker process."""
+    _WORKER_STATE.update(
+        dataset=dataset,
+        embedding_cls=embedding_cls,
+        transform=transform,
+        embedding_kwargs=embedding_kwargs,
+    )
+
+
+def _encode_shard(path: str, start: int, stop: int) -> tuple[list, list, list]:
+    """
+    Encodes samples [start, stop) into one QPY file.
+
+    Returns:
+        tuple[list, list, list]: byte offset, byte length and
+        label of every sample.
+    """
+    dataset = _WORKER_STATE["dataset"]
+    transform = _WORKER_STATE["transform"]
+    offsets, lengths, targets = [], [], []
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        for index in range(start, stop):
+            image, label = dataset[index]
+            if transform is not None:
+                image = transform(image)
+            circuit = encode_image(
+                _WORKER_STATE["embedding_cls"],
+                torch.as_tensor(image),
+                **_WORKER_STATE["embedding_kwargs"],
+            )
+            # Every circuit is serialized as a complete QPY payload
+            # of its own, so it can be loaded from its byte range.
+            payload = io.BytesIO()
+            qpy.dump(circuit, payload)
+            offsets.append(file.tell())
+            lengths.append(file.write(payload.getbuffer()))
+            targets.append(int(label))
+    os.replace(temp_path, path)
+    return offsets, lengths, targets
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+def encode_dataset(
+    dataset: torch.utils.data.Dataset,
+    embedding_cls: type,
+    out_dir: str,
+    workers: int = 0,
+    shard_size: int = 1024,
+    transform: Optional[Callable] = None,
+    **embedding_kwargs,
+) -> CircuitStore:
+    """
+    Encodes every image of a dataset and stores the circuits on disk.
+
+    Samples are split into shards of shard_size circuits, which are
+    encoded in a process pool and written as QPY files. An index
+    with the shard and byte range of every sample is written last.
+    If out_dir already holds a complete store for the same images,
+    labels, embedding and settings, it is returned without
+    re-encoding. Otherwise its old shards are removed.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset of (image, label)
+        samples. It must be picklable when workers > 0.
+        embedding_cls (type): embedding class, e.g. FRQI or NEQR.
+        out_dir (str): directory of the circuit store.
+        workers (int): number of worker processes. Defaults to 0,
+        encoding in the main process.
+        shard_size (int): number of circuits per QPY file.
+        Defaults to 1024.
+        transform (Callable, optional): transform applied to every
+        image before encoding, e.g. AngleMapping or Quantization.
+        **embedding_kwargs: further arguments of embedding_cls.
+
+    Returns:
+        CircuitStore: random-access view of the stored circuits.
+    """
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 0:
+        raise ValueError("The input workers must be a non-negative int.")
+    if not isinstance(shard_size, int) or shard_size < 1:
+        raise ValueError("The input shard_size must be a positive int.")
+
+    meta = {
+        "embedding": f"{embedding_cls.__module__}.{embedding_cls.__qualname__}",
+        "embedding_kwargs": embedding_kwargs,
+        "transform": repr(transform),
+        "num_samples": len(dataset),
+        "fingerprint": dataset_fingerprint(dataset),
+        "shard_size": shard_size,
+    }
+    meta_path = os.path.join(out_dir, META_FILE)
+    if os.path.isfile(meta_path):
+        with open(meta_path, encoding="utf-8") as file:
+            if json.load(file) == json.loads(json.dumps(meta, default=str)):
+                return CircuitStore(out_dir)
+        # Settings changed, so the old index no longer applies.
+        os.remove(meta_path)
+
+    os.makedirs(out_dir, exist_ok=True)
+    # Shards of an earlier, larger store would otherwise remain.
+    for path in glob.glob(os.path.join(out_dir, "shard-*.qpy*")):
+        os.remove(path)
+    bounds = [
+        (start, min(start + shard_size, len(dataset)))
+        for start in range(0, len(dataset), shard_size)
+    ]
+    paths = [shard_path(out_dir, shard) for shard in range(len(bounds))]
+    settings = (dataset, embedding_cls, transform, embedding_kwargs)
+
+    if workers == 0:
+        _init_worker(*settings)
+        try:
+            results = [
+                _encode_shard(path, *bound) for path, bound in zip(paths, bounds)
+            ]
+        finally:
+            _WORKER_STATE.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=settings
+        ) as executor:
+            results = list(
+                executor.map(
+                    _encode_shard,
+                    paths,
+                    [start for start, _ in bounds],
+                    [stop for _, stop in bounds],
+                )
+            )
+
+    shards = np.repeat(
+        np.arange(len(bounds), dtype=np.int32),
+        [stop - start for start, stop in bounds],
+    )
+    offsets, lengths, targets = (
+        np.array([value for result in results for value in result[column]], np.int64)
+        for column in range(3)
+    )
+    np.savez(
+        os.path.join(out_dir, INDEX_FILE),
+        shards=shards,
+        offsets=offsets,
+        lengths=lengths,
+        targets=targets,
+    )
+    # The metadata file is written last, so it marks a complete store.
+    with open(meta_path, "w", encoding="utf-8") as file:
+        json.dump(meta, file, default=str)
+    return CircuitStore(out_dir)
@@ -0,0 +1,47 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Collate functions for DataLoaders"""
+
+from __future__ import annotations
+
+import torch.utils.data
+
+from piqture.transforms import MinMaxNormalization
+
+
+# pylint: disable=too-few-public-methods
+class NormalizingCollate:
+    """
+    Collates (image, label) samples into a batch and normalizes
+    every image of the batch in a single vectorized pass.
+
+    Replaces a per-image MinMaxNormalization transform in the
+    dataset with one normalization per batch. The class is
+    picklable, so it can be used with worker processes.
+    """
+
+    def __init__(self, normalization: MinMaxNormalization):
+        if not isinstance(normalization, MinMaxNormalization):
+            raise TypeError(
+                "The input normalization must be of the type MinMaxNormalization."
+            )
+        self.normalization = normalization
+
+    def __call__(self, batch: list):
+        images, labels = torch.utils.data.default_collate(batch)
+        # default_collate stacks into a new tensor, so it is safe to
+        # normalize in place.
+        if not torch.is_floating_point(images):
+            images = images.float()
+        return self.normalization.normalize_batch(images, inplace=True), labels
+
+    def __repr__(self):
+        return f"NormalizingCollate({self.normalization!r})"
@@ -0,0 +1,209 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming statistics of image datasets"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import torch
+import torch.utils.data
+
+from piqture.data_loader.preprocessed_cache import cache_key
+
+
+# pylint: disable=too-many-instance-attributes
+class DatasetStatistics:
+    """
+    Global statistics of the images in a dataset.
+
+    Attributes:
+        count (int): number of pixel values seen.
+        min (float): smallest pixel value.
+        max (float): largest pixel value.
+        mean (float): mean pixel value.
+        std (float): population standard deviation of pixel values.
+        histogram (np.ndarray): per-pixel histograms of shape
+        (*image_shape, bins).
+        bin_edges (np.ndarray): bins + 1 edges shared by all histograms.
+    """
+
+    def __init__(self, image_shape: tuple, bins: int, value_range: tuple):
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.histogram = np.zeros((*image_shape, bins), dtype=np.int64)
+        self.bin_edges = np.linspace(*value_range, bins + 1)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of pixel values."""
+        return float(np.sqrt(self._m2 / self.count)) if self.count else 0.0
+
+    def update(self, images: torch.Tensor):
+        """
+        Adds a chunk of images of shape (N, *image_shape).
+
+        Values outside the histogram range are counted
+        in the first or last bin.
+        """
+        images = torch.as_tensor(images).to(torch.float64)
+        if images.shape[1:] != self.histogram.shape[:-1]:
+            raise ValueError(
+                f"Image shape {tuple(images.shape[1:])} does not match "
+                f"{self.histogram.shape[:-1]}."
+            )
+        if images.numel() == 0:
+            return
+
+        chunk_min, chunk_max = torch.aminmax(images)
+        self.min = min(self.min, chunk_min.item())
+        self.max = max(self.max, chunk_max.item())
+
+        # Merge the chunk mean and sum of squared deviations
+        # (Chan et al.), which stays accurate over many chunks.
+        chunk_count = images.numel()
+        chunk_mean = images.mean().item()
+        chunk_m2 = ((images - chunk_mean) ** 2).sum().item()
+        delta = chunk_mean - self.mean
+        total = self.count + chunk_count
+        self.mean += delta * chunk_count / total
+        self._m2 += chunk_m2 + delta**2 * self.count * chunk_count / total
+        self.count = total
+        self._update_histogram(images)
+
+    def _update_histogram(self, images: torch.Tensor):
+        """Counts every (pixel, bin) pair with a single bincount."""
+        bins = self.histogram.shape[-1]
+        low, high = self.bin_edges[0], self.bin_edges[-1]
+        bin_index = ((images - low) * (bins / (high - low))).long().clamp_(0, bins - 1)
+        pixels = bin_index.reshape(len(images), -1)
+        flat_index = pixels + torch.arange(pixels.shape[1]) * bins
+        counts = torch.bincount(
+            flat_index.reshape(-1), minlength=pixels.shape[1] * bins
+        )
+        self.histogram += counts.numpy().reshape(self.histogram.shape)
+
+    def save(self, path: str):
+        """Saves the statistics to a .npz file."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(
+                file,
+                scalars=np.array(
+                    [self.count, self.min, self.max, self.mean, self._m2],
+                    dtype=np.float64,
+                ),
+                histogram=self.histogram,
+                bin_edges=self.bin_edges,
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> DatasetStatistics:
+        """Loads statistics saved with DatasetStatistics.save."""
+        with np.load(path) as arrays:
+            scalars, histogram, bin_edges = (
+                np.asarray(arrays[key]) for key in ("scalars", "histogram", "bin_edges")
+            )
+        statistics = cls(
+            histogram.shape[:-1], histogram.shape[-1], (bin_edges[0], bin_edges[-1])
+        )
+        count, statistics.min, statistics.max, statistics.mean, statistics._m2 = (
+            scalars.tolist()
+        )
+        statistics.count = int(count)
+        statistics.histogram = histogram
+        statistics.bin_edges = bin_edges
+        return statistics
+
+    def __repr__(self):
+        return (
+            f"DatasetStatistics(count={self.count}, min={self.min}, max={self.max}, "
+            f"mean={self.mean}, std={self.std})"
+        )
+
+
+def compute_statistics(
+    dataset: torch.utils.data.Dataset,
+    bins: int = 256,
+    value_range: tuple[float, float] = (0.0, 1.0),
+    chunk_size: int = 1024,
+) -> DatasetStatistics:
+    """
+    Computes dataset statistics in one streaming pass.
+
+    Images are read in chunks of chunk_size samples, so memory
+    use does not grow with the size of the dataset.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset of (image, label)
+        samples with equally shaped images.
+        bins (int): number of histogram bins. Defaults to 256.
+        value_range (tuple[float, float]): range covered by the
+        histograms. Defaults to (0.0, 1.0), the range of ToTensor.
+        chunk_size (int): number of images per chunk. Defaults to 1024.
+
+    Returns:
+        DatasetStatistics: statistics of all images in the dataset.
+    """
+    if not isinstance(bins, int) or bins < 1:
+        raise ValueError("The input bins must be a positive int.")
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("The input chunk_size must be a positive int.")
+    if value_range[1] <= value_range[0]:
+        raise ValueError("The input value_range must be an increasing pair.")
+    if len(dataset) == 0:
+        raise ValueError("Cannot compute statistics of an empty dataset.")
+
+    image_shape = tuple(np.shape(dataset[0][0]))
+    statistics = DatasetStatistics(image_shape, bins, value_range)
+    chunks = torch.utils.data.DataLoader(dataset, batch_size=chunk_size)
+    for images, _ in chunks:
+        statistics.update(images)
+    return statistics
+
+
+def load_or_compute_statistics(
+    dataset: torch.utils.data.Dataset,
+    cache_dir: str,
+    name: str,
+    params: dict,
+    **kwargs,
+) -> DatasetStatistics:
+    """
+    Loads dataset statistics from the cache, or computes and
+    caches them when no entry matches the parameters.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset to describe.
+        cache_dir (str): directory holding cache entries.
+        name (str): name of the dataset split, e.g. "mnist-train".
+        params (dict): JSON-serializable parameters that identify
+        the dataset and its transforms.
+        **kwargs: keyword arguments of compute_statistics.
+
+    Returns:
+        DatasetStatistics: statistics of all images in the dataset.
+    """
+    path = os.path.join(
+        cache_dir, f"{name}-{cache_key({'statistics': kwargs, **params})}.stats.npz"
+    )
+    if os.path.isfile(path):
+        return DatasetStatistics.load(path)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    statistics = compute_statistics(dataset, **kwargs)
+    statistics.save(path)
+    return statistics
@@ -0,0 +1,130 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Memory-mapped datasets for local IDX files"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+from piqture.data_loader.array_dataset import ImageArrayDataset
+
+# IDX type codes and their (big-endian) NumPy data types.
+IDX_DTYPES = {
+    0x08: np.dtype(np.uint8),
+    0x09: np.dtype(np.int8),
+    0x0B: np.dtype(">i2"),
+    0x0C: np.dtype(">i4"),
+    0x0D: np.dtype(">f4"),
+    0x0E: np.dtype(">f8"),
+}
+
+MNIST_FILES = {
+    True: ("train-images-idx3-ubyte", "train-labels-idx1-ubyte"),
+    False: ("t10k-images-idx3-ubyte", "t10k-labels-idx1-ubyte"),
+}
+
+
+def read_idx(path: str) -> np.memmap:
+    """
+    Memory-maps an uncompressed IDX file.
+
+    Args:
+        path (str): path to the IDX file.
+
+    Returns:
+        np.memmap: read-only array with the shape and data
+        type stored in the IDX header.
+    """
+    with open(path, "rb") as file:
+        header = file.read(4)
+        if len(header) != 4 or header[0] != 0 or header[1] != 0:
+            raise ValueError(f"{path} is not an uncompressed IDX file.")
+        if header[2] not in IDX_DTYPES:
+            raise ValueError(f"Unsupported IDX data type {header[2]:#04x} in {path}.")
+        ndim = header[3]
+        shape = tuple(int(dim) for dim in np.frombuffer(file.read(4 * ndim), ">u4"))
+
+    return np.memmap(
+        path, dtype=IDX_DTYPES[header[2]], mode="r", offset=4 + 4 * ndim, shape=shape
+    )
+
+
+def find_idx_file(root: str, filename: str, dataset_dir: str = "MNIST") -> str:
+    """
+    Finds an IDX file in root, or in the root/<dataset_dir>/raw
+    directory used by torchvision downloads.
+    """
+    for directory in (root, os.path.join(root, dataset_dir, "raw")):
+        path = os.path.join(directory, filename)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"{filename} not found in {root}.")
+
+
+class IDXDataset(ImageArrayDataset):
+    """
+    MNIST-style dataset served from memory-mapped local IDX files.
+
+    Images and labels are never decoded up front. Samples and
+    batches are views of the mapped files, so startup is instant
+    and worker processes share the operating system page cache.
+    """
+
+    def __init__(
+        self,
+        images_path: str,
+        labels_path: str,
+        transform: Optional[Callable] = None,
+    ):
+        self.images_path = images_path
+        self.labels_path = labels_path
+        super().__init__(read_idx(images_path), read_idx(labels_path), transform)
+
+    @classmethod
+    def mnist(
+        cls, root: str, train: bool = True, transform: Optional[Callable] = None
+    ) -> IDXDataset:
+        """
+        Opens the MNIST training or test split from a local directory.
+
+        Args:
+            root (str): directory holding the uncompressed MNIST
+            IDX files, directly or under MNIST/raw.
+            train (bool): opens the training split if True, else
+            the test split.
+            transform (Callable, optional): transform applied to
+            every image.
+        """
+        images_file, labels_file = MNIST_FILES[train]
+        return cls(
+            find_idx_file(root, images_file),
+            find_idx_file(root, labels_file),
+            transform=transform,
+        )
+
+    def _open(self):
+        """Memory-maps the image and label files."""
+        self.data = read_idx(self.images_path)
+        self.targets = read_idx(self.labels_path)
+
+    def __getstate__(self):
+        # Pickle file paths instead of the mapped arrays, so that
+        # spawned workers re-map the files rather than copy them.
+        state = self.__dict__.copy()
+        del state["data"], state["targets"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
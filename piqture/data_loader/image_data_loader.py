@@ -0,0 +1,291 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Shared loading path for image datasets"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Optional, Union
+
+import torch.utils.data
+import torchvision
+
+from piqture.data_loader.batch_resize import resize_dataset
+from piqture.data_loader.collate import NormalizingCollate
+from piqture.data_loader.dataset_statistics import (
+    compute_statistics,
+    load_or_compute_statistics,
+)
+from piqture.data_loader.label_index import filter_labels
+from piqture.data_loader.preprocessed_cache import load_or_preprocess
+from piqture.data_loader.sharding import ShardSampler, shard_indices, validate_shard
+from piqture.transforms import GlobalMinMaxNormalization, MinMaxNormalization
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+def load_image_dataset(
+    make_datasets: Callable[[Callable], tuple],
+    name: str,
+    root: str,
+    img_size: Optional[Union[int, tuple[int, int]]] = None,
+    batch_size: int = None,
+    labels: list = None,
+    normalize_min: float = None,
+    normalize_max: float = None,
+    eval_batch_size: int = None,
+    drop_last: bool = False,
+    num_workers: int = 0,
+    pin_memory: bool = False,
+    persistent_workers: bool = False,
+    prefetch_factor: int = None,
+    cache_dir: str = None,
+    normalize_global: bool = False,
+    num_shards: int = 1,
+    shard_index: int = 0,
+    shuffle: bool = False,
+    seed: int = 0,
+    batch_resize: bool = False,
+):
+    """
+    Loads the training and test splits of an image dataset.
+
+    This is the loading path shared by load_mnist_dataset and
+    load_local_dataset, which document the options in detail.
+
+    Args:
+        make_datasets (Callable): function that takes a per-sample
+        transform and returns the (training, test) datasets. Both
+        must keep that transform, which may be extended with a
+        normalization later, and have a targets attribute when
+        labels are given.
+        name (str): name of the dataset, used in cache entries.
+        root (str): directory of the dataset, used in cache entries.
+
+    Returns:
+        Train and Test DataLoader objects if batch_size or labels
+        are given, else the training and test datasets.
+    """
+    _validate_inputs(img_size, batch_size, eval_batch_size, labels)
+    validate_shard(num_shards, shard_index)
+
+    loader_options = _dataloader_options(
+        num_workers, pin_memory, persistent_workers, prefetch_factor
+    )
+
+    normalization = (
+        MinMaxNormalization(normalize_min, normalize_max)
+        if normalize_min is not None and normalize_max is not None
+        else None
+    )
+
+    dataset_params = {
+        "dataset": name,
+        "root": os.path.abspath(root),
+        "img_size": img_size,
+        "labels": sorted(labels) if labels else None,
+        "batch_resize": batch_resize,
+    }
+
+    # The datasets are built once. Normalization is appended to
+    # their shared transform once its bounds are known.
+    transform = array_transform() if batch_resize else image_transform(img_size)
+    train_dataset, test_dataset = make_datasets(None if batch_resize else transform)
+    if labels:
+        # Keep only samples with the desired labels.
+        train_dataset = filter_labels(train_dataset, labels)
+        test_dataset = filter_labels(test_dataset, labels)
+    if batch_resize:
+        # Resize the stacked images of both splits at once,
+        # only those with the desired labels.
+        train_dataset, test_dataset = (
+            resize_dataset(dataset, img_size, transform)
+            for dataset in (train_dataset, test_dataset)
+        )
+
+    if normalize_global and normalization is not None:
+        # Scale every image with the bounds of the whole training set.
+        statistics = (
+            compute_statistics(train_dataset)
+            if cache_dir is None
+            else load_or_compute_statistics(
+                train_dataset, cache_dir, f"{name}-train", dataset_params
+            )
+        )
+        normalization = GlobalMinMaxNormalization.from_statistics(
+            statistics, normalize_min, normalize_max
+        )
+
+    # DataLoaders over uncached images normalize once per batch.
+    # Cached images are normalized once, while being preprocessed.
+    batch_normalization = bool(labels or batch_size) and cache_dir is None
+    if normalization is not None:
+        if batch_normalization:
+            loader_options["collate_fn"] = NormalizingCollate(normalization)
+        else:
+            transform.transforms.append(normalization)
+
+    if cache_dir is not None:
+        cache_params = {
+            **dataset_params,
+            "normalize": (
+                [normalize_min, normalize_max] if normalization is not None else None
+            ),
+            "normalize_global": normalize_global,
+        }
+        train_dataset = load_or_preprocess(
+            train_dataset, cache_dir, f"{name}-train", cache_params
+        )
+        test_dataset = load_or_preprocess(
+            test_dataset, cache_dir, f"{name}-test", cache_params
+        )
+
+    if labels or batch_size:
+        train_dataloader = torch.utils.data.DataLoader(
+            dataset=train_dataset,
+            batch_size=batch_size if batch_size is not None else 1,
+            sampler=ShardSampler(
+                train_dataset, num_shards, shard_index, shuffle=shuffle, seed=seed
+            ),
+            drop_last=drop_last,
+            **loader_options,
+        )
+
+        # The evaluation loader streams fixed-size batches and
+        # never drops samples, so every test image is evaluated.
+        test_dataloader = torch.utils.data.DataLoader(
+            dataset=test_dataset,
+            batch_size=(
+                eval_batch_size
+                if eval_batch_size is not None
+                else batch_size if batch_size is not None else 1
+            ),
+            sampler=ShardSampler(test_dataset, num_shards, shard_index),
+            **loader_options,
+        )
+
+        return train_dataloader, test_dataloader
+
+    if num_shards > 1 or shuffle:
+        train_dataset = torch.utils.data.Subset(
+            train_dataset,
+            shard_indices(
+                len(train_dataset),
+                num_shards,
+                shard_index,
+                seed=seed if shuffle else None,
+            ).tolist(),
+        )
+        test_dataset = torch.utils.data.Subset(
+            test_dataset,
+            shard_indices(len(test_dataset), num_shards, shard_index).tolist(),
+        )
+
+    return train_dataset, test_dataset
+
+
+def _validate_inputs(
+    img_size: Optional[Union[int, tuple[int, int]]],
+    batch_size: int,
+    eval_batch_size: int,
+    labels: list,
+):
+    """Validates the img_size, batch size and labels inputs."""
+    # Check if img_size is int or tuple.
+    # Also check if tuple entries are int.
+    if img_size is not None and not isinstance(img_size, (int, tuple)):
+        raise TypeError(
+            "the input img_size must be of the type int or tuple[int, int]."
+        )
+
+    if isinstance(img_size, tuple) and not all(
+        isinstance(size, int) for size in img_size
+    ):
+        raise TypeError("the input img_size must be of the type tuple[int, int].")
+
+    # Check if batch_size is an int.
+    if batch_size:
+        if not isinstance(batch_size, int):
+            raise TypeError("The input batch_size must be of the type int.")
+
+    # Check if eval_batch_size is a positive int.
+    if eval_batch_size is not None:
+        if not isinstance(eval_batch_size, int) or isinstance(eval_batch_size, bool):
+            raise TypeError("The input eval_batch_size must be of the type int.")
+        if eval_batch_size < 1:
+            raise ValueError("The input eval_batch_size must be positive.")
+
+    # Check if labels are a list.
+    if labels:
+        if not isinstance(labels, list):
+            raise TypeError("The input labels must be of the type list.")
+
+
+def image_transform(
+    img_size: Optional[Union[int, tuple[int, int]]] = None,
+    normalization: MinMaxNormalization = None,
+) -> torchvision.transforms.Compose:
+    """
+    Returns the per-sample transforms for uint8 images: conversion
+    to a float tensor in [0, 1], resizing to img_size unless it is
+    None, and normalization if given.
+    """
+    transforms = [torchvision.transforms.ToTensor()]
+    if img_size is not None:
+        transforms.append(torchvision.transforms.Resize(img_size))
+    if normalization is not None:
+        transforms.append(normalization)
+    return torchvision.transforms.Compose(transforms)
+
+
+def array_transform(
+    normalization: MinMaxNormalization = None,
+) -> torchvision.transforms.Compose:
+    """
+    Returns the per-sample transforms for batch-resized float32
+    images: conversion to a tensor and normalization if given.
+    """
+    transforms = [torch.from_numpy]
+    if normalization is not None:
+        transforms.append(normalization)
+    return torchvision.transforms.Compose(transforms)
+
+
+def _dataloader_options(
+    num_workers: int,
+    pin_memory: bool,
+    persistent_workers: bool,
+    prefetch_factor: int,
+) -> dict:
+    """
+    Validates worker options and returns them as
+    DataLoader keyword arguments.
+    """
+    # Check if num_workers is a non-negative int.
+    if not isinstance(num_workers, int) or isinstance(num_workers, bool):
+        raise TypeError("The input num_workers must be of the type int.")
+    if num_workers < 0:
+        raise ValueError("The input num_workers must be non-negative.")
+
+    if num_workers == 0:
+        if persistent_workers or prefetch_factor is not None:
+            raise ValueError(
+                "persistent_workers and prefetch_factor require num_workers > 0."
+            )
+        return {"num_workers": 0, "pin_memory": pin_memory}
+
+    # Datasets, transforms and collate functions are
+    # picklable, so they can be sent to worker processes.
+    return {
+        "num_workers": num_workers,
+        "pin_memory": pin_memory,
+        "persistent_workers": persistent_workers,
+        "prefetch_factor": prefetch_factor,
+    }
@@ -0,0 +1,60 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Label-indexed views of datasets"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch.utils.data
+
+
+def label_indices(targets) -> dict[int, np.ndarray]:
+    """
+    Builds the sample indices of every label in one
+    vectorized pass over the labels.
+
+    Args:
+        targets: labels of a dataset, as a sequence, NumPy
+        array or tensor.
+
+    Returns:
+        dict[int, np.ndarray]: ascending sample indices for
+        every label present in targets.
+    """
+    targets = np.asarray(targets)
+    order = np.argsort(targets, kind="stable")
+    classes, starts = np.unique(targets[order], return_index=True)
+    return dict(zip(classes.tolist(), np.split(order, starts[1:])))
+
+
+def filter_labels(
+    dataset: torch.utils.data.Dataset, labels: list
+) -> torch.utils.data.Subset:
+    """
+    Restricts a dataset to samples with the desired labels.
+
+    The indices are computed once from dataset.targets, so
+    unwanted samples are never loaded.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset with a
+        targets attribute.
+        labels (list): list of desired labels.
+
+    Returns:
+        torch.utils.data.Subset: subset of the dataset with
+        the desired labels, in the original sample order.
+    """
+    index = label_indices(dataset.targets)
+    indices = np.concatenate(
+        [index.get(label, np.empty(0, dtype=np.int64)) for label in labels]
+    )
+    return torch.utils.data.Subset(dataset, np.sort(indices).tolist())
@@ -0,0 +1,248 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Offline loaders for local image datasets"""
+
+from __future__ import annotations
+
+import functools
+import os
+import pickle
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from piqture.data_loader.array_dataset import ImageArrayDataset
+from piqture.data_loader.idx_dataset import MNIST_FILES, IDXDataset, find_idx_file
+from piqture.data_loader.image_data_loader import load_image_dataset
+from piqture.data_loader.synthetic import synthetic_dataset
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff")
+
+# Dataset name -> reader(root, train, transform) returning a dataset.
+DATASET_READERS = {}
+
+
+def register_dataset(name: str) -> Callable:
+    """
+    Registers a dataset reader under a name, for load_local_dataset.
+
+    The reader is called as reader(root, train, transform) and
+    returns a dataset of (image, label) samples with a targets
+    attribute.
+    """
+
+    def decorator(reader: Callable) -> Callable:
+        DATASET_READERS[name] = reader
+        return reader
+
+    return decorator
+
+
+@register_dataset("mnist")
+def read_mnist(root: str, train: bool, transform: Optional[Callable] = None):
+    """Memory-maps the MNIST IDX files in root (or root/MNIST/raw)."""
+    return IDXDataset.mnist(root, train=train, transform=transform)
+
+
+@register_dataset("fashion_mnist")
+def read_fashion_mnist(root: str, train: bool, transform: Optional[Callable] = None):
+    """
+    Memory-maps the Fashion-MNIST IDX files in root
+    (or root/FashionMNIST/raw).
+    """
+    images_file, labels_file = MNIST_FILES[train]
+    return IDXDataset(
+        find_idx_file(root, images_file, "FashionMNIST"),
+        find_idx_file(root, labels_file, "FashionMNIST"),
+        transform=transform,
+    )
+
+
+def _find_directory(root: str, name: str) -> str:
+    """Returns root/name if it exists, else root."""
+    path = os.path.join(root, name)
+    return path if os.path.isdir(path) else root
+
+
+def _read_pickle(path: str) -> dict:
+    """Reads one CIFAR batch file."""
+    with open(path, "rb") as file:
+        return pickle.load(file, encoding="bytes")
+
+
+def _read_cifar(
+    directory: str, files: list[str], label_key: bytes, transform: Optional[Callable]
+) -> ImageArrayDataset:
+    """Reads CIFAR batch files into one preallocated uint8 array."""
+    batches = [_read_pickle(os.path.join(directory, file)) for file in files]
+    num_samples = sum(len(batch[label_key]) for batch in batches)
+    data = np.empty((num_samples, 32, 32, 3), dtype=np.uint8)
+    targets = np.empty(num_samples, dtype=np.int64)
+
+    start = 0
+    for batch in batches:
+        stop = start + len(batch[label_key])
+        # Rows are stored channel-first, images are served as HWC.
+        data[start:stop] = (
+            np.asarray(batch[b"data"], dtype=np.uint8)
+            .reshape(-1, 3, 32, 32)
+            .transpose(0, 2, 3, 1)
+        )
+        targets[start:stop] = batch[label_key]
+        start = stop
+    return ImageArrayDataset(data, targets, transform=transform)
+
+
+@register_dataset("cifar10")
+def read_cifar10(root: str, train: bool, transform: Optional[Callable] = None):
+    """Reads the CIFAR-10 python batches in root (or root/cifar-10-batches-py)."""
+    files = (
+        [f"data_batch_{batch}" for batch in range(1, 6)] if train else ["test_batch"]
+    )
+    return _read_cifar(
+        _find_directory(root, "cifar-10-batches-py"), files, b"labels", transform
+    )
+
+
+@register_dataset("cifar100")
+def read_cifar100(root: str, train: bool, transform: Optional[Callable] = None):
+    """
+    Reads the CIFAR-100 python files in root (or root/cifar-100-python)
+    with the fine labels.
+    """
+    return _read_cifar(
+        _find_directory(root, "cifar-100-python"),
+        ["train" if train else "test"],
+        b"fine_labels",
+        transform,
+    )
+
+
+@register_dataset("synthetic")
+def read_synthetic(root: str, train: bool, transform: Optional[Callable] = None):
+    """
+    Generates MNIST-sized synthetic splits of 60000 training and
+    10000 test images with synthetic_dataset. root is not read.
+    """
+    # pylint: disable=unused-argument
+    return synthetic_dataset(
+        60000 if train else 10000, transform=transform, seed=0 if train else 1
+    )
+
+
+def _list_images(split_dir: str) -> tuple[list, list]:
+    """
+    Returns the sorted class names in split_dir and the
+    (path, label) pairs of their image files.
+    """
+    if not os.path.isdir(split_dir):
+        raise FileNotFoundError(f"{split_dir} not found.")
+
+    classes = sorted(entry.name for entry in os.scandir(split_dir) if entry.is_dir())
+    samples = [
+        (os.path.join(split_dir, name, file), label)
+        for label, name in enumerate(classes)
+        for file in sorted(os.listdir(os.path.join(split_dir, name)))
+        if file.lower().endswith(IMAGE_EXTENSIONS)
+    ]
+    if not samples:
+        raise FileNotFoundError(f"No images found in {split_dir}.")
+    return classes, samples
+
+
+@register_dataset("image_folder")
+def read_image_folder(root: str, train: bool, transform: Optional[Callable] = None):
+    """
+    Reads a folder of equally sized images laid out as
+    root/{train,test}/<class name>/<image file>.
+
+    Classes are sorted by name and labelled 0, 1, ... All images
+    are converted to the mode of the first image and decoded once
+    into a preallocated uint8 array.
+    """
+    # pylint: disable=import-outside-toplevel
+    from PIL import Image
+
+    classes, samples = _list_images(os.path.join(root, "train" if train else "test"))
+
+    with Image.open(samples[0][0]) as first_image:
+        mode = "L" if first_image.mode in ("1", "L", "I;16") else "RGB"
+        shape = np.asarray(first_image.convert(mode)).shape
+
+    data = np.empty((len(samples), *shape), dtype=np.uint8)
+    targets = np.array([label for _, label in samples], dtype=np.int64)
+    for index, (path, _) in enumerate(samples):
+        with Image.open(path) as image:
+            array = np.asarray(image.convert(mode))
+        if array.shape != shape:
+            raise ValueError(
+                f"All images must have the shape {shape}, but {path} "
+                f"has the shape {array.shape}."
+            )
+        data[index] = array
+    return ImageArrayDataset(data, targets, transform=transform, classes=classes)
+
+
+def _local_datasets(reader: Callable, root: str, transform: Callable) -> tuple:
+    """Returns the training and test splits of a registered dataset."""
+    return reader(root, True, transform), reader(root, False, transform)
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def load_local_dataset(
+    name: str,
+    root: str,
+    img_size: Optional[Union[int, tuple[int, int]]] = None,
+    batch_size: int = None,
+    labels: list = None,
+    normalize_min: float = None,
+    normalize_max: float = None,
+    **kwargs,
+):
+    """
+    Loads a local image dataset without network access.
+
+    Args:
+        name (str): name of a registered dataset, e.g. "mnist",
+        "fashion_mnist", "cifar10", "cifar100", "image_folder" or
+        "synthetic".
+        root (str): directory holding the dataset files.
+        img_size (int or tuple[int, int], optional): Size to which images
+        will be resized. Defaults to None, keeping the stored size.
+        batch_size (int, optional): Batch size for the dataset.
+        labels (list): List of desired labels.
+        normalize_min (float, optional): Minimum value for normalization.
+        normalize_max (float, optional): Maximum value for normalization.
+        **kwargs: further options of load_mnist_dataset, e.g.
+        num_workers, cache_dir, normalize_global or num_shards.
+
+    Returns:
+        Train and Test DataLoader objects if batch_size or labels
+        are given, else the training and test datasets.
+    """
+    # pylint: disable=duplicate-code
+    if name not in DATASET_READERS:
+        raise ValueError(
+            f"Unknown dataset {name}. "
+            f"Registered datasets: {', '.join(sorted(DATASET_READERS))}."
+        )
+
+    return load_image_dataset(
+        functools.partial(_local_datasets, DATASET_READERS[name], root),
+        name,
+        root,
+        img_size=img_size,
+        batch_size=batch_size,
+        labels=labels,
+        normalize_min=normalize_min,
+        normalize_max=normalize_max,
+        **kwargs,
+    )
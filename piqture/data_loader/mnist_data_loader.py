@@ -12,22 +12,39 @@
 
 from __future__ import annotations
 
-from functools import partial
+import functools
 from typing import Union
 
 import torch.utils.data
 import torchvision
 from torchvision import datasets
 
-from piqture.transforms import MinMaxNormalization
+from piqture.data_loader.idx_dataset import IDXDataset
+from piqture.data_loader.image_data_loader import load_image_dataset
 
 
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
 def load_mnist_dataset(
     img_size: Union[int, tuple[int, int]] = 28,
     batch_size: int = None,
     labels: list = None,
     normalize_min: float = None,
     normalize_max: float = None,
+    root: str = "data/mnist_data",
+    download: bool = True,
+    num_workers: int = 0,
+    pin_memory: bool = False,
+    persistent_workers: bool = False,
+    prefetch_factor: int = None,
+    cache_dir: str = None,
+    normalize_global: bool = False,
+    num_shards: int = 1,
+    shard_index: int = 0,
+    shuffle: bool = False,
+    seed: int = 0,
+    eval_batch_size: int = None,
+    drop_last: bool = False,
+    batch_resize: bool = False,
 ):
     """
     Loads MNIST dataset from PyTorch using DataLoader.
@@ -41,95 +58,108 @@ def load_mnist_dataset(
         labels (list): List of desired labels.
         normalize_min (float, optional): Minimum value for normalization.
         normalize_max (float, optional): Maximum value for normalization.
+            Images are normalized only if both are given. When DataLoaders
+            are returned, whole batches are normalized per sample in the
+            collate step instead of image by image.
+        root (str, optional): Directory where the dataset is stored.
+            Defaults to "data/mnist_data".
+        download (bool, optional): Downloads the dataset with torchvision
+            if True. If False, memory-maps the uncompressed MNIST IDX
+            files found in root (or root/MNIST/raw) without any network
+            access. Defaults to True.
+        num_workers (int, optional): Number of worker processes that
+            load, resize and normalize images in parallel with training.
+            Defaults to 0, loading in the main process.
+        pin_memory (bool, optional): Copies batches into page-locked
+            memory for faster transfers to a GPU. Defaults to False.
+        persistent_workers (bool, optional): Keeps worker processes
+            alive between epochs. Requires num_workers > 0.
+            Defaults to False.
+        prefetch_factor (int, optional): Number of batches loaded in
+            advance by each worker. Requires num_workers > 0.
+            Defaults to None, the PyTorch default of 2.
+        cache_dir (str, optional): Directory for an on-disk cache of the
+            resized and normalized images. The first run preprocesses
+            every image once and stores the arrays as .npy files keyed
+            by the dataset location, img_size, normalization range and
+            labels. Later runs with the same parameters memory-map them
+            instead. Defaults to None, preprocessing every epoch.
+        normalize_global (bool, optional): Normalizes all images with the
+            minimum and maximum of the whole training set, computed in one
+            streaming pass (and cached in cache_dir), instead of per image.
+            This preserves the contrast between images. Defaults to False.
+        num_shards (int, optional): Number of shards the (label-filtered)
+            samples are split into, e.g. one per node. Defaults to 1.
+        shard_index (int, optional): Index of the shard to load, in
+            [0, num_shards). Shards are disjoint and computed without
+            coordination. Defaults to 0.
+        shuffle (bool, optional): Reshuffles the training samples every
+            epoch with a permutation seeded by (seed, epoch). Call
+            train_loader.sampler.set_epoch(epoch) to advance the epoch.
+            Defaults to False.
+        seed (int, optional): Seed of the shuffle, shared by all
+            shards. Defaults to 0.
+        eval_batch_size (int, optional): Batch size of the test
+            DataLoader, which streams the test set in batches of this
+            size and never drops samples. Defaults to batch_size.
+        drop_last (bool, optional): Drops the last incomplete batch
+            of the training DataLoader. Defaults to False.
+        batch_resize (bool, optional): Resizes the stacked uint8 images
+            of each split once, in a few vectorized operations, instead
+            of calling Resize on every image every epoch. Integer
+            downscales, e.g. 28 to 4 or 7, average blocks of pixels
+            (area pooling). Other sizes use antialiased bilinear
+            interpolation like Resize. Defaults to False.
 
     Returns:
         Train and Test DataLoader objects.
     """
-    # Check if img_size is int or tuple.
-    # Also check if tuple entries are int.
-    if not isinstance(img_size, (int, tuple)):
-        raise TypeError(
-            "the input img_size must be of the type int or tuple[int, int]."
-        )
-
-    if isinstance(img_size, tuple) and not all(
-        isinstance(size, int) for size in img_size
-    ):
-        raise TypeError("the input img_size must be of the type tuple[int, int].")
-
-    # Check if batch_size is an int.
-    if batch_size:
-        if not isinstance(batch_size, int):
-            raise TypeError("The input batch_size must be of the type int.")
-
-    # Check if labels are a list.
-    if labels:
-        if not isinstance(labels, list):
-            raise TypeError("The input labels must be of the type list.")
-
-    if normalize_max and normalize_min:
-        # Define a custom mnist transforms.
-        mnist_transform = torchvision.transforms.Compose(
-            [
-                torchvision.transforms.ToTensor(),
-                torchvision.transforms.Resize(img_size),
-                MinMaxNormalization(normalize_min, normalize_max),
-            ]
-        )
-    else:
-        # When normalization is not requested; when normalize_min and max are None.
-        mnist_transform = torchvision.transforms.Compose(
-            [
-                torchvision.transforms.ToTensor(),
-                torchvision.transforms.Resize(img_size),
-            ]
-        )
-
-    # Partial application of custom collate function that calls
-    # collate_fn with args.
-    new_batch = []
-    custom_collate = partial(collate_fn, labels=labels, new_batch=new_batch)
-
-    # Download dataset.
-    mnist_train = datasets.MNIST(
-        root="data/mnist_data",
-        train=True,
-        download=True,
-        transform=mnist_transform,
+    return load_image_dataset(
+        functools.partial(_mnist_datasets, root, download),
+        "mnist",
+        root,
+        img_size=img_size,
+        batch_size=batch_size,
+        labels=labels,
+        normalize_min=normalize_min,
+        normalize_max=normalize_max,
+        eval_batch_size=eval_batch_size,
+        drop_last=drop_last,
+        num_workers=num_workers,
+        pin_memory=pin_memory,
+        persistent_workers=persistent_workers,
+        prefetch_factor=prefetch_factor,
+        cache_dir=cache_dir,
+        normalize_global=normalize_global,
+        num_shards=num_shards,
+        shard_index=shard_index,
+        shuffle=shuffle,
+        seed=seed,
+        batch_resize=batch_resize,
     )
 
-    mnist_test = datasets.MNIST(
-        root="data/mnist_data", train=False, download=True, transform=mnist_transform
-    )
 
-    if labels or batch_size:
-        train_dataloader = torch.utils.data.DataLoader(
-            dataset=mnist_train,
-            batch_size=batch_size if batch_size is not None else 1,
-            shuffle=False,
-            collate_fn=custom_collate,
+def _mnist_datasets(
+    root: str,
+    download: bool,
+    transform: torchvision.transforms.Compose,
+) -> tuple[torch.utils.data.Dataset, torch.utils.data.Dataset]:
+    """Returns the MNIST training and test datasets."""
+    if download:
+        # Download dataset.
+        mnist_train = datasets.MNIST(
+            root=root,
+            train=True,
+            download=True,
+            transform=transform,
         )
 
-        test_dataloader = torch.utils.data.DataLoader(
-            dataset=mnist_test,
-            batch_size=70000 - batch_size if batch_size is not None else 1,
-            shuffle=False,
-            collate_fn=custom_collate,
+        mnist_test = datasets.MNIST(
+            root=root, train=False, download=True, transform=transform
         )
-
-        return train_dataloader, test_dataloader
+    else:
+        # Memory-map local IDX files.
+        mnist_train = IDXDataset.mnist(root, train=True, transform=transform)
+        mnist_test = IDXDataset.mnist(root, train=False, transform=transform)
 
     return mnist_train, mnist_test
-
-
-def collate_fn(batch, labels: list, new_batch: list):
-    """
-    Batches the images wrt the provided labels.
-    """
-    for img, label in batch:
-        if label in labels:
-            new_batch.append((img, label))
-    # If new batch is empty return empty list.
-    if len(new_batch) > 0:
-        return torch.utils.data.default_collate(new_batch)
-    return []
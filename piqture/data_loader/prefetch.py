@@ -0,0 +1,94 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Background prefetching of batches"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator
+
+# Markers of the end of the iterable and of an error in the
+# background thread.
+_END = object()
+_ERROR = object()
+
+
+# pylint: disable=too-few-public-methods
+class Prefetcher:
+    """
+    Iterates an iterable in a background thread, keeping up to
+    num_batches items ready in a bounded queue.
+
+    While the consumer evaluates one batch, e.g. runs its circuits
+    on a simulator, the next batches are encoded in the background.
+    The queue bound keeps memory constant. Encoding overlaps with
+    consumers that release the GIL, such as compiled simulators.
+
+    Errors raised by the iterable, including KeyboardInterrupt, are
+    re-raised in the consumer.
+    Leaving the loop early stops the background thread.
+    """
+
+    def __init__(self, iterable: Iterable, num_batches: int = 2):
+        if not isinstance(num_batches, int) or isinstance(num_batches, bool):
+            raise TypeError("The input num_batches must be of the type int.")
+        if num_batches < 1:
+            raise ValueError("The input num_batches must be positive.")
+        self.iterable = iterable
+        self.num_batches = num_batches
+
+    def __iter__(self) -> Iterator:
+        items = queue.Queue(maxsize=self.num_batches)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._produce,
+            args=(items, stop),
+            name="piqture-prefetcher",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            while True:
+                marker, item = items.get()
+                if marker is _END:
+                    return
+                if marker is _ERROR:
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+
+    def _produce(self, items: queue.Queue, stop: threading.Event):
+        """Puts the items of the iterable into the queue."""
+
+        def put(entry: tuple) -> bool:
+            # Wait for free space, but give up once the consumer stops.
+            while not stop.is_set():
+                try:
+                    items.put(entry, timeout=0.05)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        marker, payload = _END, None
+        try:
+            for item in self.iterable:
+                if not put((None, item)):
+                    return
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            marker, payload = _ERROR, error
+        finally:
+            # Always end the queue, also after e.g. KeyboardInterrupt,
+            # so the consumer never waits forever.
+            put((marker, payload))
@@ -0,0 +1,119 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""On-disk cache of preprocessed datasets"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import torch
+import torch.utils.data
+
+from piqture.data_loader.array_dataset import ImageArrayDataset
+
+# Bump to invalidate every existing cache entry when the
+# preprocessing itself changes.
+CACHE_VERSION = 1
+
+
+# pylint: disable=too-few-public-methods
+class PreprocessedDataset(ImageArrayDataset):
+    """
+    Dataset of preprocessed images and labels held in
+    (memory-mapped) NumPy arrays.
+    """
+
+    def __init__(self, data: np.ndarray, targets: np.ndarray):
+        # Images are copied out of the read-only mapping and
+        # served as tensors.
+        super().__init__(data, targets, transform=torch.from_numpy)
+
+
+def cache_key(params: dict) -> str:
+    """
+    Returns a short hash that identifies a set of
+    preprocessing parameters.
+    """
+    encoded = json.dumps(
+        {"version": CACHE_VERSION, **params}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _preprocess(dataset: torch.utils.data.Dataset) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Applies the dataset transforms once to every sample and
+    collects the results in preallocated arrays.
+    """
+    if len(dataset) == 0:
+        return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+    first_image, _ = dataset[0]
+    first_image = np.asarray(first_image, dtype=np.float32)
+
+    data = np.empty((len(dataset), *first_image.shape), dtype=np.float32)
+    targets = np.empty(len(dataset), dtype=np.int64)
+    samples = (dataset[index] for index in range(len(dataset)))
+    for index, (image, label) in enumerate(samples):
+        data[index] = np.asarray(image, dtype=np.float32)
+        targets[index] = label
+    return data, targets
+
+
+def load_or_preprocess(
+    dataset: torch.utils.data.Dataset, cache_dir: str, name: str, params: dict
+) -> PreprocessedDataset:
+    """
+    Loads a preprocessed dataset from the cache, or preprocesses
+    and caches it when no entry matches the parameters.
+
+    Entries are stored as .npy files named after a hash of the
+    parameters, so changing any parameter selects a different
+    entry. Cached arrays are memory-mapped on load.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset whose
+        transforms produce the preprocessed images.
+        cache_dir (str): directory holding cache entries.
+        name (str): name of the dataset split, e.g. "mnist-train".
+        params (dict): JSON-serializable preprocessing parameters.
+
+    Returns:
+        PreprocessedDataset: dataset with the preprocessed images.
+    """
+    prefix = os.path.join(cache_dir, f"{name}-{cache_key(params)}")
+    paths = {
+        "data": f"{prefix}.data.npy",
+        "targets": f"{prefix}.targets.npy",
+        "params": f"{prefix}.json",
+    }
+
+    # The parameter file is written last, so it marks a complete entry.
+    if not os.path.isfile(paths["params"]):
+        os.makedirs(cache_dir, exist_ok=True)
+        arrays = dict(zip(("data", "targets"), _preprocess(dataset)))
+        for key, array in arrays.items():
+            # Write to a temporary file first, so an interrupted
+            # run never leaves a truncated entry behind.
+            temp_path = f"{paths[key]}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                np.save(file, array)
+            os.replace(temp_path, paths[key])
+        with open(paths["params"], "w", encoding="utf-8") as file:
+            json.dump(params, file, sort_keys=True, default=str)
+
+    return PreprocessedDataset(
+        np.load(paths["data"], mmap_mode="r"),
+        np.load(paths["targets"], mmap_mode="r"),
+    )
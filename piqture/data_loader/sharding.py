@@ -0,0 +1,124 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Deterministic sharding of datasets across nodes and processes"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional, Sized
+
+import numpy as np
+import torch.utils.data
+
+
+def validate_shard(num_shards: int, shard_index: int):
+    """Validates num_shards and shard_index inputs."""
+    if not isinstance(num_shards, int) or isinstance(num_shards, bool):
+        raise TypeError("The input num_shards must be of the type int.")
+    if not isinstance(shard_index, int) or isinstance(shard_index, bool):
+        raise TypeError("The input shard_index must be of the type int.")
+    if num_shards < 1:
+        raise ValueError("The input num_shards must be positive.")
+    if not 0 <= shard_index < num_shards:
+        raise ValueError("The input shard_index must be in [0, num_shards).")
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def shard_indices(
+    num_samples: int,
+    num_shards: int = 1,
+    shard_index: int = 0,
+    seed: Optional[int] = None,
+    epoch: int = 0,
+    drop_last: bool = False,
+) -> np.ndarray:
+    """
+    Returns the sample indices of one shard.
+
+    Every shard computes the same (optionally shuffled) order of
+    all samples and takes every num_shards-th index from it, so
+    shards are disjoint, cover the dataset and need no coordination.
+
+    Args:
+        num_samples (int): number of samples in the dataset.
+        num_shards (int): number of shards. Defaults to 1.
+        shard_index (int): index of this shard in [0, num_shards).
+        seed (int, optional): shuffles the samples with a permutation
+        seeded by (seed, epoch) if given. Defaults to None, keeping
+        the dataset order.
+        epoch (int): epoch of the shuffle. Defaults to 0.
+        drop_last (bool): drops the trailing samples, so that every
+        shard has the same length. Defaults to False, where shard
+        lengths differ by at most one.
+
+    Returns:
+        np.ndarray: sample indices of the shard.
+    """
+    validate_shard(num_shards, shard_index)
+    if seed is None:
+        indices = np.arange(num_samples)
+    else:
+        indices = np.random.default_rng([seed, epoch]).permutation(num_samples)
+    if drop_last:
+        indices = indices[: num_samples - num_samples % num_shards]
+    return indices[shard_index::num_shards]
+
+
+class ShardSampler(torch.utils.data.Sampler):
+    """
+    Samples one shard of a dataset, like DistributedSampler but
+    without padding and without a process group.
+
+    Call set_epoch at the start of every epoch to reshuffle. All
+    shards reshuffle identically, so they stay disjoint.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self,
+        data_source: Sized,
+        num_shards: int = 1,
+        shard_index: int = 0,
+        shuffle: bool = False,
+        seed: int = 0,
+        drop_last: bool = False,
+    ):
+        super().__init__()
+        validate_shard(num_shards, shard_index)
+        self.num_samples = len(data_source)
+        self.num_shards = num_shards
+        self.shard_index = shard_index
+        self.shuffle = shuffle
+        self.seed = seed
+        self.drop_last = drop_last
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int):
+        """Sets the epoch that seeds the shuffle."""
+        self.epoch = epoch
+
+    def indices(self) -> np.ndarray:
+        """Returns the sample indices of the current epoch."""
+        return shard_indices(
+            self.num_samples,
+            self.num_shards,
+            self.shard_index,
+            seed=self.seed if self.shuffle else None,
+            epoch=self.epoch,
+            drop_last=self.drop_last,
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.indices().tolist())
+
+    def __len__(self):
+        if self.drop_last:
+            return self.num_samples // self.num_shards
+        return len(range(self.shard_index, self.num_samples, self.num_shards))
@@ -0,0 +1,173 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Class-balanced subsampling of datasets"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+import numpy as np
+import torch.utils.data
+
+from piqture.data_loader.label_index import label_indices
+
+
+def _balanced_index(
+    index: dict[int, np.ndarray], samples_per_class: int, labels: Optional[list]
+) -> dict[int, np.ndarray]:
+    """
+    Validates the inputs and returns the index arrays of the
+    selected labels.
+    """
+    if not isinstance(samples_per_class, int) or isinstance(samples_per_class, bool):
+        raise TypeError("The input samples_per_class must be of the type int.")
+    if samples_per_class < 1:
+        raise ValueError("The input samples_per_class must be positive.")
+    if labels is not None and not isinstance(labels, list):
+        raise TypeError("The input labels must be of the type list.")
+
+    labels = sorted(index) if labels is None else labels
+    missing = [label for label in labels if label not in index]
+    if missing:
+        raise ValueError(f"The labels {missing} have no samples.")
+    small = [label for label in labels if len(index[label]) < samples_per_class]
+    if small:
+        raise ValueError(
+            f"The labels {small} have fewer than {samples_per_class} samples."
+        )
+    return {label: index[label] for label in labels}
+
+
+def _select(
+    index: dict[int, np.ndarray],
+    samples_per_class: int,
+    rng: Optional[np.random.Generator],
+) -> np.ndarray:
+    """
+    Draws samples_per_class indices of every label, or takes
+    the first ones if rng is None.
+    """
+    if rng is None:
+        return np.concatenate(
+            [indices[:samples_per_class] for indices in index.values()]
+        )
+    # choice without replacement only touches the selected positions.
+    return np.concatenate(
+        [
+            indices[rng.choice(len(indices), samples_per_class, replace=False)]
+            for indices in index.values()
+        ]
+    )
+
+
+def stratified_indices(
+    targets,
+    samples_per_class: int,
+    labels: Optional[list] = None,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Returns the indices of a class-balanced sample of a dataset.
+
+    Args:
+        targets: labels of a dataset, as a sequence, NumPy
+        array or tensor.
+        samples_per_class (int): number of samples of every label.
+        labels (list, optional): labels to sample. Defaults to None,
+        sampling every label present in targets.
+        seed (int, optional): draws the samples of every label at
+        random with this seed if given. Defaults to None, taking the
+        first samples of every label.
+
+    Returns:
+        np.ndarray: ascending sample indices, samples_per_class
+        for every label.
+    """
+    index = _balanced_index(label_indices(targets), samples_per_class, labels)
+    rng = None if seed is None else np.random.default_rng(seed)
+    return np.sort(_select(index, samples_per_class, rng))
+
+
+def stratified_subset(
+    dataset: torch.utils.data.Dataset,
+    samples_per_class: int,
+    labels: Optional[list] = None,
+    seed: Optional[int] = None,
+) -> torch.utils.data.Subset:
+    """
+    Restricts a dataset to a class-balanced sample.
+
+    The per-label indices are computed once from dataset.targets,
+    so only the selected samples are ever loaded.
+
+    Args:
+        dataset (torch.utils.data.Dataset): dataset with a
+        targets attribute.
+        samples_per_class (int): number of samples of every label.
+        labels (list, optional): labels to sample. Defaults to None,
+        sampling every label.
+        seed (int, optional): seed of the random draw. Defaults to
+        None, taking the first samples of every label.
+
+    Returns:
+        torch.utils.data.Subset: balanced subset of the dataset,
+        in the original sample order.
+    """
+    return torch.utils.data.Subset(
+        dataset,
+        stratified_indices(dataset.targets, samples_per_class, labels, seed).tolist(),
+    )
+
+
+class StratifiedSampler(torch.utils.data.Sampler):
+    """
+    Samples a new class-balanced selection of a dataset every epoch.
+
+    The per-label indices are built once, so every epoch costs
+    time proportional to the number of selected samples. Call
+    set_epoch at the start of every epoch to draw a new selection.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self,
+        targets,
+        samples_per_class: int,
+        labels: Optional[list] = None,
+        shuffle: bool = True,
+        seed: int = 0,
+    ):
+        super().__init__()
+        self.index = _balanced_index(label_indices(targets), samples_per_class, labels)
+        self.samples_per_class = samples_per_class
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int):
+        """Sets the epoch that seeds the selection."""
+        self.epoch = epoch
+
+    def indices(self) -> np.ndarray:
+        """Returns the sample indices of the current epoch."""
+        rng = np.random.default_rng([self.seed, self.epoch])
+        indices = _select(self.index, self.samples_per_class, rng)
+        if self.shuffle:
+            # Mix the labels within every epoch.
+            rng.shuffle(indices)
+            return indices
+        return np.sort(indices)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.indices().tolist())
+
+    def __len__(self):
+        return self.samples_per_class * len(self.index)
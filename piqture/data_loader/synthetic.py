@@ -0,0 +1,156 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Seeded synthetic image datasets for offline benchmarks"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Union
+
+import numpy as np
+import torch
+
+from piqture.data_loader.array_dataset import ImageArrayDataset
+
+INTENSITIES = ("mnist", "uniform", "binary")
+
+# Resolution of the random fields that shape the images. Fields are
+# smooth at image scale, so nonzero pixels form connected strokes.
+FIELD_SIZE = 7
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+def synthetic_images(
+    num_images: int,
+    img_size: Union[int, tuple[int, int]] = 28,
+    sparsity: float = 0.81,
+    intensity: str = "mnist",
+    num_classes: int = 10,
+    seed: int = 0,
+    class_seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generates seeded, MNIST-like uint8 images and labels.
+
+    Every class has a fixed random template. An image adds random
+    variation to the template of its label, is upsampled to
+    img_size and keeps its brightest 1 - sparsity fraction of
+    pixels. All images are generated in a few vectorized
+    operations, and the same arguments always give the same images.
+
+    Args:
+        num_images (int): number of images.
+        img_size (int or tuple[int, int]): (height, width) of the
+        images. Defaults to 28.
+        sparsity (float): fraction of zero pixels per image, in
+        [0, 1). Defaults to 0.81, as in MNIST.
+        intensity (str): distribution of the nonzero pixels.
+        "mnist" saturates stroke centers at 255 and fades towards
+        the edges, giving the MNIST pixel mean and standard deviation
+        of about 0.13 and 0.31 at the default sparsity. "uniform"
+        draws them uniformly from [1, 255] and "binary" sets them
+        to 255. Defaults to "mnist".
+        num_classes (int): number of labels. Defaults to 10.
+        seed (int): seed of the images and labels. Defaults to 0.
+        class_seed (int): seed of the class templates. Splits with
+        different seeds and the same class_seed share their classes.
+        Defaults to 0.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: images of shape
+        (num_images, height, width) and int64 labels.
+    """
+    height, width = (img_size, img_size) if isinstance(img_size, int) else img_size
+    if not isinstance(num_images, int) or num_images < 0:
+        raise ValueError("The input num_images must be a non-negative int.")
+    if not 0 <= sparsity < 1:
+        raise ValueError("The input sparsity must be in [0, 1).")
+    if intensity not in INTENSITIES:
+        raise ValueError(
+            f"The input intensity must be one of {', '.join(INTENSITIES)}."
+        )
+
+    templates = np.random.default_rng(class_seed).standard_normal(
+        (num_classes, FIELD_SIZE, FIELD_SIZE)
+    )
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, num_classes, num_images)
+    fields = _fields(templates[labels], rng, (height, width))
+
+    # Per-image threshold that leaves a sparsity fraction of zeros.
+    num_zeros = int(round(sparsity * height * width))
+    if num_zeros == 0:
+        threshold = fields.min(axis=1, keepdims=True) - 1
+    else:
+        threshold = np.partition(fields, num_zeros - 1, axis=1)[:, [num_zeros - 1]]
+
+    values = _intensities(fields, threshold, intensity, rng)
+    images = np.where(fields > threshold, values, 0).astype(np.uint8)
+    return images.reshape((num_images, height, width)), labels
+
+
+def synthetic_dataset(
+    num_images: int,
+    transform: Optional[Callable] = None,
+    **kwargs,
+) -> ImageArrayDataset:
+    """
+    Returns a dataset of synthetic_images.
+
+    Args:
+        num_images (int): number of images.
+        transform (Callable, optional): transform applied to
+        every image.
+        **kwargs: further arguments of synthetic_images, e.g.
+        img_size, sparsity or seed.
+
+    Returns:
+        ImageArrayDataset: dataset of the generated images.
+    """
+    images, labels = synthetic_images(num_images, **kwargs)
+    num_classes = kwargs.get("num_classes", 10)
+    return ImageArrayDataset(
+        images, labels, transform=transform, classes=list(range(num_classes))
+    )
+
+
+def _fields(
+    templates: np.ndarray, rng: np.random.Generator, size: tuple[int, int]
+) -> np.ndarray:
+    """Varies the class templates and upsamples them to flat images."""
+    fields = templates + 0.5 * rng.standard_normal(templates.shape)
+    return (
+        torch.nn.functional.interpolate(
+            torch.from_numpy(fields.astype(np.float32)).unsqueeze(1),
+            size=size,
+            mode="bicubic",
+            align_corners=False,
+        )
+        .squeeze(1)
+        .numpy()
+        .reshape(len(templates), size[0] * size[1])
+    )
+
+
+def _intensities(
+    fields: np.ndarray,
+    threshold: np.ndarray,
+    intensity: str,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Pixel values of the strokes above the threshold."""
+    if intensity == "mnist":
+        # Relative height above the threshold, saturated in the centers.
+        peak = fields.max(axis=1, keepdims=True)
+        relative = (fields - threshold) / np.maximum(peak - threshold, 1e-12)
+        return np.clip(1 + 254 * np.minimum(relative * 3.5, 1), 1, 255)
+    if intensity == "uniform":
+        return rng.integers(1, 256, fields.shape)
+    return np.full(fields.shape, 255)
@@ -0,0 +1,135 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Bulk instruction builder for image embedding circuits"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Union
+
+from qiskit.circuit import (
+    CircuitInstruction,
+    Operation,
+    ParameterExpression,
+    QuantumCircuit,
+)
+from qiskit.circuit.library import HGate, MCXGate, RYGate, XGate
+
+
+class CircuitBuilder:
+    """
+    Accumulates operations for an embedding circuit and appends
+    them to the circuit in a single pass.
+
+    Instructions are stored in a preallocated list and appended
+    through the circuit's internal fast path, which skips
+    argument broadcasting and validation. Callers are
+    responsible for passing valid qubit indices.
+
+    This is an internal helper for the image embeddings.
+    """
+
+    def __init__(self, circuit: QuantumCircuit, capacity: int = 0):
+        self.circuit = circuit
+        self._qubits = tuple(circuit.qubits)
+        self._instructions = [None] * capacity
+        self._size = 0
+
+        # Gate instances are shared between instructions.
+        self._x_gate = XGate()
+        self._h_gate = HGate()
+        self._mcx_gates = {}
+
+    def __len__(self):
+        """Returns the number of accumulated instructions."""
+        return self._size
+
+    def append(self, operation: Operation, qubits: Iterable[int]):
+        """
+        Accumulates an operation acting on qubit indices.
+
+        Args:
+            operation (Operation): operation to append.
+            qubits (Iterable[int]): qubit indices the
+            operation acts on.
+        """
+        instruction = CircuitInstruction(
+            operation, tuple(self._qubits[qubit] for qubit in qubits)
+        )
+        if self._size < len(self._instructions):
+            self._instructions[self._size] = instruction
+        else:
+            self._instructions.append(instruction)
+        self._size += 1
+
+    def x(self, qubits: Iterable[int]):
+        """Accumulates an X gate on each of the qubit indices."""
+        for qubit in qubits:
+            self.append(self._x_gate, (qubit,))
+
+    def h(self, qubits: Iterable[int]):
+        """Accumulates an H gate on each of the qubit indices."""
+        for qubit in qubits:
+            self.append(self._h_gate, (qubit,))
+
+    def mcx(self, control_qubits: list[int], target_qubits: Iterable[int]):
+        """
+        Accumulates a multi-controlled X gate on each
+        of the target qubits.
+
+        Args:
+            control_qubits (list[int]): control qubit indices.
+            target_qubits (Iterable[int]): target qubit indices.
+        """
+        num_ctrl_qubits = len(control_qubits)
+        if num_ctrl_qubits not in self._mcx_gates:
+            self._mcx_gates[num_ctrl_qubits] = MCXGate(num_ctrl_qubits)
+        gate = self._mcx_gates[num_ctrl_qubits]
+
+        for target_qubit in target_qubits:
+            self.append(gate, (*control_qubits, target_qubit))
+
+    def mcry(
+        self,
+        theta: Union[float, ParameterExpression],
+        control_qubits: list[int],
+        target_qubit: int,
+    ):
+        """
+        Accumulates a multi-controlled RY(theta) gate.
+
+        The controlled gate is kept as an annotated operation,
+        which defers its synthesis to the transpiler.
+
+        Args:
+            theta (float or ParameterExpression): rotation angle.
+            control_qubits (list[int]): control qubit indices.
+            target_qubit (int): target qubit index.
+        """
+        self.append(
+            RYGate(theta).control(len(control_qubits), annotated=True),
+            (*control_qubits, target_qubit),
+        )
+
+    def flush(self) -> QuantumCircuit:
+        """
+        Appends the accumulated instructions to the circuit
+        and clears the builder.
+
+        Returns:
+            QuantumCircuit: circuit with the appended instructions.
+        """
+        # pylint: disable=protected-access
+        for index in range(self._size):
+            self.circuit._append(self._instructions[index])
+            self._instructions[index] = None
+        self._size = 0
+        return self.circuit
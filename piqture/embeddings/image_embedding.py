@@ -29,6 +29,10 @@ class ImageEmbedding(ABC):
         By default, grayscale = 1 color channel, and RGB = 3
     """
 
+    # Embeddings that index pixel positions with log2(pixels)
+    # qubits also require dimensions that are powers of 2.
+    power_of_2_dims = False
+
     def __init__(
         self,
         img_dims: tuple[int, ...],
@@ -75,14 +79,27 @@ class ImageEmbedding(ABC):
         """
         Validates img_dims input.
 
-        Here, checks for square images. This
-        function can be overriden.
+        Here, checks for square images, with dimensions
+        that are powers of 2 if power_of_2_dims is set.
+        This function can be overriden.
         """
         if len(set(img_dims)) > 1:
             raise ValueError(
                 f"{self.__class__.__name__} supports square images only. "
                 f"Input img_dims must have same dimensions."
             )
+        if self.power_of_2_dims:
+            self.validate_dimensions_power_of_2(img_dims)
+
+    @staticmethod
+    def validate_dimensions_power_of_2(img_dims):
+        """
+        Validates that every dimension in img_dims
+        input is a power of 2.
+        """
+        for dim in img_dims:
+            if dim < 1 or dim & (dim - 1):
+                raise ValueError("Image dimensions must be powers of 2.")
 
     def validate_number_pixel_lists(self, pixel_vals):
         """
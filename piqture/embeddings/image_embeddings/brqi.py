@@ -8,6 +8,7 @@ from typing import Union
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 
+from piqture.embeddings.circuit_builder import CircuitBuilder
 from piqture.embeddings.image_embedding import ImageEmbedding
 from piqture.mixin.image_embedding_mixin import ImageMixin
 
@@ -109,13 +110,25 @@ class BRQI(ImageEmbedding, ImageMixin):
             representation.
         """
         self.pixel_vals = np.array(self.pixel_vals).flatten()
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
-
         num_pixels = math.prod(self.img_dims)
+        control_qubits = self._get_control_qubits()
+
+        # Bits of every pixel value, most significant bit first.
+        shifts = np.arange(self.color_qubits - 1, -1, -1)
+        color_bits = (
+            self.pixel_vals[:num_pixels, np.newaxis].astype(int) >> shifts
+        ) & 1
+
+        builder = CircuitBuilder(
+            self.circuit,
+            capacity=self.feature_dim + int(color_bits.sum()),
+        )
+        builder.h(control_qubits)
         for pixel in range(num_pixels):
-            color_byte = f"{int(self.pixel_vals[pixel]):0>{self.color_qubits}b}"
-            self.pixel_value(color_byte=color_byte)
+            builder.mcx(
+                control_qubits, np.flatnonzero(color_bits[pixel]) + self.feature_dim
+            )
+        builder.flush()
 
         # Add measurement to all qubits
         self.circuit.measure_all()
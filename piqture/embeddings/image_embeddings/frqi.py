@@ -17,20 +17,27 @@ import math
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 
+from piqture.embeddings.circuit_builder import CircuitBuilder
 from piqture.embeddings.image_embedding import ImageEmbedding
 from piqture.mixin.image_embedding_mixin import ImageMixin
 
 
 class FRQI(ImageEmbedding, ImageMixin):
     """
-    Represents images in FRQI representation format
+    Represents images in FRQI representation format.
+
+    A 2^n x 2^n image is embedded on 2n position qubits
+    and a single color qubit. Each pixel angle is encoded
+    with a rotation controlled by all the position qubits.
     """
 
+    power_of_2_dims = True
+
     def __init__(self, img_dims: tuple[int, int], pixel_vals: list[list] = None):
         ImageEmbedding.__init__(self, img_dims, pixel_vals)
 
         # feature_dim = no. of qubits for pixel position embedding
-        self.feature_dim = int(np.sqrt(math.prod(self.img_dims)))
+        self.feature_dim = int(math.log2(math.prod(self.img_dims)))
 
         # FRQI circuit
         self._circuit = QuantumCircuit(self.feature_dim + 1)
@@ -46,26 +53,21 @@ class FRQI(ImageEmbedding, ImageMixin):
         ImageMixin.pixel_position(self.circuit, pixel_pos_binary)
 
     def pixel_value(self, *args, **kwargs):
-        """Embeds pixel (color) values in a circuit"""
+        """
+        Embeds pixel (color) values in a circuit.
+
+        A RY(2 * theta) rotation on the color qubit is
+        controlled by all the position qubits.
+        """
         pixel_pos = kwargs.get("pixel_pos")
 
-        self.circuit.cry(
-            self._parameters[pixel_pos],
-            target_qubit=self.feature_dim,
-            control_qubit=self.feature_dim - 2,
-        )
-        self.circuit.cx(0, 1)
-        self.circuit.cry(
-            -self._parameters[pixel_pos],
-            target_qubit=self.feature_dim,
-            control_qubit=self.feature_dim - 1,
-        )
-        self.circuit.cx(0, 1)
-        self.circuit.cry(
-            self._parameters[pixel_pos],
-            target_qubit=self.feature_dim,
-            control_qubit=self.feature_dim - 1,
+        builder = CircuitBuilder(self.circuit, capacity=1)
+        builder.mcry(
+            2 * self._parameters[pixel_pos],
+            list(range(self.feature_dim)),
+            self.feature_dim,
         )
+        builder.flush()
 
     def frqi(self) -> QuantumCircuit:
         # pylint: disable=duplicate-code
@@ -76,19 +78,84 @@ class FRQI(ImageEmbedding, ImageMixin):
             QuantumCircuit: final circuit with the frqi image
             representation.
         """
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
-
         # Supports grayscale images only.
         num_theta = math.prod(self.img_dims)
-        for pixel in range(num_theta):
-            pixel_pos_binary = f"{pixel:0>2b}"
+        control_qubits = list(range(self.feature_dim))
 
+        # Half of the position qubits take an X gate per pixel,
+        # applied twice, plus one rotation per pixel.
+        builder = CircuitBuilder(
+            self.circuit, capacity=self.feature_dim * (num_theta + 1) + num_theta
+        )
+        builder.h(control_qubits)
+        for pixel in range(num_theta):
             # Embed pixel position on qubits
-            self.pixel_position(pixel_pos_binary)
+            ImageMixin.pixel_position_int(builder, pixel, self.feature_dim)
             # Embed color information on qubits
-            self.pixel_value(pixel_pos=pixel)
+            builder.mcry(2 * self._parameters[pixel], control_qubits, self.feature_dim)
             # Remove pixel position embedding
-            self.pixel_position(pixel_pos_binary)
+            ImageMixin.pixel_position_int(builder, pixel, self.feature_dim)
+
+        return builder.flush()
 
-        return self.circuit
+    @staticmethod
+    def kernel_matrix(
+        x_vec: np.ndarray, y_vec: np.ndarray = None, block_size: int = 1024
+    ) -> np.ndarray:
+        """
+        Computes the fidelity kernel between two batches of
+        FRQI-encoded images directly from their pixel angles.
+
+        The overlap of two FRQI states is the mean of
+        cos(theta_i - theta'_i) over all pixel positions, so the
+        kernel entry |<psi(x)|psi(y)>|^2 is computed without
+        simulating any circuit. Rows of x_vec are processed in
+        blocks of block_size to bound the size of intermediates.
+
+        Args:
+            x_vec (np.ndarray): pixel angles of shape (n_x, ...),
+            one image per row.
+            y_vec (np.ndarray, optional): pixel angles of shape
+            (n_y, ...). Defaults to x_vec.
+            block_size (int): number of rows of x_vec processed
+            at a time. Defaults to 1024.
+
+        Returns:
+            np.ndarray: kernel matrix of shape (n_x, n_y).
+        """
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+
+        x_vec = np.asarray(x_vec)
+        x_vec = x_vec.reshape(len(x_vec), -1)
+        y_vec = x_vec if y_vec is None else np.asarray(y_vec)
+        y_vec = y_vec.reshape(len(y_vec), -1)
+
+        if x_vec.shape[1] != y_vec.shape[1]:
+            raise ValueError(
+                f"No. of pixels in x_vec ({x_vec.shape[1]}) and "
+                f"y_vec ({y_vec.shape[1]}) must be equal."
+            )
+
+        # float32 inputs keep a float32 kernel, others use float64.
+        dtype = np.result_type(x_vec.dtype, y_vec.dtype, np.float32)
+        num_pixels = x_vec.shape[1]
+
+        # cos(a - b) = cos(a)cos(b) + sin(a)sin(b), so the overlaps
+        # are a single matrix product of [cos, sin] features.
+        y_features = np.hstack(
+            (np.cos(y_vec, dtype=dtype), np.sin(y_vec, dtype=dtype))
+        ).T
+        kernel = np.empty((len(x_vec), len(y_vec)), dtype=dtype)
+
+        for start in range(0, len(x_vec), block_size):
+            x_block = x_vec[start : start + block_size]
+            x_features = np.hstack(
+                (np.cos(x_block, dtype=dtype), np.sin(x_block, dtype=dtype))
+            )
+            block = kernel[start : start + block_size]
+            np.matmul(x_features, y_features, out=block)
+            block /= num_pixels
+            np.square(block, out=block)
+
+        return kernel
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 from qiskit.circuit import QuantumCircuit
 
 from piqture.embeddings.image_embeddings.neqr import NEQR
@@ -97,21 +98,6 @@ class INEQR(NEQR):
             QuantumCircuit: final circuit with the INEQR image
             representation.
         """
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
-
-        for y_index, y_val in enumerate(self.pixel_vals[0]):
-            for x_index, x_val in enumerate(y_val):
-                pixel_pos_binary = (
-                    f"{y_index:0>{self.y_coord}b}{x_index:0>{self.x_coord}b}"
-                )
-                color_byte = f"{x_val:0>8b}"
-
-                # Embed pixel position on qubits
-                self.pixel_position(pixel_pos_binary)
-                # Embed color information on qubits
-                self.pixel_value(color_byte=color_byte)
-                # Remove pixel position embedding
-                self.pixel_position(pixel_pos_binary)
-
-        return self.circuit
+        # Rows hold 2**x_coord pixels, so the row-major index
+        # of a pixel is its (y_index, x_index) position.
+        return self._embed_pixels(np.asarray(self.pixel_vals[0]).flatten())
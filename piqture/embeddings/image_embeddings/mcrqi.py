@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import math
 
-import numpy as np
 from qiskit.circuit import QuantumCircuit
-from qiskit.circuit.library import MCMT, RYGate
 
+from piqture.embeddings.circuit_builder import CircuitBuilder
 from piqture.embeddings.image_embedding import ImageEmbedding
 from piqture.mixin.image_embedding_mixin import ImageMixin
 
@@ -26,10 +25,13 @@ class MCRQI(ImageEmbedding):
         https://ieeexplore.ieee.org/document/6051718.
     """
 
+    power_of_2_dims = True
+
     def __init__(self, img_dims: tuple[int, int], pixel_vals: list[list] = None):
         ImageEmbedding.__init__(self, img_dims, pixel_vals, color_channels=4)
 
-        self.feature_dim = int(np.ceil(np.sqrt(math.prod(self.img_dims))))
+        # No. of qubits for pixel position embedding
+        self.feature_dim = int(math.log2(math.prod(self.img_dims)))
         # No. of qubits for RGB-alpha color channels
         self.color_channels = 1
         # No. of qubits for RGB-alpha color index
@@ -57,15 +59,11 @@ class MCRQI(ImageEmbedding):
     def pixel_value(self, *args, **kwargs):
         """Embeds pixel (color) values in a circuit"""
         pixel = kwargs.get("pixel")
+        num_ctrl_qubits = self.feature_dim + self.channel_index_qubits
 
-        self.circuit.compose(
-            MCMT(
-                RYGate(2 * pixel),
-                num_target_qubits=1,
-                num_ctrl_qubits=self.feature_dim + self.channel_index_qubits,
-            ),
-            inplace=True,
-        )
+        builder = CircuitBuilder(self.circuit, capacity=1)
+        builder.mcry(2 * pixel, list(range(num_ctrl_qubits)), num_ctrl_qubits)
+        builder.flush()
 
     def mcrqi(self) -> QuantumCircuit:
         """
@@ -76,23 +74,29 @@ class MCRQI(ImageEmbedding):
             QuantumCircuit: final circuit with the MCRQI image
             representation.
         """
-        for i in range(self.feature_dim + self.channel_index_qubits):
-            self.circuit.h(i)
+        num_ctrl_qubits = self.feature_dim + self.channel_index_qubits
+        control_qubits = list(range(num_ctrl_qubits))
 
+        num_pixels = sum(len(channel_pixels) for channel_pixels in self.pixel_vals)
+        builder = CircuitBuilder(
+            self.circuit, capacity=num_ctrl_qubits * (num_pixels + 1) + num_pixels
+        )
+        builder.h(control_qubits)
         for channel, channel_pixels in enumerate(self.pixel_vals):
             for pixel_pos, pixel in enumerate(channel_pixels):
-                pixel_pos_binary = f"{pixel_pos:0>{self.feature_dim}b}"
-                channel_index_binary = f"{channel:0>2b}"
-
                 # Embed pixel position and channel index on qubits
-                self.pixel_position(pixel_pos_binary)
-                self.channel_index(channel_index_binary, self.feature_dim)
+                ImageMixin.pixel_position_int(builder, pixel_pos, self.feature_dim)
+                ImageMixin.channel_index_int(
+                    builder, channel, self.channel_index_qubits, self.feature_dim
+                )
 
                 # Embed color information on qubits
-                self.pixel_value(pixel=pixel)
+                builder.mcry(2 * pixel, control_qubits, num_ctrl_qubits)
 
                 # Remove pixel position and channel index embedding
-                self.pixel_position(pixel_pos_binary)
-                self.channel_index(channel_index_binary, self.feature_dim)
+                ImageMixin.pixel_position_int(builder, pixel_pos, self.feature_dim)
+                ImageMixin.channel_index_int(
+                    builder, channel, self.channel_index_qubits, self.feature_dim
+                )
 
-        return self.circuit
+        return builder.flush()
@@ -17,12 +17,20 @@ import math
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 
+from piqture.embeddings.circuit_builder import CircuitBuilder
 from piqture.embeddings.image_embedding import ImageEmbedding
 from piqture.mixin.image_embedding_mixin import ImageMixin
 
 
 class NEQR(ImageEmbedding, ImageMixin):
-    """Represents images in NEQR representation format."""
+    """
+    Represents images in NEQR representation format.
+
+    A 2^n x 2^n image is embedded on 2n position qubits
+    and ceil(log2(max_color_intensity + 1)) color qubits.
+    """
+
+    power_of_2_dims = True
 
     def __init__(
         self,
@@ -37,7 +45,8 @@ class NEQR(ImageEmbedding, ImageMixin):
                 "Maximum color intensity cannot be less than 0 or greater than 255."
             )
 
-        self.feature_dim = int(np.ceil(np.sqrt(math.prod(self.img_dims))))
+        # feature_dim = no. of qubits for pixel position embedding
+        self.feature_dim = int(math.log2(math.prod(self.img_dims)))
         self.max_color_intensity = max_color_intensity + 1
 
         # number of qubits to encode color byte
@@ -68,6 +77,53 @@ class NEQR(ImageEmbedding, ImageMixin):
                     control_qubits=control_qubits, target_qubit=self.feature_dim + index
                 )
 
+    def _color_target_qubits(self, pixel_val: int) -> np.ndarray:
+        """
+        Returns the color qubits that are flipped to
+        embed a pixel (color) value.
+
+        Args:
+            pixel_val (int): pixel (color) value.
+        """
+        # The 1 bits of a value are the 0 bits of its
+        # complement, which the position lookup table holds.
+        complement = (2**self.color_qubits - 1) ^ int(pixel_val)
+        return (
+            ImageMixin.position_x_gates(self.color_qubits)[complement]
+            + self.feature_dim
+        )
+
+    def _embed_pixels(self, pixel_vals: np.ndarray) -> QuantumCircuit:
+        """
+        Embeds flattened pixel values on the circuit with
+        a single bulk append.
+
+        Args:
+            pixel_vals (np.ndarray): pixel values, where the
+            index of a pixel is its position.
+
+        Returns:
+            QuantumCircuit: circuit with the embedded pixels.
+        """
+        num_pixels = len(pixel_vals)
+        control_qubits = list(range(self.feature_dim))
+
+        builder = CircuitBuilder(
+            self.circuit,
+            capacity=self.feature_dim * (num_pixels + 1)
+            + self.color_qubits * num_pixels,
+        )
+        builder.h(control_qubits)
+        for pixel, pixel_val in enumerate(pixel_vals):
+            # Embed pixel position on qubits
+            ImageMixin.pixel_position_int(builder, pixel, self.feature_dim)
+            # Embed color information on qubits
+            builder.mcx(control_qubits, self._color_target_qubits(pixel_val))
+            # Remove pixel position embedding
+            ImageMixin.pixel_position_int(builder, pixel, self.feature_dim)
+
+        return builder.flush()
+
     def neqr(self) -> QuantumCircuit:
         # pylint: disable=duplicate-code
         """
@@ -78,19 +134,4 @@ class NEQR(ImageEmbedding, ImageMixin):
             representation.
         """
         self.pixel_vals = self.pixel_vals.flatten()
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
-
-        num_theta = math.prod(self.img_dims)
-        for pixel in range(num_theta):
-            pixel_pos_binary = f"{pixel:0>2b}"
-            color_byte = f"{int(self.pixel_vals[pixel]):0>8b}"
-
-            # Embed pixel position on qubits
-            self.pixel_position(pixel_pos_binary)
-            # Embed color information on qubits
-            self.pixel_value(color_byte=color_byte)
-            # Remove pixel position embedding
-            self.pixel_position(pixel_pos_binary)
-
-        return self.circuit
+        return self._embed_pixels(self.pixel_vals)
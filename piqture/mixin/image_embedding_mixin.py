@@ -12,6 +12,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
 from qiskit.circuit import QuantumCircuit
 
 
@@ -37,6 +40,52 @@ class ImageMixin:
             if value == "0":
                 circuit.x(index)
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def position_x_gates(num_qubits: int) -> tuple[np.ndarray, ...]:
+        """
+        Builds a lookup table of the qubits that take an
+        X gate for every position on num_qubits qubits.
+
+        Qubit 0 holds the most significant bit of the
+        position, same as the binary string embedding.
+
+        Args:
+            num_qubits (int): number of qubits used to
+            embed a position.
+
+        Returns:
+            tuple[np.ndarray, ...]: read-only arrays of qubit
+            indices, one for each of the 2**num_qubits positions.
+        """
+        positions = np.arange(2**num_qubits)[:, np.newaxis]
+        shifts = np.arange(num_qubits - 1, -1, -1)
+        zero_bits = ((positions >> shifts) & 1) == 0
+
+        _, qubits = np.nonzero(zero_bits)
+        qubits.setflags(write=False)
+        return tuple(np.split(qubits, np.cumsum(zero_bits.sum(axis=1))[:-1]))
+
+    @staticmethod
+    def pixel_position_int(circuit: QuantumCircuit, pixel_pos: int, num_qubits: int):
+        """
+        Embeds image pixel positions on the qubits
+        from an integer position.
+
+        Args:
+            circuit: input circuit on which pixel
+            position is to be embedded, or a CircuitBuilder
+            that accumulates the X gates.
+
+            pixel_pos (int): pixel position.
+
+            num_qubits (int): number of qubits used
+            for pixel position embedding.
+        """
+        qubits = ImageMixin.position_x_gates(num_qubits)[pixel_pos]
+        if len(qubits):
+            circuit.x(qubits.tolist())
+
     def pixel_value(self, pixel_pos: int):
         """
         Embeds pixel or color values on the qubits.
@@ -56,3 +105,28 @@ class ImageMixin:
         for index, value in enumerate(channel_index_binary):
             if value == "0":
                 circuit.x(index + qubit_padding)
+
+    @staticmethod
+    def channel_index_int(
+        circuit: QuantumCircuit, channel: int, num_qubits: int, qubit_padding: int
+    ):
+        """
+        Embeds channel indices on the qubits
+        from an integer channel index.
+
+        Args:
+            circuit: input circuit on which channel
+            index is to be embedded, or a CircuitBuilder
+            that accumulates the X gates.
+
+            channel (int): channel index.
+
+            num_qubits (int): number of qubits used
+            for channel index embedding.
+
+            qubit_padding (int): index of the first
+            channel index qubit.
+        """
+        qubits = ImageMixin.position_x_gates(num_qubits)[channel]
+        if len(qubits):
+            circuit.x((qubits + qubit_padding).tolist())
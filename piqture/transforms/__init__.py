@@ -12,8 +12,24 @@
 Transforms (module: piqture.data_loader)
 """
 
-from .transforms import MinMaxNormalization
+from .fused import FusedPipeline
+from .patchify import Patchify
+from .projection import IncrementalPCA, LinearProjection, RandomProjection
+from .transforms import (
+    AngleMapping,
+    GlobalMinMaxNormalization,
+    MinMaxNormalization,
+    Quantization,
+)
 
 __all__ = [
     "MinMaxNormalization",
+    "GlobalMinMaxNormalization",
+    "AngleMapping",
+    "Quantization",
+    "LinearProjection",
+    "RandomProjection",
+    "IncrementalPCA",
+    "Patchify",
+    "FusedPipeline",
 ]
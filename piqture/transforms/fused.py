@@ -0,0 +1,168 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Fused execution of transform chains on whole batches."""
+
+from __future__ import annotations
+
+from typing import Callable, Union
+
+import numpy as np
+import torch
+import torchvision
+from torch import Tensor
+
+from piqture.transforms.transforms import (
+    AngleMapping,
+    GlobalMinMaxNormalization,
+    MinMaxNormalization,
+    Quantization,
+)
+
+
+class FusedPipeline:
+    """
+    Runs a chain of transforms on a whole batch in one pass over a
+    single working buffer.
+
+    Recognized steps are ToTensor, Resize, MinMaxNormalization,
+    GlobalMinMaxNormalization, AngleMapping and Quantization. All
+    scalings and offsets between two non-linear steps (clamping,
+    rounding) are folded into one multiply-add. Per-sample
+    MinMaxNormalization only adds one reduction. Resize commutes
+    with these affine maps and runs on the working buffer. Any
+    other transform is called on the whole batch.
+
+    A chain starting with ToTensor takes stacked images of shape
+    (N, H, W) or (N, H, W, C), e.g. ImageArrayDataset.data. Others
+    take batches of shape (N, C, H, W). The result matches applying
+    the chain to every image of the batch.
+    """
+
+    def __init__(self, transforms: Union[torchvision.transforms.Compose, list]):
+        if isinstance(transforms, torchvision.transforms.Compose):
+            transforms = transforms.transforms
+        if not all(callable(transform) for transform in transforms):
+            raise TypeError("The input transforms must be a list of callables.")
+        self.transforms = list(transforms)
+        # Work in the precision of the most precise AngleMapping.
+        self.dtype = max(
+            (
+                transform.dtype
+                for transform in self.transforms
+                if isinstance(transform, AngleMapping)
+            ),
+            key=lambda dtype: dtype.itemsize,
+            default=torch.float32,
+        )
+
+    def __repr__(self):
+        """FusedPipeline transform representation."""
+        steps = ", ".join(repr(transform) for transform in self.transforms)
+        return f"{__class__.__name__}([{steps}])"
+
+    def __call__(self, batch: Union[Tensor, np.ndarray]) -> Tensor:
+        """Applies the chain of transforms to a batch."""
+        batch = torch.as_tensor(batch)
+        transforms = self.transforms
+        scale = 1.0
+        if transforms and isinstance(transforms[0], torchvision.transforms.ToTensor):
+            if batch.dim() not in (3, 4):
+                raise ValueError("The input batch must have the shape (N, H, W[, C]).")
+            # Stacked images to (N, C, H, W), scaled to [0, 1] if uint8.
+            batch = (
+                batch.unsqueeze(1) if batch.dim() == 3 else batch.permute(0, 3, 1, 2)
+            )
+            if batch.dtype == torch.uint8:
+                scale = 1 / 255
+            transforms = transforms[1:]
+
+        # The single working buffer; never a view of the input.
+        buffer = batch.to(self.dtype, copy=True)
+        affine = _Affine(scale, 0.0)
+        for transform in transforms:
+            buffer, affine = self._step(transform, buffer, affine)
+        return affine.apply(buffer)
+
+    @staticmethod
+    def _step(transform: Callable, buffer: Tensor, affine: _Affine) -> tuple:
+        """Applies one transform, deferring affine maps."""
+        if isinstance(transform, AngleMapping):
+            affine = affine.then(
+                transform.scale, transform.min - transform.data_min * transform.scale
+            )
+            # AngleMapping returns its own dtype, also after integer steps.
+            buffer = buffer.to(transform.dtype)
+            return affine.apply(buffer).clamp_(0.0, transform.max), _Affine()
+        if isinstance(transform, GlobalMinMaxNormalization):
+            return buffer, affine.then(
+                transform.scale, transform.min - transform.data_min * transform.scale
+            )
+        if isinstance(transform, MinMaxNormalization):
+            # Bounds of the current values, from one reduction of the buffer.
+            data_min, data_max = torch.aminmax(buffer.flatten(1), dim=1)
+            shape = (len(buffer),) + (1,) * (buffer.dim() - 1)
+            data_min, data_max = (
+                affine.map(bound.reshape(shape)) for bound in (data_min, data_max)
+            )
+            # A decreasing map swaps the bounds.
+            data_min, data_max = (
+                torch.minimum(data_min, data_max),
+                torch.maximum(data_min, data_max),
+            )
+            scale = (transform.max - transform.min) / (data_max - data_min).clamp_min(
+                transform.eps
+            )
+            return buffer, affine.then(scale, transform.min - data_min * scale)
+        if isinstance(transform, Quantization):
+            normalization = transform.normalization
+            affine = affine.then(
+                normalization.scale,
+                normalization.min - normalization.data_min * normalization.scale,
+            )
+            buffer = (
+                affine.apply(buffer).round_().clamp_(0, transform.max_color_intensity)
+            )
+            return buffer.to(torch.uint8), _Affine()
+        if isinstance(transform, torchvision.transforms.Resize):
+            # Interpolation weights sum to one, so resizing commutes
+            # with the deferred affine map.
+            if not torch.is_floating_point(buffer):
+                buffer = buffer.to(torch.float32)
+            return transform(buffer), affine
+        return transform(affine.apply(buffer)), _Affine()
+
+
+class _Affine:
+    """Deferred map x -> x * scale + offset, with per-sample or scalar terms."""
+
+    def __init__(self, scale=1.0, offset=0.0):
+        self.scale = scale
+        self.offset = offset
+
+    def then(self, scale, offset) -> _Affine:
+        """Returns the composition of this map with a following one."""
+        return _Affine(self.scale * scale, self.offset * scale + offset)
+
+    def map(self, values: Tensor) -> Tensor:
+        """Maps values out of place."""
+        return values * self.scale + self.offset
+
+    def apply(self, buffer: Tensor) -> Tensor:
+        """Maps a buffer in place, converting integer buffers to float."""
+        scale = not isinstance(self.scale, (int, float)) or self.scale != 1
+        offset = not isinstance(self.offset, (int, float)) or self.offset != 0
+        if (scale or offset) and not torch.is_floating_point(buffer):
+            buffer = buffer.to(torch.float32)
+        if scale:
+            buffer.mul_(self.scale)
+        if offset:
+            buffer.add_(self.offset)
+        return buffer
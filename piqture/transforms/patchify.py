@@ -0,0 +1,117 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Patch extraction transform for patch-wise circuits."""
+
+from __future__ import annotations
+
+from typing import Union
+
+import torch
+from torch import Tensor
+
+
+def _pair(value: Union[int, tuple[int, int]], name: str) -> tuple[int, int]:
+    """Validates an int or (int, int) input and returns a pair."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = (value, value)
+    if not (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and all(isinstance(size, int) and not isinstance(size, bool) for size in value)
+    ):
+        raise TypeError(f"The input {name} must be of the type int or tuple[int, int].")
+    if min(value) < 1:
+        raise ValueError(f"The input {name} must be positive.")
+    return value
+
+
+class Patchify:
+    """
+    Extracts all (kernel_size, stride) patches of an image or a
+    batch of images, e.g. to encode every window of an image as
+    a small circuit.
+
+    Patches are a strided view of the input, not a copy. A batch
+    of shape (N, C, H, W) gives patches of shape
+    (N, rows, cols, C, kernel_height, kernel_width), and a single
+    image of shape (C, H, W) gives (rows, cols, C, kernel_height,
+    kernel_width). Every patch has the (C, H, W) layout of an image,
+    so patches.flatten(0, 2) can be passed to encode_batches or
+    encode_image as N * rows * cols small images.
+    """
+
+    def __init__(
+        self,
+        kernel_size: Union[int, tuple[int, int]],
+        stride: Union[int, tuple[int, int]] = None,
+    ):
+        self.kernel_size = _pair(kernel_size, "kernel_size")
+        self.stride = self.kernel_size if stride is None else _pair(stride, "stride")
+
+    def __repr__(self):
+        """Patchify transform representation."""
+        return (
+            f"{__class__.__name__}(kernel_size={self.kernel_size}, "
+            f"stride={self.stride})"
+        )
+
+    def grid_size(self, image_size: tuple[int, int]) -> tuple[int, int]:
+        """Returns the number of patch (rows, cols) of an image size."""
+        rows, cols = (
+            (size - kernel) // stride + 1
+            for size, kernel, stride in zip(image_size, self.kernel_size, self.stride)
+        )
+        if min(rows, cols) < 1:
+            raise ValueError(
+                f"The kernel_size {self.kernel_size} does not fit "
+                f"the image size {tuple(image_size)}."
+            )
+        return rows, cols
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Returns the patches of an image or a batch as a view."""
+        data = torch.as_tensor(data)
+        if data.dim() not in (3, 4):
+            raise ValueError("The input data must have the shape ([N,] C, H, W).")
+        self.grid_size(data.shape[-2:])
+        patches = data.unfold(-2, self.kernel_size[0], self.stride[0]).unfold(
+            -2, self.kernel_size[1], self.stride[1]
+        )
+        # (..., C, rows, cols, kh, kw) -> (..., rows, cols, C, kh, kw)
+        return patches.movedim(-5, -3)
+
+    def fold(self, outputs: Tensor, image_size: tuple[int, int]) -> Tensor:
+        """
+        Reassembles per-patch outputs into feature maps, like the
+        output of a convolution.
+
+        Args:
+            outputs (Tensor): outputs of the patches of a batch in
+            patch order, of shape (N * rows * cols, *features) or
+            (N, rows, cols, *features), e.g. one expectation value
+            or a few measured features per patch.
+            image_size (tuple[int, int]): (H, W) of the patched images.
+
+        Returns:
+            Tensor: feature maps of shape (N, F, rows, cols), where
+            F is the number of features per patch.
+        """
+        rows, cols = self.grid_size(image_size)
+        outputs = torch.as_tensor(outputs)
+        if outputs.dim() >= 3 and outputs.shape[1:3] == (rows, cols):
+            outputs = outputs.flatten(0, 2)
+        if len(outputs) % (rows * cols):
+            raise ValueError(
+                f"The number of outputs ({len(outputs)}) must be a multiple "
+                f"of the {rows * cols} patches per image."
+            )
+        features = outputs.reshape(-1, rows, cols, outputs[0].numel())
+        return features.permute(0, 3, 1, 2)
@@ -0,0 +1,269 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Linear dimensionality reduction transforms."""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import torch
+import torch.utils.data
+from torch import Tensor
+
+
+def _check_components(n_components: int):
+    """Validates the n_components input."""
+    if not isinstance(n_components, int) or isinstance(n_components, bool):
+        raise TypeError("The input n_components must be of the type int.")
+    if n_components < 1:
+        raise ValueError("The input n_components must be positive.")
+
+
+class LinearProjection:
+    """
+    Maps flattened images to features with one matrix multiply,
+    features = images @ weight + bias.
+
+    A single image of in_features values is mapped to a vector
+    of out_features values. A batch of shape (N, ...) is mapped
+    to a matrix of shape (N, out_features). A batch of one image
+    has as many values as a single image, so batches that may hold
+    one image, e.g. the last batch of a DataLoader, are projected
+    with project_batch.
+    """
+
+    def __init__(self, weight: Tensor, bias: Optional[Tensor] = None):
+        weight = torch.as_tensor(weight)
+        if weight.dim() != 2:
+            raise ValueError("The input weight must be a matrix.")
+        bias = torch.zeros(weight.shape[1]) if bias is None else torch.as_tensor(bias)
+        if bias.shape != weight.shape[1:]:
+            raise ValueError(
+                f"The input bias must have the shape ({weight.shape[1]},)."
+            )
+        self.weight = weight.float()
+        self.bias = bias.float()
+
+    @property
+    def in_features(self) -> int:
+        """Number of values of an input image."""
+        return self.weight.shape[0]
+
+    @property
+    def out_features(self) -> int:
+        """Number of output features."""
+        return self.weight.shape[1]
+
+    def __repr__(self):
+        """LinearProjection transform representation."""
+        return (
+            f"{__class__.__name__}(in_features={self.in_features}, "
+            f"out_features={self.out_features})"
+        )
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Projects an image or a batch of images."""
+        data = torch.as_tensor(data)
+        if data.numel() == self.in_features:
+            return self.project_batch(data.reshape(1, -1))[0]
+        return self.project_batch(data)
+
+    def project_batch(self, batch: Tensor) -> Tensor:
+        """
+        Projects a batch of images.
+
+        Args:
+            batch (Tensor): batch of shape (N, ...), e.g. (N, C, H, W).
+            The first dimension is the batch, also when N is 1.
+
+        Returns:
+            Tensor: features of shape (N, out_features).
+        """
+        batch = torch.as_tensor(batch).to(self.weight.dtype)
+        return torch.addmm(self.bias, batch.reshape(len(batch), -1), self.weight)
+
+    def save(self, path: str):
+        """Saves the projection matrix and bias to a .npz file."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, weight=self.weight.numpy(), bias=self.bias.numpy())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def load(path: str) -> LinearProjection:
+        """
+        Loads a projection saved with save, e.g. by a fitted
+        IncrementalPCA or a RandomProjection.
+        """
+        with np.load(path) as arrays:
+            weight, bias = (np.asarray(arrays[key]) for key in ("weight", "bias"))
+        return LinearProjection(torch.from_numpy(weight), torch.from_numpy(bias))
+
+
+class RandomProjection(LinearProjection):
+    """
+    Projects images onto n_components random Gaussian directions,
+    which preserves distances between images approximately
+    (Johnson-Lindenstrauss). Needs no fitting.
+    """
+
+    def __init__(self, in_features: int, n_components: int, seed: int = 0):
+        _check_components(n_components)
+        if not isinstance(in_features, int) or in_features < 1:
+            raise ValueError("The input in_features must be a positive int.")
+        self.seed = seed
+        generator = torch.Generator().manual_seed(seed)
+        super().__init__(
+            torch.randn(in_features, n_components, generator=generator)
+            / np.sqrt(n_components)
+        )
+
+    def __repr__(self):
+        """RandomProjection transform representation."""
+        return (
+            f"{__class__.__name__}(in_features={self.in_features}, "
+            f"n_components={self.out_features}, seed={self.seed})"
+        )
+
+
+class IncrementalPCA(LinearProjection):
+    """
+    Projects images onto their first n_components principal
+    components, fitted chunk by chunk.
+
+    Every chunk updates the running mean and scatter matrix of
+    the flattened images, so memory use depends on the number of
+    pixels, not on the number of images. The components are the
+    leading eigenvectors of the scatter matrix.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, n_components: int):
+        _check_components(n_components)
+        self.n_components = n_components
+        self.num_samples = 0
+        self.mean = None
+        self._scatter = None
+        self.explained_variance = None
+        self.weight = None
+        self.bias = None
+
+    def __repr__(self):
+        """IncrementalPCA transform representation."""
+        return f"{__class__.__name__}(n_components={self.n_components})"
+
+    def partial_fit(self, batch: Tensor) -> IncrementalPCA:
+        """Updates the fit with a batch of images of shape (N, ...)."""
+        batch = torch.as_tensor(batch).to(torch.float64)
+        batch = batch.reshape(len(batch), -1)
+        if self.mean is None:
+            if self.n_components > batch.shape[1]:
+                raise ValueError(
+                    f"The input n_components must not exceed the {batch.shape[1]} "
+                    "values of an image."
+                )
+            self.mean = torch.zeros(batch.shape[1], dtype=torch.float64)
+            self._scatter = torch.zeros(
+                batch.shape[1], batch.shape[1], dtype=torch.float64
+            )
+        elif batch.shape[1] != len(self.mean):
+            raise ValueError(
+                f"Images with {batch.shape[1]} values do not match "
+                f"the fitted {len(self.mean)} values."
+            )
+        if len(batch) == 0:
+            return self
+
+        # Merge the chunk mean and scatter matrix (Chan et al.).
+        chunk_mean = batch.mean(dim=0)
+        centered = batch - chunk_mean
+        delta = chunk_mean - self.mean
+        total = self.num_samples + len(batch)
+        self._scatter += centered.T @ centered
+        self._scatter += torch.outer(delta, delta) * (
+            self.num_samples * len(batch) / total
+        )
+        self.mean += delta * (len(batch) / total)
+        self.num_samples = total
+        # The components are solved for once, when they are next used.
+        self.weight = None
+        return self
+
+    def fit(
+        self,
+        data: Union[Tensor, torch.utils.data.Dataset, Iterable],
+        chunk_size: int = 1024,
+    ) -> IncrementalPCA:
+        """
+        Fits the components in one streaming pass, replacing any
+        earlier fit. Use partial_fit to extend a fit instead.
+
+        Args:
+            data: a tensor of images of shape (N, ...), a dataset of
+            (image, label) samples, or an iterable of batches such
+            as a DataLoader. Batches may be (images, labels) pairs.
+            chunk_size (int): number of images per chunk of a tensor
+            or dataset. Defaults to 1024.
+
+        Returns:
+            IncrementalPCA: the fitted transform.
+        """
+        # Start from scratch, the fitted components are replaced below.
+        self.num_samples, self.mean, self._scatter = 0, None, None
+        if isinstance(data, Tensor):
+            chunks = data.split(chunk_size)
+        elif isinstance(data, torch.utils.data.Dataset):
+            chunks = torch.utils.data.DataLoader(data, batch_size=chunk_size)
+        else:
+            chunks = data
+        for chunk in chunks:
+            self.partial_fit(chunk[0] if isinstance(chunk, (tuple, list)) else chunk)
+        self._solve()
+        return self
+
+    def _solve(self):
+        """Computes the projection from the scatter matrix."""
+        if self.num_samples == 0:
+            raise ValueError("IncrementalPCA must be fitted before it is applied.")
+        # pylint: disable-next=not-callable
+        eigenvalues, eigenvectors = torch.linalg.eigh(self._scatter)
+        order = torch.argsort(eigenvalues, descending=True)[: self.n_components]
+        components = eigenvectors[:, order]
+        # Fix the sign of every component, so fits are reproducible.
+        signs = torch.sign(
+            components.gather(0, components.abs().argmax(dim=0, keepdim=True))
+        )
+        components *= torch.where(signs == 0, 1.0, signs)
+        self.explained_variance = eigenvalues[order].clamp(min=0) / max(
+            self.num_samples - 1, 1
+        )
+        self.weight = components.float()
+        self.bias = (-self.mean @ components).float()
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Projects an image or a batch onto the fitted components."""
+        if self.weight is None:
+            self._solve()
+        return super().__call__(data)
+
+    def project_batch(self, batch: Tensor) -> Tensor:
+        """Projects a batch of shape (N, ...) onto the fitted components."""
+        if self.weight is None:
+            self._solve()
+        return super().project_batch(batch)
+
+    def save(self, path: str):
+        """Saves the fitted projection matrix and bias to a .npz file."""
+        if self.weight is None:
+            self._solve()
+        super().save(path)
@@ -10,6 +10,7 @@
 
 """Data transforms for Pytorch datasets."""
 
+import math
 from typing import Union
 
 import torch
@@ -18,10 +19,18 @@ from torch import Tensor
 
 # pylint: disable=too-few-public-methods
 class MinMaxNormalization:
-    """Normalizes input values in range [min, max]."""
+    """
+    Normalizes input values in range [min, max].
+
+    Constant inputs, whose maximum equals their minimum, have
+    their range clamped to eps and are mapped to min.
+    """
 
     def __init__(
-        self, normalize_min: Union[int, float], normalize_max: Union[int, float]
+        self,
+        normalize_min: Union[int, float],
+        normalize_max: Union[int, float],
+        eps: float = 1e-12,
     ):
         # Check if normalize_min and max are int or float.
         if not isinstance(normalize_max, (int, float)) or isinstance(
@@ -34,6 +43,7 @@ class MinMaxNormalization:
             raise TypeError("The input normalize_min must be of the type int or float.")
         self.min = normalize_min
         self.max = normalize_max
+        self.eps = eps
 
     def __repr__(self):
         """MinMaxNormalization transform representation."""
@@ -43,8 +53,217 @@ class MinMaxNormalization:
 
     def __call__(self, data: Tensor) -> Tensor:
         """Normalizes data to a range [min, max]."""
-        return self.min + (
-            (data - torch.min(data))
-            * (self.max - self.min)
-            / (torch.max(data) - torch.min(data))
+        if not torch.is_floating_point(data):
+            data = data.float()
+
+        # Single reduction for both the minimum and the maximum.
+        data_min, data_max = torch.aminmax(data)
+        scale = (self.max - self.min) / (data_max - data_min).clamp_min(self.eps)
+        return (data - data_min).mul_(scale).add_(self.min)
+
+    def normalize_batch(self, batch: Tensor, inplace: bool = False) -> Tensor:
+        """
+        Normalizes every sample of a batch to a range [min, max]
+        with the minimum and maximum of that sample.
+
+        Args:
+            batch (Tensor): batch of shape (N, ...), e.g. (N, C, H, W).
+            inplace (bool): overwrites batch with the result if True.
+            Requires a floating point batch. Defaults to False.
+
+        Returns:
+            Tensor: normalized batch with the shape of the input.
+        """
+        if not torch.is_floating_point(batch):
+            if inplace:
+                raise TypeError(
+                    "In-place normalization requires a floating point batch."
+                )
+            batch = batch.float()
+
+        # Per-sample minimum and maximum in a single reduction,
+        # shaped to broadcast over the remaining dimensions.
+        data_min, data_max = torch.aminmax(batch.reshape(len(batch), -1), dim=1)
+        shape = (len(batch),) + (1,) * (batch.dim() - 1)
+        data_min = data_min.reshape(shape)
+        scale = (self.max - self.min) / (data_max.reshape(shape) - data_min).clamp_min(
+            self.eps
+        )
+
+        if inplace:
+            return batch.sub_(data_min).mul_(scale).add_(self.min)
+        return (batch - data_min).mul_(scale).add_(self.min)
+
+
+class GlobalMinMaxNormalization(MinMaxNormalization):
+    """
+    Normalizes input values in range [min, max] with fixed data
+    bounds, e.g. the minimum and maximum of a whole dataset.
+
+    Unlike MinMaxNormalization, every image is scaled by the same
+    factor, so the contrast between images is preserved.
+    """
+
+    def __init__(
+        self,
+        normalize_min: Union[int, float],
+        normalize_max: Union[int, float],
+        data_min: Union[int, float],
+        data_max: Union[int, float],
+        eps: float = 1e-12,
+    ):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        super().__init__(normalize_min, normalize_max, eps)
+        # Check if data_min and max are int or float.
+        for name, value in (("data_min", data_min), ("data_max", data_max)):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise TypeError(f"The input {name} must be of the type int or float.")
+        if data_max < data_min:
+            raise ValueError("The input data_max must not be less than data_min.")
+        self.data_min = data_min
+        self.data_max = data_max
+        self.scale = (normalize_max - normalize_min) / max(data_max - data_min, eps)
+
+    @classmethod
+    def from_statistics(
+        cls,
+        statistics,
+        normalize_min: Union[int, float],
+        normalize_max: Union[int, float],
+    ) -> "GlobalMinMaxNormalization":
+        """
+        Creates the transform from dataset statistics.
+
+        Args:
+            statistics: object with min and max attributes, e.g.
+            piqture.data_loader.DatasetStatistics.
+            normalize_min (int or float): minimum normalized value.
+            normalize_max (int or float): maximum normalized value.
+        """
+        return cls(
+            normalize_min, normalize_max, float(statistics.min), float(statistics.max)
+        )
+
+    def __repr__(self):
+        """GlobalMinMaxNormalization transform representation."""
+        return (
+            f"{__class__.__name__}(normalize_min={self.min}, normalize_max={self.max}, "
+            f"data_min={self.data_min}, data_max={self.data_max})"
+        )
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Normalizes data to a range [min, max] with the fixed bounds."""
+        if not torch.is_floating_point(data):
+            data = data.float()
+        return (data - self.data_min).mul_(self.scale).add_(self.min)
+
+    def normalize_batch(self, batch: Tensor, inplace: bool = False) -> Tensor:
+        """
+        Normalizes a batch to a range [min, max] with the fixed bounds.
+
+        Args:
+            batch (Tensor): batch of shape (N, ...), e.g. (N, C, H, W).
+            inplace (bool): overwrites batch with the result if True.
+            Requires a floating point batch. Defaults to False.
+
+        Returns:
+            Tensor: normalized batch with the shape of the input.
+        """
+        if inplace:
+            if not torch.is_floating_point(batch):
+                raise TypeError(
+                    "In-place normalization requires a floating point batch."
+                )
+            return batch.sub_(self.data_min).mul_(self.scale).add_(self.min)
+        return self(batch)
+
+
+class AngleMapping(GlobalMinMaxNormalization):
+    """
+    Maps input values in [data_min, data_max] to rotation angles
+    in [0, max_angle], as used by FRQI and AngleEncoding.
+
+    Works on single images and on whole batches. Values outside
+    [data_min, data_max] are clamped.
+    """
+
+    def __init__(
+        self,
+        data_min: Union[int, float] = 0.0,
+        data_max: Union[int, float] = 1.0,
+        max_angle: float = math.pi / 2,
+        dtype: torch.dtype = torch.float64,
+    ):
+        super().__init__(0.0, max_angle, data_min, data_max)
+        if not dtype.is_floating_point:
+            raise TypeError("The input dtype must be a floating point torch.dtype.")
+        self.dtype = dtype
+
+    def __repr__(self):
+        """AngleMapping transform representation."""
+        return (
+            f"{__class__.__name__}(data_min={self.data_min}, data_max={self.data_max}, "
+            f"max_angle={self.max}, dtype={self.dtype})"
+        )
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Maps data to angles in [0, max_angle]."""
+        data = torch.as_tensor(data).to(self.dtype)
+        return super().__call__(data).clamp_(0.0, self.max)
+
+    def normalize_batch(self, batch: Tensor, inplace: bool = False) -> Tensor:
+        """Maps a batch to angles in [0, max_angle]."""
+        if inplace and batch.dtype == self.dtype:
+            return super().normalize_batch(batch, inplace=True).clamp_(0.0, self.max)
+        return self(batch)
+
+
+# pylint: disable=too-few-public-methods
+class Quantization:
+    """
+    Quantizes input values in [data_min, data_max] to integer
+    color intensities in [0, max_color_intensity], as used by
+    NEQR, INEQR and BRQI.
+
+    Works on single images and on whole batches. Values are
+    rounded to the nearest intensity and returned as uint8.
+    """
+
+    def __init__(
+        self,
+        max_color_intensity: int = 255,
+        data_min: Union[int, float] = 0.0,
+        data_max: Union[int, float] = 1.0,
+    ):
+        if not isinstance(max_color_intensity, int) or isinstance(
+            max_color_intensity, bool
+        ):
+            raise TypeError("The input max_color_intensity must be of the type int.")
+        if max_color_intensity < 0 or max_color_intensity > 255:
+            raise ValueError(
+                "Maximum color intensity cannot be less than 0 or greater than 255."
+            )
+        self.max_color_intensity = max_color_intensity
+        self.normalization = GlobalMinMaxNormalization(
+            0, max_color_intensity, data_min, data_max
+        )
+
+    def __repr__(self):
+        """Quantization transform representation."""
+        return (
+            f"{__class__.__name__}(max_color_intensity={self.max_color_intensity}, "
+            f"data_min={self.normalization.data_min}, "
+            f"data_max={self.normalization.data_max})"
+        )
+
+    def __call__(self, data: Tensor) -> Tensor:
+        """Quantizes data to integers in [0, max_color_intensity]."""
+        data = torch.as_tensor(data)
+        if not torch.is_floating_point(data):
+            data = data.float()
+        return (
+            self.normalization(data)
+            .round_()
+            .clamp_(0, self.max_color_intensity)
+            .to(torch.uint8)
         )
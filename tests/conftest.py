@@ -13,6 +13,7 @@
 
 import math
 
+import numpy as np
 import pytest
 from qiskit.circuit import ParameterVector, QuantumCircuit
 
@@ -59,3 +60,27 @@ def parameterization_mapper_fixture():
         return parameterization_mapper
 
     return _mapper
+
+
+def write_idx(path, array: np.ndarray):
+    """Writes a uint8 array to an uncompressed IDX file."""
+    with open(path, "wb") as file:
+        file.write(bytes([0, 0, 0x08, array.ndim]))
+        file.write(np.array(array.shape, dtype=">u4").tobytes())
+        file.write(np.ascontiguousarray(array, dtype=np.uint8).tobytes())
+
+
+@pytest.fixture(name="mnist_idx_dir")
+def mnist_idx_dir_fixture(tmp_path):
+    """Fixture for a directory of small MNIST-like IDX files."""
+    rng = np.random.default_rng(seed=7)
+    for prefix, num_samples in (("train", 60), ("t10k", 20)):
+        write_idx(
+            tmp_path / f"{prefix}-images-idx3-ubyte",
+            rng.integers(0, 256, (num_samples, 28, 28), dtype=np.uint8),
+        )
+        write_idx(
+            tmp_path / f"{prefix}-labels-idx1-ubyte",
+            np.arange(num_samples, dtype=np.uint8) % 10,
+        )
+    return tmp_path
@@ -0,0 +1,104 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for image array datasets"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+from pytest import raises
+
+from piqture.data_loader import ShardSampler
+from piqture.data_loader.array_dataset import ImageArrayDataset
+from piqture.data_loader.idx_dataset import IDXDataset
+
+DATA = np.arange(10 * 3 * 3, dtype=np.uint8).reshape(10, 3, 3)
+TARGETS = np.arange(10) % 4
+
+
+class TestImageArrayDataset:
+    """Tests for ImageArrayDataset class."""
+
+    @pytest.mark.parametrize("index", [4, np.int64(4), np.array(4), torch.tensor(4)])
+    def test_sample(self, index):
+        """Tests that int indices return transformed samples."""
+        dataset = ImageArrayDataset(DATA, TARGETS, transform=torch.from_numpy)
+        image, label = dataset[index]
+        assert isinstance(image, torch.Tensor)
+        assert torch.equal(image, torch.from_numpy(DATA[4]))
+        assert label == 0
+        # Samples are copies, so transforms can write to them.
+        image[0, 0] = 255
+        assert DATA[4, 0, 0] != 255
+
+    def test_slice(self):
+        """Tests that slices return views of the arrays."""
+        dataset = ImageArrayDataset(DATA, TARGETS, transform=torch.from_numpy)
+        images, labels = dataset[2:8:2]
+        assert np.shares_memory(images, DATA)
+        assert np.shares_memory(labels, TARGETS)
+        assert np.array_equal(images, DATA[[2, 4, 6]])
+        assert labels.tolist() == [2, 0, 2]
+
+        images, labels = dataset.get_batch(1, 4)
+        assert np.shares_memory(images, DATA)
+        assert labels.tolist() == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "index", [[7, 1, 3], np.array([7, 1, 3]), torch.tensor([7, 1, 3])]
+    )
+    def test_fancy_index(self, index):
+        """Tests that index arrays gather whole batches."""
+        images, labels = ImageArrayDataset(DATA, TARGETS)[index]
+        assert np.array_equal(images, DATA[[7, 1, 3]])
+        assert labels.tolist() == [3, 1, 3]
+
+    def test_from_dataset(self):
+        """Tests wrapping the arrays of another dataset."""
+
+        # pylint: disable=too-few-public-methods
+        class TensorImages:
+            """Dataset with tensor data and targets, like torchvision's MNIST."""
+
+            data = torch.from_numpy(DATA)
+            targets = torch.from_numpy(TARGETS)
+            classes = ["a", "b", "c", "d"]
+
+        dataset = ImageArrayDataset.from_dataset(TensorImages())
+        assert np.shares_memory(dataset.data, DATA)
+        assert dataset.classes == ["a", "b", "c", "d"]
+        assert dataset[5][1] == 1
+
+    @pytest.mark.parametrize("drop_last, sizes", [(False, [4, 4, 2]), (True, [4, 4])])
+    def test_batch_loader(self, drop_last, sizes):
+        """Tests loading batches with one indexing operation each."""
+        dataset = ImageArrayDataset(DATA, TARGETS)
+        batches = list(dataset.batch_loader(4, drop_last=drop_last))
+
+        assert [len(images) for images, _ in batches] == sizes
+        images = torch.cat([images for images, _ in batches])
+        assert images.dtype == torch.uint8
+        assert torch.equal(images, torch.from_numpy(DATA[: sum(sizes)]))
+
+    def test_batch_loader_sampler(self, mnist_idx_dir):
+        """Tests batch loading of an IDX dataset with a sampler."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        sampler = ShardSampler(dataset, 2, 1, shuffle=True, seed=4)
+        loader = dataset.batch_loader(8, sampler=sampler)
+
+        labels = torch.cat([labels for _, labels in loader])
+        assert labels.tolist() == [dataset[index][1] for index in sampler]
+
+    def test_length_mismatch(self):
+        """Tests images and labels of different lengths."""
+        with raises(ValueError, match=r"No. of images \(10\) and labels \(9\)"):
+            _ = ImageArrayDataset(DATA, TARGETS[:9])
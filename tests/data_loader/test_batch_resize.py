@@ -0,0 +1,125 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for batch resizing"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+import torchvision
+from pytest import raises
+
+from piqture.data_loader import filter_labels, load_mnist_dataset
+from piqture.data_loader.batch_resize import output_size, resize_dataset, resize_images
+from piqture.data_loader.idx_dataset import IDXDataset
+
+IMAGES = np.random.default_rng(seed=3).integers(0, 256, (10, 28, 28), dtype=np.uint8)
+
+
+class TestBatchResize:
+    """Tests for resizing whole image arrays."""
+
+    @pytest.mark.parametrize(
+        "image_size, img_size, expected",
+        [
+            ((28, 28), 4, (4, 4)),
+            ((28, 28), (7, 14), (7, 14)),
+            ((32, 64), 16, (16, 32)),
+            ((64, 32), 16, (32, 16)),
+        ],
+    )
+    def test_output_size(self, image_size, img_size, expected):
+        """Tests the output size of int and tuple sizes."""
+        assert output_size(image_size, img_size) == expected
+
+    @pytest.mark.parametrize("img_size", [4, 7, (14, 4)])
+    def test_area_pooling(self, img_size):
+        """Tests that integer downscales average blocks of pixels."""
+        height, width = output_size((28, 28), img_size)
+        resized = resize_images(IMAGES, img_size, chunk_size=3)
+
+        expected = (
+            IMAGES.reshape(10, height, 28 // height, width, 28 // width).mean(
+                axis=(2, 4)
+            )
+            / 255
+        )
+        assert resized.shape == (10, 1, height, width)
+        assert resized.dtype == np.float32
+        assert np.allclose(resized[:, 0], expected, atol=1e-6)
+
+    @pytest.mark.parametrize("img_size", [8, (5, 9), 32])
+    def test_interpolation(self, img_size):
+        """Tests that other sizes match the per-sample Resize."""
+        transform = torchvision.transforms.Compose(
+            [
+                torchvision.transforms.ToTensor(),
+                torchvision.transforms.Resize(img_size),
+            ]
+        )
+        expected = torch.stack([transform(image) for image in IMAGES]).numpy()
+        assert np.allclose(resize_images(IMAGES, img_size, chunk_size=4), expected)
+
+    def test_channels(self):
+        """Tests that channels of HWC images come first."""
+        images = np.stack([IMAGES, 255 - IMAGES], axis=-1)
+        resized = resize_images(images, 14)
+        assert resized.shape == (10, 2, 14, 14)
+        assert np.allclose(resized[:, 1], 1 - resized[:, 0], atol=1e-6)
+
+    def test_images_input(self):
+        """Tests the shape of the images input."""
+        with raises(ValueError, match=r"must have the shape \(N, H, W\[, C\]\)."):
+            _ = resize_images(IMAGES[0], 4)
+
+    def test_resize_dataset(self, mnist_idx_dir):
+        """Tests resizing an IDX dataset."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        resized = resize_dataset(dataset, 4, transform=torch.from_numpy)
+
+        image, label = resized[5]
+        assert isinstance(image, torch.Tensor)
+        assert image.shape == (1, 4, 4)
+        assert label == dataset[5][1]
+        with raises(TypeError, match="requires a dataset with a data array."):
+            _ = resize_dataset(torch.utils.data.TensorDataset(torch.ones(2)), 4)
+
+    def test_resize_subset(self, mnist_idx_dir):
+        """Tests that only the images of a subset are resized."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        resized = resize_dataset(filter_labels(dataset, [3, 7]), 4)
+
+        indices = np.flatnonzero(np.isin(dataset.targets, [3, 7]))
+        assert resized.data.shape == (12, 1, 4, 4)
+        assert np.array_equal(resized.targets, dataset.targets[indices])
+        assert np.array_equal(resized.data, resize_images(dataset.data[indices], 4))
+
+    @pytest.mark.parametrize("img_size", [4, 8])
+    def test_load_mnist_dataset(self, mnist_idx_dir, img_size):
+        """Tests batch resizing in load_mnist_dataset."""
+        train, test = load_mnist_dataset(
+            img_size=img_size,
+            batch_size=16,
+            labels=[1, 2],
+            normalize_min=0,
+            normalize_max=1,
+            root=str(mnist_idx_dir),
+            download=False,
+            batch_resize=True,
+        )
+        # Only the images with the desired labels are resized.
+        assert train.dataset.data.shape == (12, 1, img_size, img_size)
+        images, labels = next(iter(train))
+        assert images.shape == (12, 1, img_size, img_size)
+        assert set(labels.tolist()) == {1, 2}
+        assert torch.allclose(images.amax(dim=(1, 2, 3)), torch.ones(12))
+        assert len(next(iter(test))[0]) == 4
@@ -0,0 +1,130 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for the dataset-to-circuit pipeline"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+import torch.utils.data
+from qiskit.circuit import QuantumCircuit
+
+from piqture.data_loader import encode_batches, encode_image, image_pixel_vals
+from piqture.embeddings import AngleEncoding
+from piqture.embeddings.image_embeddings import BRQI, FRQI, INEQR, NEQR
+from piqture.transforms import AngleMapping, Quantization
+
+
+@pytest.fixture(name="images")
+def images_fixture():
+    """Random images of shape (6, 1, 2, 2) in [0, 1]."""
+    return torch.rand(6, 1, 2, 2, generator=torch.Generator().manual_seed(0))
+
+
+class TestImagePixelVals:
+    """Tests for image_pixel_vals function."""
+
+    @pytest.mark.parametrize(
+        "embedding_cls, output",
+        [
+            (FRQI, [[0, 1, 2, 3, 4, 5, 6, 7]]),
+            (NEQR, [[0, 1, 2, 3, 4, 5, 6, 7]]),
+            (INEQR, [[[0, 1, 2, 3], [4, 5, 6, 7]]]),
+            (AngleEncoding, [[0, 1], [2, 3], [4, 5], [6, 7]]),
+        ],
+    )
+    def test_layout(self, embedding_cls, output):
+        """Tests the pixel_vals layout of every embedding."""
+        image = torch.arange(8).reshape(1, 2, 4)
+        assert image_pixel_vals(embedding_cls, image) == output
+
+    def test_channels(self):
+        """Tests one pixel list per channel for 2D and multi-channel images."""
+        assert image_pixel_vals(FRQI, torch.arange(4).reshape(2, 2)) == [[0, 1, 2, 3]]
+        assert image_pixel_vals(FRQI, torch.arange(8).reshape(2, 2, 2)) == [
+            [0, 1, 2, 3],
+            [4, 5, 6, 7],
+        ]
+
+
+class TestEncodeImage:
+    """Tests for encode_image function."""
+
+    @pytest.mark.parametrize(
+        "embedding_cls, build",
+        [
+            (FRQI, lambda pixel_vals: FRQI((2, 2), pixel_vals).frqi()),
+            (NEQR, lambda pixel_vals: NEQR((2, 2), pixel_vals, 3).neqr()),
+            (BRQI, lambda pixel_vals: BRQI((2, 2), pixel_vals, 3).brqi()),
+        ],
+    )
+    def test_matches_embedding(self, embedding_cls, build):
+        """Tests that encode_image builds the embedding circuit."""
+        image = torch.tensor([[[0, 1], [2, 3]]])
+        kwargs = {} if embedding_cls is FRQI else {"max_color_intensity": 3}
+        assert encode_image(embedding_cls, image, **kwargs) == build([[0, 1, 2, 3]])
+
+    def test_angle_encoding(self):
+        """Tests AngleEncoding, which builds its circuit on init."""
+        circuit = encode_image(AngleEncoding, torch.full((1, 2, 2), 0.5))
+        assert circuit.num_qubits == 4
+        assert circuit.count_ops() == {"ry": 4}
+
+
+class TestEncodeBatches:
+    """Tests for encode_batches function."""
+
+    def test_encode(self, images):
+        """Tests encoding batches with a batch transform."""
+        loader = torch.utils.data.DataLoader(
+            torch.utils.data.TensorDataset(images, torch.arange(6)), batch_size=4
+        )
+        batches = list(encode_batches(loader, FRQI, transform=AngleMapping()))
+
+        assert [len(circuits) for circuits, _ in batches] == [4, 2]
+        assert torch.equal(
+            torch.cat([labels for _, labels in batches]), torch.arange(6)
+        )
+        circuits = [circuit for batch, _ in batches for circuit in batch]
+        angles = AngleMapping()(images)
+        for circuit, image in zip(circuits, angles):
+            assert circuit == FRQI((2, 2), image.reshape(1, -1).tolist()).frqi()
+
+    def test_circuit_builder(self, images):
+        """Tests that the circuit builder is applied to every circuit."""
+        loader = [(images[:3], torch.zeros(3))]
+        circuits, _ = next(
+            encode_batches(
+                loader,
+                NEQR,
+                transform=Quantization(15),
+                circuit_builder=lambda circuit: circuit.measure_all(inplace=False),
+                max_color_intensity=15,
+            )
+        )
+        assert all(isinstance(circuit, QuantumCircuit) for circuit in circuits)
+        assert all(circuit.count_ops()["measure"] == 6 for circuit in circuits)
+
+    def test_lazy(self, images):
+        """Tests that batches are read only on demand."""
+        consumed = []
+
+        def loader():
+            for index in range(3):
+                consumed.append(index)
+                yield images[2 * index : 2 * index + 2], torch.zeros(2)
+
+        pipeline = encode_batches(loader(), FRQI, transform=AngleMapping())
+        assert not consumed
+        _ = next(pipeline)
+        assert consumed == [0]
+        _ = next(pipeline)
+        assert consumed == [0, 1]
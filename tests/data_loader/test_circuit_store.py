@@ -0,0 +1,173 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for the QPY circuit store"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+import torch.utils.data
+import torchvision
+from pytest import raises
+from qiskit.quantum_info import Statevector
+
+from piqture.data_loader import (
+    CircuitStore,
+    ImageArrayDataset,
+    encode_dataset,
+    encode_image,
+    filter_labels,
+    synthetic_dataset,
+    synthetic_images,
+)
+from piqture.data_loader.circuit_store import dataset_fingerprint
+from piqture.embeddings.image_embeddings import FRQI, NEQR
+from piqture.transforms import AngleMapping, Quantization
+
+
+@pytest.fixture(name="dataset")
+def dataset_fixture():
+    """Dataset of 7 random (1, 2, 2) images with labels 0..6."""
+    images = torch.rand(7, 1, 2, 2, generator=torch.Generator().manual_seed(0))
+    return torch.utils.data.TensorDataset(images, torch.arange(7))
+
+
+class TestEncodeDataset:
+    """Tests for encode_dataset function."""
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_random_access(self, dataset, tmp_path, workers):
+        """Tests that every stored circuit matches a fresh encoding."""
+        store = encode_dataset(
+            dataset,
+            FRQI,
+            str(tmp_path),
+            workers=workers,
+            shard_size=3,
+            transform=AngleMapping(),
+        )
+        assert len(store) == 7
+        assert sorted(path.name for path in tmp_path.glob("*.qpy")) == [
+            "shard-00000.qpy",
+            "shard-00001.qpy",
+            "shard-00002.qpy",
+        ]
+        for index in (6, 0, 4):
+            circuit, label = store[index]
+            expected = encode_image(FRQI, AngleMapping()(dataset[index][0]))
+            assert label == index
+            assert Statevector(circuit).equiv(Statevector(expected))
+
+    def test_embedding_kwargs(self, dataset, tmp_path):
+        """Tests passing embedding arguments."""
+        store = encode_dataset(
+            dataset,
+            NEQR,
+            str(tmp_path),
+            transform=Quantization(3),
+            max_color_intensity=3,
+        )
+        circuit, _ = store[2]
+        expected = encode_image(
+            NEQR, Quantization(3)(dataset[2][0]), max_color_intensity=3
+        )
+        assert circuit.num_qubits == 4
+        assert Statevector(circuit).equiv(Statevector(expected))
+
+    def test_reuse(self, dataset, tmp_path, monkeypatch):
+        """Tests that a complete store is reused and a changed one re-encoded."""
+        encode_dataset(dataset, FRQI, str(tmp_path), transform=AngleMapping())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-encoded")
+
+        monkeypatch.setattr("piqture.data_loader.circuit_store._encode_shard", fail)
+        store = encode_dataset(dataset, FRQI, str(tmp_path), transform=AngleMapping())
+        assert isinstance(store, CircuitStore)
+        assert len(CircuitStore(str(tmp_path))) == 7
+
+        with raises(AssertionError, match="re-encoded"):
+            encode_dataset(
+                dataset, FRQI, str(tmp_path), shard_size=2, transform=AngleMapping()
+            )
+
+    def test_changed_dataset(self, tmp_path):
+        """Tests that other images of the same size are re-encoded."""
+        kwargs = {"img_size": 2, "transform": torch.from_numpy}
+        first = synthetic_dataset(4, seed=0, **kwargs)
+        second = synthetic_dataset(4, seed=5, **kwargs)
+        encode_dataset(first, FRQI, str(tmp_path), transform=AngleMapping(0, 255))
+        store = encode_dataset(
+            second, FRQI, str(tmp_path), transform=AngleMapping(0, 255)
+        )
+        expected = encode_image(FRQI, AngleMapping(0, 255)(second[0][0]))
+        assert Statevector(store[0][0]).equiv(Statevector(expected))
+
+    def test_changed_transform(self, tmp_path):
+        """Tests that a change of the dataset transform is re-encoded."""
+        images, labels = synthetic_images(4, img_size=8)
+
+        def resized(img_size):
+            transform = torchvision.transforms.Compose(
+                [
+                    torchvision.transforms.ToTensor(),
+                    torchvision.transforms.Resize(img_size),
+                ]
+            )
+            return ImageArrayDataset(images, labels, transform=transform)
+
+        store = encode_dataset(resized(4), FRQI, str(tmp_path))
+        assert store[0][0].num_qubits == 5
+        store = encode_dataset(resized(2), FRQI, str(tmp_path))
+        assert store[0][0].num_qubits == 3
+
+    def test_subset_fingerprint(self):
+        """Tests that subsets are hashed without loading their samples."""
+        calls = []
+
+        def transform(image):
+            calls.append(image)
+            return image
+
+        images, labels = synthetic_images(20, img_size=2)
+        dataset = ImageArrayDataset(images, labels % 2, transform=transform)
+        first, second = (filter_labels(dataset, [label]) for label in (0, 1))
+        assert len(first) == len(second)
+        assert dataset_fingerprint(first) != dataset_fingerprint(second)
+        assert dataset_fingerprint(first) == dataset_fingerprint(
+            torch.utils.data.Subset(dataset, np.flatnonzero(labels % 2 == 0))
+        )
+        assert not calls
+
+    def test_stale_shards(self, dataset, tmp_path):
+        """Tests that shards of an earlier, larger store are removed."""
+        encode_dataset(dataset, FRQI, str(tmp_path), shard_size=2)
+        subset = torch.utils.data.Subset(dataset, range(3))
+        store = encode_dataset(subset, FRQI, str(tmp_path), shard_size=2)
+        assert len(store) == 3
+        assert sorted(path.name for path in tmp_path.glob("*.qpy")) == [
+            "shard-00000.qpy",
+            "shard-00001.qpy",
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"workers": -1}, "The input workers must be a non-negative int."),
+            ({"workers": True}, "The input workers must be a non-negative int."),
+            ({"shard_size": 0}, "The input shard_size must be a positive int."),
+        ],
+    )
+    def test_invalid_inputs(self, dataset, tmp_path, kwargs, message):
+        """Tests invalid inputs."""
+        with raises(ValueError, match=message):
+            _ = encode_dataset(dataset, FRQI, str(tmp_path), **kwargs)
@@ -0,0 +1,53 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for collate functions"""
+
+from __future__ import annotations
+
+import pickle
+
+import torch
+from pytest import raises
+
+from piqture.data_loader import NormalizingCollate
+from piqture.transforms import MinMaxNormalization
+
+
+class TestNormalizingCollate:
+    """Tests for NormalizingCollate class."""
+
+    def test_normalization_type(self):
+        """Tests the type of normalization input."""
+        with raises(
+            TypeError,
+            match="The input normalization must be of the type MinMaxNormalization.",
+        ):
+            _ = NormalizingCollate((0, 1))
+
+    def test_collate(self):
+        """Tests that samples are stacked and normalized per sample."""
+        normalization = MinMaxNormalization(0, 1)
+        samples = [(torch.rand(1, 4, 4) * 5, label) for label in range(3)]
+        images, labels = NormalizingCollate(normalization)(samples)
+
+        assert images.shape == (3, 1, 4, 4)
+        assert torch.equal(labels, torch.tensor([0, 1, 2]))
+        for image, (sample, _) in zip(images, samples):
+            assert torch.allclose(image, normalization(sample))
+
+    def test_pickle(self):
+        """Tests that the collate function can be sent to workers."""
+        collate = pickle.loads(
+            pickle.dumps(NormalizingCollate(MinMaxNormalization(0, 1)))
+        )
+        assert repr(collate) == (
+            "NormalizingCollate(MinMaxNormalization(normalize_min=0, normalize_max=1))"
+        )
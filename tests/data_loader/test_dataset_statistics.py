@@ -0,0 +1,138 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for dataset statistics"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+import torch.utils.data
+from pytest import raises
+
+from piqture.data_loader import (
+    DatasetStatistics,
+    compute_statistics,
+    load_or_compute_statistics,
+)
+
+
+@pytest.fixture(name="images")
+def images_fixture():
+    """Random images of shape (50, 1, 3, 3) in [0, 1]."""
+    return torch.rand(50, 1, 3, 3, generator=torch.Generator().manual_seed(0))
+
+
+@pytest.fixture(name="dataset")
+def dataset_fixture(images):
+    """Dataset of (image, label) samples."""
+    return torch.utils.data.TensorDataset(images, torch.zeros(len(images)))
+
+
+class TestComputeStatistics:
+    """Tests for compute_statistics function."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 50, 128])
+    def test_statistics(self, images, dataset, chunk_size):
+        """Tests that chunked statistics match the whole-array statistics."""
+        statistics = compute_statistics(dataset, bins=4, chunk_size=chunk_size)
+        array = images.double().numpy()
+
+        assert statistics.count == array.size
+        assert statistics.min == pytest.approx(array.min())
+        assert statistics.max == pytest.approx(array.max())
+        assert statistics.mean == pytest.approx(array.mean())
+        assert statistics.std == pytest.approx(array.std())
+
+        expected = np.apply_along_axis(
+            lambda values: np.histogram(values, bins=4, range=(0, 1))[0], 0, array
+        )
+        assert statistics.histogram.shape == (1, 3, 3, 4)
+        assert np.array_equal(statistics.histogram, np.moveaxis(expected, 0, -1))
+
+    def test_out_of_range(self):
+        """Tests that values outside value_range land in the edge bins."""
+        dataset = torch.utils.data.TensorDataset(
+            torch.Tensor([[-1.0], [0.2], [3.0]]), torch.zeros(3)
+        )
+        statistics = compute_statistics(dataset, bins=2)
+        assert statistics.histogram.tolist() == [[2, 1]]
+        assert (statistics.min, statistics.max) == (-1.0, 3.0)
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"bins": 0}, "The input bins must be a positive int."),
+            ({"chunk_size": 0}, "The input chunk_size must be a positive int."),
+            ({"value_range": (1, 0)}, "The input value_range must be an increasing"),
+        ],
+    )
+    def test_invalid_inputs(self, dataset, kwargs, message):
+        """Tests invalid inputs."""
+        with raises(ValueError, match=message):
+            _ = compute_statistics(dataset, **kwargs)
+
+    def test_empty_dataset(self):
+        """Tests that an empty dataset is rejected."""
+        with raises(ValueError, match="empty dataset"):
+            _ = compute_statistics(torch.utils.data.TensorDataset(torch.zeros(0, 2)))
+
+
+class TestDatasetStatistics:
+    """Tests for DatasetStatistics class."""
+
+    def test_shape_mismatch(self):
+        """Tests that images of a different shape are rejected."""
+        with raises(ValueError, match="does not match"):
+            DatasetStatistics((2, 2), 4, (0, 1)).update(torch.zeros(3, 3, 3))
+
+    def test_save_load(self, dataset, tmp_path):
+        """Tests that saved statistics load unchanged."""
+        statistics = compute_statistics(dataset, bins=8)
+        statistics.save(str(tmp_path / "stats.npz"))
+        loaded = DatasetStatistics.load(str(tmp_path / "stats.npz"))
+
+        assert repr(loaded) == repr(statistics)
+        assert np.array_equal(loaded.histogram, statistics.histogram)
+        assert np.array_equal(loaded.bin_edges, statistics.bin_edges)
+
+
+class TestLoadOrComputeStatistics:
+    """Tests for load_or_compute_statistics function."""
+
+    def test_cache(self, dataset, tmp_path, monkeypatch):
+        """Tests that cached statistics are reused."""
+        statistics = load_or_compute_statistics(
+            dataset, str(tmp_path), "data", {"a": 1}, bins=4
+        )
+        assert len(list(tmp_path.glob("data-*.stats.npz"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("statistics recomputed")
+
+        monkeypatch.setattr(
+            "piqture.data_loader.dataset_statistics.compute_statistics", fail
+        )
+        cached = load_or_compute_statistics(
+            dataset, str(tmp_path), "data", {"a": 1}, bins=4
+        )
+        assert repr(cached) == repr(statistics)
+
+        with raises(AssertionError, match="statistics recomputed"):
+            _ = load_or_compute_statistics(
+                dataset, str(tmp_path), "data", {"a": 1}, bins=8
+            )
+
+    def test_params(self, dataset, tmp_path):
+        """Tests that different parameters select different entries."""
+        for params in ({"a": 1}, {"a": 2}):
+            _ = load_or_compute_statistics(dataset, str(tmp_path), "data", params)
+        assert len(list(tmp_path.glob("data-*.stats.npz"))) == 2
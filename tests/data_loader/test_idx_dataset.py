@@ -0,0 +1,89 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for IDX datasets"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+import torch
+from pytest import raises
+
+from piqture.data_loader import load_mnist_dataset
+from piqture.data_loader.idx_dataset import IDXDataset, read_idx
+
+
+class TestIDXDataset:
+    """Tests for memory-mapped IDX datasets."""
+
+    def test_read_idx(self, mnist_idx_dir):
+        """Tests the shape and type of a mapped IDX file."""
+        images = read_idx(mnist_idx_dir / "train-images-idx3-ubyte")
+        assert isinstance(images, np.memmap)
+        assert images.shape == (60, 28, 28)
+        assert images.dtype == np.uint8
+        assert not images.flags.writeable
+
+    def test_read_idx_invalid(self, tmp_path):
+        """Tests that non-IDX files are rejected."""
+        path = tmp_path / "invalid"
+        path.write_bytes(b"\x1f\x8b\x08\x00")
+        with raises(ValueError, match="is not an uncompressed IDX file."):
+            _ = read_idx(path)
+
+    @pytest.mark.parametrize("train, num_samples", [(True, 60), (False, 20)])
+    def test_mnist(self, mnist_idx_dir, train, num_samples):
+        """Tests samples and zero-copy batches of an MNIST split."""
+        dataset = IDXDataset.mnist(mnist_idx_dir, train=train)
+        assert len(dataset) == num_samples
+
+        image, label = dataset[3]
+        assert image.shape == (28, 28)
+        assert label == 3
+
+        images, labels = dataset.get_batch(10, 15)
+        assert np.shares_memory(images, dataset.data)
+        assert labels.tolist() == [0, 1, 2, 3, 4]
+
+    def test_mnist_torchvision_layout(self, mnist_idx_dir):
+        """Tests that files are found under the torchvision raw directory."""
+        raw_dir = mnist_idx_dir / "MNIST" / "raw"
+        raw_dir.mkdir(parents=True)
+        for path in list(mnist_idx_dir.glob("*-ubyte")):
+            path.rename(raw_dir / path.name)
+        assert len(IDXDataset.mnist(mnist_idx_dir)) == 60
+
+    def test_mnist_missing(self, tmp_path):
+        """Tests missing IDX files."""
+        with raises(FileNotFoundError, match="train-images-idx3-ubyte not found"):
+            _ = IDXDataset.mnist(tmp_path)
+
+    def test_pickle(self, mnist_idx_dir):
+        """Tests that pickled datasets re-map the files."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        assert "data" not in dataset.__getstate__()
+
+        restored = pickle.loads(pickle.dumps(dataset))
+        assert isinstance(restored.data, np.memmap)
+        assert np.array_equal(restored.data, dataset.data)
+
+    def test_load_mnist_dataset_offline(self, mnist_idx_dir):
+        """Tests the offline mode of load_mnist_dataset."""
+        train, test = load_mnist_dataset(
+            img_size=8, root=str(mnist_idx_dir), download=False
+        )
+        assert (len(train), len(test)) == (60, 20)
+
+        image, _ = train[0]
+        assert isinstance(image, torch.Tensor)
+        assert image.shape == (1, 8, 8)
@@ -0,0 +1,66 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for label-indexed datasets"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from piqture.data_loader import load_mnist_dataset
+from piqture.data_loader.idx_dataset import IDXDataset
+from piqture.data_loader.label_index import filter_labels, label_indices
+
+
+class TestLabelIndex:
+    """Tests for label-indexed datasets."""
+
+    @pytest.mark.parametrize(
+        "targets",
+        [
+            [3, 1, 3, 0, 1, 3],
+            np.array([3, 1, 3, 0, 1, 3]),
+            torch.tensor([3, 1, 3, 0, 1, 3]),
+        ],
+    )
+    def test_label_indices(self, targets):
+        """Tests the per-label index arrays."""
+        index = label_indices(targets)
+        assert list(index) == [0, 1, 3]
+        assert index[0].tolist() == [3]
+        assert index[1].tolist() == [1, 4]
+        assert index[3].tolist() == [0, 2, 5]
+
+    @pytest.mark.parametrize("labels", [[1, 7], [7, 1], [1, 11]])
+    def test_filter_labels(self, mnist_idx_dir, labels):
+        """Tests that only samples with the desired labels are kept, in order."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        subset = filter_labels(dataset, labels)
+
+        targets = np.asarray(dataset.targets)
+        expected = [index for index, label in enumerate(targets) if label in labels]
+        assert subset.indices == expected
+        assert all(subset[index][1] in labels for index in range(len(subset)))
+
+    def test_load_mnist_dataset_labels(self, mnist_idx_dir):
+        """Tests batches of label-filtered DataLoaders."""
+        train, _ = load_mnist_dataset(
+            img_size=4,
+            batch_size=4,
+            labels=[2, 5],
+            root=str(mnist_idx_dir),
+            download=False,
+        )
+        batches = list(train)
+        # 12 of the 60 samples have label 2 or 5.
+        assert [len(labels) for _, labels in batches] == [4, 4, 4]
+        assert all(set(labels.tolist()) <= {2, 5} for _, labels in batches)
@@ -0,0 +1,191 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for local dataset loaders"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from pytest import raises
+
+from piqture.data_loader import ImageArrayDataset, load_local_dataset, register_dataset
+from piqture.data_loader.local_datasets import DATASET_READERS
+
+
+@pytest.fixture(name="cifar_dir")
+def cifar_dir_fixture(tmp_path):
+    """Fixture for a small CIFAR-10 directory with 2 training batches."""
+    directory = tmp_path / "cifar-10-batches-py"
+    directory.mkdir()
+    rng = np.random.default_rng(seed=3)
+    batches = {"data_batch_1": 4, "data_batch_2": 3, "test_batch": 2}
+    for extra in range(3, 6):
+        batches[f"data_batch_{extra}"] = 0
+    for name, num_samples in batches.items():
+        batch = {
+            b"data": rng.integers(0, 256, (num_samples, 3072), dtype=np.uint8),
+            b"labels": rng.integers(0, 10, num_samples).tolist(),
+        }
+        with open(directory / name, "wb") as file:
+            pickle.dump(batch, file)
+    return tmp_path
+
+
+@pytest.fixture(name="image_folder")
+def image_folder_fixture(tmp_path):
+    """Fixture for an image folder with two classes of 4x4 RGB PNGs."""
+    rng = np.random.default_rng(seed=5)
+    for split, num_images in (("train", 3), ("test", 1)):
+        for name in ("dog", "cat"):
+            (tmp_path / split / name).mkdir(parents=True)
+            for index in range(num_images):
+                array = rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)
+                Image.fromarray(array).save(tmp_path / split / name / f"{index}.png")
+    (tmp_path / "train" / "cat" / "notes.txt").write_text("not an image")
+    return tmp_path
+
+
+class TestImageArrayDataset:
+    """Tests for ImageArrayDataset class."""
+
+    def test_length_mismatch(self):
+        """Tests that images and labels must have the same length."""
+        with raises(ValueError, match=r"No. of images \(2\) and labels \(3\)"):
+            _ = ImageArrayDataset(np.zeros((2, 4, 4), np.uint8), np.zeros(3))
+
+    def test_getitem(self):
+        """Tests that samples are writable copies passed to the transform."""
+        data = np.arange(32, dtype=np.uint8).reshape(2, 4, 4)
+        data.flags.writeable = False
+        dataset = ImageArrayDataset(data, np.array([3, 4]), transform=lambda x: x * 2)
+        image, label = dataset[1]
+        assert label == 4
+        assert np.array_equal(image, data[1] * 2)
+
+
+class TestLoadLocalDataset:
+    """Tests for load_local_dataset function."""
+
+    def test_unknown_dataset(self, tmp_path):
+        """Tests an unregistered dataset name."""
+        with raises(ValueError, match="Unknown dataset svhn. Registered datasets: "):
+            _ = load_local_dataset("svhn", str(tmp_path))
+
+    def test_fashion_mnist(self, mnist_idx_dir, tmp_path):
+        """Tests reading Fashion-MNIST from the torchvision directory layout."""
+        files = [path for path in mnist_idx_dir.iterdir() if path.is_file()]
+        raw_dir = tmp_path / "fashion" / "FashionMNIST" / "raw"
+        raw_dir.mkdir(parents=True)
+        for path in files:
+            (raw_dir / path.name).write_bytes(path.read_bytes())
+
+        train, test = load_local_dataset(
+            "fashion_mnist", str(tmp_path / "fashion"), img_size=8
+        )
+        assert (len(train), len(test)) == (60, 20)
+        assert train[0][0].shape == (1, 8, 8)
+
+    def test_cifar10(self, cifar_dir):
+        """Tests reading CIFAR-10 batches into HWC uint8 arrays."""
+        train, test = load_local_dataset("cifar10", str(cifar_dir))
+        assert (len(train), len(test)) == (7, 2)
+        assert train.data.shape == (7, 32, 32, 3)
+        assert train.data.dtype == np.uint8
+
+        with open(cifar_dir / "cifar-10-batches-py" / "data_batch_2", "rb") as file:
+            batch = pickle.load(file)
+        row = batch[b"data"][1]
+        assert np.array_equal(train.data[5], row.reshape(3, 32, 32).transpose(1, 2, 0))
+        assert train.targets[5] == batch[b"labels"][1]
+        assert torch.allclose(
+            train[5][0], torch.from_numpy(row.reshape(3, 32, 32)) / 255
+        )
+
+    def test_image_folder(self, image_folder):
+        """Tests reading a folder of images with batches and labels."""
+        train, _ = load_local_dataset("image_folder", str(image_folder))
+        assert train.classes == ["cat", "dog"]
+        assert train.targets.tolist() == [0, 0, 0, 1, 1, 1]
+        with Image.open(image_folder / "train" / "dog" / "2.png") as image:
+            assert np.array_equal(train.data[5], np.asarray(image))
+
+        train, test = load_local_dataset(
+            "image_folder",
+            str(image_folder),
+            img_size=2,
+            batch_size=2,
+            labels=[1],
+            normalize_min=0,
+            normalize_max=1,
+        )
+        images, labels = next(iter(train))
+        assert images.shape == (2, 3, 2, 2)
+        assert labels.tolist() == [1, 1]
+        assert len(test.dataset) == 1
+
+    def test_image_sizes(self, image_folder):
+        """Tests that images of different sizes are rejected."""
+        Image.new("RGB", (5, 5)).save(image_folder / "train" / "dog" / "big.png")
+        with raises(ValueError, match="All images must have the shape"):
+            _ = load_local_dataset("image_folder", str(image_folder))
+
+    def test_register_dataset(self, monkeypatch):
+        """Tests registering a custom dataset reader."""
+        monkeypatch.setattr(
+            "piqture.data_loader.local_datasets.DATASET_READERS", dict(DATASET_READERS)
+        )
+
+        @register_dataset("constant")
+        def read_constant(root, train, transform):
+            # pylint: disable=unused-argument
+            size = 4 if train else 2
+            return ImageArrayDataset(
+                np.full((size, 2, 2), 255, np.uint8), np.arange(size), transform
+            )
+
+        train, test = load_local_dataset("constant", "unused", batch_size=2)
+        assert read_constant is not None
+        assert [len(batch) for batch, _ in train] == [2, 2]
+        assert len(test.dataset) == 2
+
+    @pytest.mark.parametrize("batch_resize", [False, True])
+    def test_single_build(self, monkeypatch, batch_resize):
+        """Tests that global normalization builds every split only once."""
+        monkeypatch.setattr(
+            "piqture.data_loader.local_datasets.DATASET_READERS", dict(DATASET_READERS)
+        )
+        calls = []
+
+        @register_dataset("counted")
+        def read_counted(root, train, transform):
+            # pylint: disable=unused-argument
+            calls.append(train)
+            data = np.arange(4 * 4 * 4, dtype=np.uint8).reshape(4, 4, 4) * 3
+            return ImageArrayDataset(data, np.arange(4), transform)
+
+        train, _ = load_local_dataset(
+            "counted",
+            "unused",
+            img_size=2,
+            normalize_min=0,
+            normalize_max=1,
+            normalize_global=True,
+            batch_resize=batch_resize,
+        )
+        assert read_counted is not None
+        assert sorted(calls) == [False, True]
+        images = torch.stack([train[index][0] for index in range(4)])
+        assert images.amin() == 0
+        assert torch.isclose(images.amax(), torch.tensor(1.0))
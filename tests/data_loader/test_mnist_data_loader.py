@@ -0,0 +1,226 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for MNIST data loader"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+import torch
+from pytest import raises
+from torchvision import datasets
+
+from piqture.data_loader import load_mnist_dataset
+
+
+class TestLoadMNISTDataset:
+    """Tests for load_mnist_dataset function."""
+
+    @pytest.mark.parametrize("num_workers", [1.5, "2", True])
+    def test_num_workers_type(self, mnist_idx_dir, num_workers):
+        """Tests the type of num_workers input."""
+        with raises(TypeError, match="The input num_workers must be of the type int."):
+            _ = load_mnist_dataset(
+                root=str(mnist_idx_dir), download=False, num_workers=num_workers
+            )
+
+    @pytest.mark.parametrize(
+        "num_workers, persistent_workers, prefetch_factor, message",
+        [
+            (-1, False, None, "The input num_workers must be non-negative."),
+            (0, True, None, "require num_workers > 0."),
+            (0, False, 4, "require num_workers > 0."),
+        ],
+    )
+    def test_worker_options(
+        self, mnist_idx_dir, num_workers, persistent_workers, prefetch_factor, message
+    ):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """Tests invalid combinations of worker options."""
+        with raises(ValueError, match=message):
+            _ = load_mnist_dataset(
+                root=str(mnist_idx_dir),
+                download=False,
+                num_workers=num_workers,
+                persistent_workers=persistent_workers,
+                prefetch_factor=prefetch_factor,
+            )
+
+    def test_workers(self, mnist_idx_dir):
+        """Tests loading batches in worker processes."""
+        train, _ = load_mnist_dataset(
+            img_size=4,
+            batch_size=16,
+            labels=[1, 2],
+            normalize_min=1e-6,
+            normalize_max=1.0,
+            root=str(mnist_idx_dir),
+            download=False,
+            num_workers=1,
+            persistent_workers=True,
+            prefetch_factor=2,
+        )
+        assert train.num_workers == 1
+        assert train.persistent_workers
+
+        labels = torch.cat([batch_labels for _, batch_labels in train])
+        assert sorted(labels.tolist()) == [1] * 6 + [2] * 6
+
+    @pytest.mark.parametrize("normalize_min, normalize_max", [(0, 1), (1e-6, 1.0)])
+    def test_batch_normalization(self, mnist_idx_dir, normalize_min, normalize_max):
+        """Tests that batch-level normalization matches per-image normalization."""
+        train, _ = load_mnist_dataset(
+            img_size=4,
+            batch_size=8,
+            normalize_min=normalize_min,
+            normalize_max=normalize_max,
+            root=str(mnist_idx_dir),
+            download=False,
+        )
+        per_image, _ = load_mnist_dataset(
+            img_size=4,
+            normalize_min=normalize_min,
+            normalize_max=normalize_max,
+            root=str(mnist_idx_dir),
+            download=False,
+        )
+
+        images, _ = next(iter(train))
+        expected = torch.stack([per_image[index][0] for index in range(8)])
+        assert torch.allclose(images, expected, atol=1e-6)
+        assert images.amin() == normalize_min
+
+    def test_global_normalization(self, mnist_idx_dir, tmp_path):
+        """Tests normalization with the bounds of the training set."""
+        kwargs = {
+            "img_size": 4,
+            "batch_size": 60,
+            "normalize_min": 0,
+            "normalize_max": 2,
+            "root": str(mnist_idx_dir),
+            "download": False,
+        }
+        raw_train, _ = load_mnist_dataset(
+            img_size=4, root=str(mnist_idx_dir), download=False
+        )
+        raw = torch.stack([raw_train[index][0] for index in range(len(raw_train))])
+        data_min, data_max = raw.min(), raw.max()
+
+        train, _ = load_mnist_dataset(normalize_global=True, **kwargs)
+        images, _ = next(iter(train))
+        assert torch.allclose(images, 2 * (raw - data_min) / (data_max - data_min))
+
+        cached, _ = load_mnist_dataset(
+            normalize_global=True, cache_dir=str(tmp_path), **kwargs
+        )
+        assert len(list(tmp_path.glob("mnist-train-*.stats.npz"))) == 1
+        assert torch.allclose(next(iter(cached))[0], images, atol=1e-6)
+
+    def test_shards(self, mnist_idx_dir):
+        """Tests that shards of label-filtered samples are disjoint."""
+        kwargs = {
+            "img_size": 4,
+            "batch_size": 4,
+            "labels": [1, 2, 3],
+            "root": str(mnist_idx_dir),
+            "download": False,
+            "num_shards": 2,
+            "shuffle": True,
+            "seed": 5,
+        }
+        loaders = [
+            load_mnist_dataset(shard_index=shard, **kwargs)[0] for shard in range(2)
+        ]
+        for epoch in range(2):
+            labels = []
+            for loader in loaders:
+                loader.sampler.set_epoch(epoch)
+                labels.append(torch.cat([batch for _, batch in loader]).tolist())
+            assert len(labels[0]) == len(labels[1]) == 9
+            assert sorted(labels[0] + labels[1]) == [1] * 6 + [2] * 6 + [3] * 6
+
+    def test_shard_datasets(self, mnist_idx_dir):
+        """Tests sharding when datasets are returned."""
+        train, test = load_mnist_dataset(
+            root=str(mnist_idx_dir), download=False, num_shards=3, shard_index=1
+        )
+        assert (len(train), len(test)) == (20, 7)
+        assert train.indices[:3] == [1, 4, 7]
+
+    def test_shard_index(self, mnist_idx_dir):
+        """Tests an out-of-range shard_index."""
+        with raises(ValueError, match="The input shard_index must be in"):
+            _ = load_mnist_dataset(
+                root=str(mnist_idx_dir), download=False, num_shards=2, shard_index=2
+            )
+
+    @pytest.mark.parametrize(
+        "batch_size, eval_batch_size, drop_last, train_sizes, test_sizes",
+        [
+            (16, None, False, [16, 16, 16, 12], [16, 4]),
+            (16, 6, True, [16, 16, 16], [6, 6, 6, 2]),
+            (64, 32, False, [60], [20]),
+        ],
+    )
+    def test_eval_batch_size(
+        self,
+        mnist_idx_dir,
+        batch_size,
+        eval_batch_size,
+        drop_last,
+        train_sizes,
+        test_sizes,
+    ):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """Tests the batch sizes of the training and evaluation loaders."""
+        train, test = load_mnist_dataset(
+            img_size=4,
+            batch_size=batch_size,
+            root=str(mnist_idx_dir),
+            download=False,
+            eval_batch_size=eval_batch_size,
+            drop_last=drop_last,
+        )
+        assert [len(labels) for _, labels in train] == train_sizes
+        assert [len(labels) for _, labels in test] == test_sizes
+
+    @pytest.mark.parametrize(
+        "eval_batch_size, error, message",
+        [
+            ("8", TypeError, "The input eval_batch_size must be of the type int."),
+            (0, ValueError, "The input eval_batch_size must be positive."),
+        ],
+    )
+    def test_eval_batch_size_input(
+        self, mnist_idx_dir, eval_batch_size, error, message
+    ):
+        """Tests invalid eval_batch_size inputs."""
+        with raises(error, match=message):
+            _ = load_mnist_dataset(
+                root=str(mnist_idx_dir), download=False, eval_batch_size=eval_batch_size
+            )
+
+    def test_download_datasets(self, mnist_idx_dir, tmp_path):
+        """Tests that the download path returns torchvision's MNIST datasets."""
+        # Existing raw files are not downloaded again.
+        raw_dir = tmp_path / "download" / "MNIST" / "raw"
+        raw_dir.mkdir(parents=True)
+        for path in mnist_idx_dir.glob("*-ubyte"):
+            shutil.copy(path, raw_dir)
+        train, test = load_mnist_dataset(
+            img_size=4, root=str(tmp_path / "download"), download=True
+        )
+        assert isinstance(train, datasets.MNIST)
+        assert isinstance(test, datasets.MNIST)
+        assert train.data.dtype == torch.uint8
+        assert train.targets.eq(3).sum() == 6
+        assert train[0][0].shape == (1, 4, 4)
@@ -0,0 +1,129 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for background prefetching"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+import torch
+from pytest import raises
+
+from piqture.data_loader import encode_batches
+from piqture.data_loader.prefetch import Prefetcher
+from piqture.embeddings.image_embeddings import FRQI
+from piqture.transforms import AngleMapping
+
+
+class TestPrefetcher:
+    """Tests for Prefetcher class."""
+
+    @pytest.mark.parametrize("num_batches", [1, 3, 10])
+    def test_order(self, num_batches):
+        """Tests that all items arrive in order, on every iteration."""
+        prefetcher = Prefetcher(range(25), num_batches)
+        assert list(prefetcher) == list(range(25))
+        assert list(prefetcher) == list(range(25))
+
+    def test_bounded(self):
+        """Tests that at most num_batches items are produced ahead."""
+        produced = []
+        ready = threading.Event()
+
+        def source():
+            for index in range(10):
+                produced.append(index)
+                if index == 2:
+                    ready.set()
+                yield index
+
+        iterator = iter(Prefetcher(source(), 2))
+        assert next(iterator) == 0
+        ready.wait(timeout=5)
+        time.sleep(0.2)
+        # Item 0 was consumed, 1 and 2 are queued, 3 waits for space.
+        assert produced == [0, 1, 2, 3]
+        iterator.close()
+
+    def test_overlap(self):
+        """Tests that producing overlaps with consuming."""
+
+        def source():
+            for index in range(4):
+                time.sleep(0.1)
+                yield index
+
+        start = time.perf_counter()
+        for _ in Prefetcher(source(), 2):
+            time.sleep(0.1)
+        # Sequential iteration would take 0.8 s.
+        assert time.perf_counter() - start < 0.7
+
+    def test_error(self):
+        """Tests that errors of the iterable reach the consumer."""
+
+        def source():
+            yield 1
+            raise KeyError("broken batch")
+
+        iterator = iter(Prefetcher(source()))
+        assert next(iterator) == 1
+        with raises(KeyError, match="broken batch"):
+            next(iterator)
+
+    def test_interrupt(self):
+        """Tests that a KeyboardInterrupt in the iterable ends the loop."""
+
+        def source():
+            yield 1
+            raise KeyboardInterrupt
+
+        iterator = iter(Prefetcher(source()))
+        assert next(iterator) == 1
+        with raises(KeyboardInterrupt):
+            next(iterator)
+
+    def test_close(self):
+        """Tests that leaving the loop early stops the thread."""
+        for item in Prefetcher(range(1000), 1):
+            if item == 3:
+                break
+        assert "piqture-prefetcher" not in [
+            thread.name for thread in threading.enumerate()
+        ]
+
+    @pytest.mark.parametrize(
+        "num_batches, error, message",
+        [
+            (1.0, TypeError, "The input num_batches must be of the type int."),
+            (0, ValueError, "The input num_batches must be positive."),
+        ],
+    )
+    def test_num_batches(self, num_batches, error, message):
+        """Tests the num_batches input."""
+        with raises(error, match=message):
+            _ = Prefetcher([], num_batches)
+
+    def test_encode_batches(self):
+        """Tests encode_batches with prefetching."""
+        images = torch.rand(6, 1, 2, 2, generator=torch.Generator().manual_seed(0))
+        loader = [(images[:4], torch.arange(4)), (images[4:], torch.arange(4, 6))]
+        expected = list(encode_batches(loader, FRQI, transform=AngleMapping()))
+        batches = encode_batches(loader, FRQI, transform=AngleMapping(), prefetch=2)
+
+        assert isinstance(batches, Prefetcher)
+        for (circuits, labels), (expected_circuits, expected_labels) in zip(
+            batches, expected, strict=True
+        ):
+            assert circuits == expected_circuits
+            assert torch.equal(labels, expected_labels)
@@ -0,0 +1,81 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for preprocessed dataset cache"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import torch
+
+from piqture.data_loader import load_mnist_dataset
+from piqture.data_loader.preprocessed_cache import (
+    PreprocessedDataset,
+    cache_key,
+    load_or_preprocess,
+)
+
+
+class TestPreprocessedCache:
+    """Tests for the on-disk cache of preprocessed datasets."""
+
+    def test_cache_key(self):
+        """Tests that keys only depend on the parameter values."""
+        assert cache_key({"a": 1, "b": [2, 3]}) == cache_key({"b": [2, 3], "a": 1})
+        assert cache_key({"a": 1}) != cache_key({"a": 2})
+
+    def test_load_or_preprocess(self, tmp_path):
+        """Tests that entries are built once and memory-mapped on reload."""
+        dataset = [
+            (torch.full((1, 2, 2), float(index)), index % 3) for index in range(5)
+        ]
+        first = load_or_preprocess(dataset, tmp_path, "test", {"img_size": 2})
+        assert isinstance(first, PreprocessedDataset)
+        assert isinstance(first.data, np.memmap)
+        assert first.data.shape == (5, 1, 2, 2)
+        assert first.targets.tolist() == [0, 1, 2, 0, 1]
+
+        with mock.patch(
+            "piqture.data_loader.preprocessed_cache._preprocess"
+        ) as mock_preprocess:
+            second = load_or_preprocess(dataset, tmp_path, "test", {"img_size": 2})
+            mock_preprocess.assert_not_called()
+        image, label = second[3]
+        assert torch.equal(image, torch.full((1, 2, 2), 3.0))
+        assert label == 0
+
+        # Changing a parameter selects a new entry.
+        load_or_preprocess(dataset, tmp_path, "test", {"img_size": 4})
+        assert len(list(tmp_path.glob("test-*.json"))) == 2
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_load_mnist_dataset_cache(self, mnist_idx_dir, tmp_path):
+        """Tests that cached datasets match the preprocessed datasets."""
+        options = {
+            "img_size": 4,
+            "labels": [3, 4],
+            "normalize_min": 1e-6,
+            "normalize_max": 1.0,
+            "root": str(mnist_idx_dir),
+            "download": False,
+        }
+        train, _ = load_mnist_dataset(**options)
+        cached_train, cached_test = load_mnist_dataset(
+            **options, cache_dir=str(tmp_path / "cache")
+        )
+
+        assert (len(cached_train.dataset), len(cached_test.dataset)) == (12, 4)
+        for (images, labels), (cached_images, cached_labels) in zip(
+            train, cached_train
+        ):
+            assert torch.allclose(images, cached_images)
+            assert torch.equal(labels, cached_labels)
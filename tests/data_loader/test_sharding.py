@@ -0,0 +1,89 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for dataset sharding"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pytest import raises
+
+from piqture.data_loader import ShardSampler, shard_indices
+
+
+class TestShardIndices:
+    """Tests for shard_indices function."""
+
+    @pytest.mark.parametrize("num_samples", [0, 1, 10, 11])
+    @pytest.mark.parametrize("num_shards", [1, 3, 4])
+    @pytest.mark.parametrize("seed", [None, 7])
+    def test_partition(self, num_samples, num_shards, seed):
+        """Tests that shards are disjoint, balanced and cover all samples."""
+        shards = [
+            shard_indices(num_samples, num_shards, shard, seed=seed)
+            for shard in range(num_shards)
+        ]
+        assert sorted(np.concatenate(shards).tolist()) == list(range(num_samples))
+        lengths = [len(shard) for shard in shards]
+        assert max(lengths) - min(lengths) <= 1
+
+    def test_drop_last(self):
+        """Tests that drop_last balances the shard lengths exactly."""
+        shards = [shard_indices(11, 3, shard, drop_last=True) for shard in range(3)]
+        assert [shard.tolist() for shard in shards] == [[0, 3, 6], [1, 4, 7], [2, 5, 8]]
+
+    def test_seeded_epochs(self):
+        """Tests that shuffles are reproducible and change per epoch."""
+        first = shard_indices(100, 2, 0, seed=3, epoch=0)
+        assert np.array_equal(first, shard_indices(100, 2, 0, seed=3, epoch=0))
+        assert not np.array_equal(first, shard_indices(100, 2, 0, seed=3, epoch=1))
+        assert not np.array_equal(first, shard_indices(100, 2, 0, seed=4, epoch=0))
+
+    @pytest.mark.parametrize(
+        "num_shards, shard_index, error, message",
+        [
+            (2.0, 0, TypeError, "The input num_shards must be of the type int."),
+            (2, True, TypeError, "The input shard_index must be of the type int."),
+            (0, 0, ValueError, "The input num_shards must be positive."),
+            (2, 2, ValueError, r"The input shard_index must be in \[0, num_shards\)."),
+            (2, -1, ValueError, r"The input shard_index must be in \[0, num_shards\)."),
+        ],
+    )
+    def test_invalid_inputs(self, num_shards, shard_index, error, message):
+        """Tests invalid num_shards and shard_index inputs."""
+        with raises(error, match=message):
+            _ = shard_indices(10, num_shards, shard_index)
+
+
+class TestShardSampler:
+    """Tests for ShardSampler class."""
+
+    @pytest.mark.parametrize("drop_last", [False, True])
+    def test_len(self, drop_last):
+        """Tests that the length matches the sampled indices."""
+        for shard in range(4):
+            sampler = ShardSampler(range(10), 4, shard, drop_last=drop_last)
+            assert len(sampler) == len(list(sampler))
+
+    def test_set_epoch(self):
+        """Tests that all shards reshuffle identically per epoch."""
+        samplers = [
+            ShardSampler(range(20), 2, shard, shuffle=True) for shard in range(2)
+        ]
+        epochs = []
+        for epoch in range(2):
+            for sampler in samplers:
+                sampler.set_epoch(epoch)
+            first, second = (list(sampler) for sampler in samplers)
+            assert not set(first) & set(second)
+            assert sorted(first + second) == list(range(20))
+            epochs.append(first)
+        assert epochs[0] != epochs[1]
@@ -0,0 +1,98 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for class-balanced subsampling"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from piqture.data_loader.idx_dataset import IDXDataset
+from piqture.data_loader.stratified import (
+    StratifiedSampler,
+    stratified_indices,
+    stratified_subset,
+)
+
+TARGETS = np.array([0, 1, 1, 2, 0, 1, 2, 2, 0, 1])
+
+
+class TestStratified:
+    """Tests for class-balanced subsampling."""
+
+    @pytest.mark.parametrize("targets", [TARGETS, torch.tensor(TARGETS)])
+    def test_stratified_indices(self, targets):
+        """Tests that the first samples of every label are taken in order."""
+        assert stratified_indices(targets, 2).tolist() == [0, 1, 2, 3, 4, 6]
+        assert stratified_indices(targets, 1, labels=[2, 0]).tolist() == [0, 3]
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_stratified_indices_seed(self, seed):
+        """Tests that random draws are balanced and reproducible."""
+        indices = stratified_indices(TARGETS, 3, seed=seed)
+        assert np.array_equal(indices, stratified_indices(TARGETS, 3, seed=seed))
+        assert np.all(np.diff(indices) > 0)
+        assert np.bincount(TARGETS[indices]).tolist() == [3, 3, 3]
+
+    @pytest.mark.parametrize(
+        "samples_per_class, labels, error, message",
+        [
+            (1.5, None, TypeError, "must be of the type int"),
+            (True, None, TypeError, "must be of the type int"),
+            (0, None, ValueError, "must be positive"),
+            (1, (0, 1), TypeError, "must be of the type list"),
+            (1, [0, 7], ValueError, r"labels \[7\] have no samples"),
+            (4, None, ValueError, r"labels \[0, 2\] have fewer than 4 samples"),
+        ],
+    )
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def test_stratified_indices_input(self, samples_per_class, labels, error, message):
+        """Tests the input validation."""
+        with pytest.raises(error, match=message):
+            stratified_indices(TARGETS, samples_per_class, labels)
+
+    def test_stratified_subset(self, mnist_idx_dir):
+        """Tests a balanced subset of an IDX dataset."""
+        dataset = IDXDataset.mnist(mnist_idx_dir)
+        subset = stratified_subset(dataset, 3, labels=[1, 4, 9], seed=0)
+
+        assert len(subset) == 9
+        labels = [subset[index][1] for index in range(len(subset))]
+        assert sorted(labels) == [1, 1, 1, 4, 4, 4, 9, 9, 9]
+        assert subset.indices == sorted(subset.indices)
+
+    @pytest.mark.parametrize("shuffle", [True, False])
+    def test_stratified_sampler(self, shuffle):
+        """Tests that every epoch draws a balanced selection."""
+        sampler = StratifiedSampler(TARGETS, 2, shuffle=shuffle, seed=3)
+        epochs = []
+        for epoch in range(4):
+            sampler.set_epoch(epoch)
+            indices = list(sampler)
+            assert len(indices) == len(sampler) == 6
+            assert np.bincount(TARGETS[indices]).tolist() == [2, 2, 2]
+            assert indices == list(sampler)
+            epochs.append(indices)
+        assert len({tuple(indices) for indices in epochs}) > 1
+        if not shuffle:
+            assert all(indices == sorted(indices) for indices in epochs)
+
+    def test_stratified_sampler_dataloader(self):
+        """Tests a DataLoader with a stratified sampler."""
+        dataset = torch.utils.data.TensorDataset(
+            torch.arange(len(TARGETS)), torch.as_tensor(TARGETS)
+        )
+        loader = torch.utils.data.DataLoader(
+            dataset, batch_size=3, sampler=StratifiedSampler(TARGETS, 1)
+        )
+        labels = torch.cat([labels for _, labels in loader])
+        assert sorted(labels.tolist()) == [0, 1, 2]
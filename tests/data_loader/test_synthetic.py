@@ -0,0 +1,115 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for synthetic image datasets"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+from pytest import raises
+
+from piqture.data_loader import load_local_dataset
+from piqture.data_loader.array_dataset import ImageArrayDataset
+from piqture.data_loader.synthetic import synthetic_dataset, synthetic_images
+
+
+class TestSyntheticImages:
+    """Tests for synthetic_images function."""
+
+    @pytest.mark.parametrize(
+        "num_images, img_size, shape",
+        [(5, 28, (5, 28, 28)), (3, (6, 10), (3, 6, 10)), (0, 4, (0, 4, 4))],
+    )
+    def test_shape(self, num_images, img_size, shape):
+        """Tests the shapes and types of images and labels."""
+        images, labels = synthetic_images(num_images, img_size)
+        assert images.shape == shape
+        assert images.dtype == np.uint8
+        assert labels.shape == (num_images,)
+        assert labels.dtype == np.int64
+
+    def test_seeds(self):
+        """Tests that seeds fix the images and class_seed fixes the classes."""
+        images, labels = synthetic_images(20, seed=3)
+        same_images, same_labels = synthetic_images(20, seed=3)
+        assert np.array_equal(images, same_images)
+        assert np.array_equal(labels, same_labels)
+        assert not np.array_equal(images, synthetic_images(20, seed=4)[0])
+
+        # Splits with the same class_seed resemble each other by class.
+        train, train_labels = synthetic_images(500, seed=0)
+        test, test_labels = synthetic_images(500, seed=1)
+        train_means = np.stack([train[train_labels == k].mean(0) for k in range(10)])
+        test_means = np.stack([test[test_labels == k].mean(0) for k in range(10)])
+        distances = np.linalg.norm(train_means[:, None] - test_means[None], axis=(2, 3))
+        assert np.array_equal(distances.argmin(axis=1), np.arange(10))
+
+    @pytest.mark.parametrize("sparsity", [0.0, 0.5, 0.81, 0.95])
+    def test_sparsity(self, sparsity):
+        """Tests the fraction of zero pixels."""
+        images, _ = synthetic_images(50, sparsity=sparsity)
+        zeros = (images == 0).mean(axis=(1, 2))
+        assert np.allclose(zeros, sparsity, atol=1 / 784)
+
+    def test_mnist_statistics(self):
+        """Tests the MNIST mean and standard deviation of the defaults."""
+        images = synthetic_images(500)[0] / 255
+        assert images.mean() == pytest.approx(0.1307, abs=0.01)
+        assert images.std() == pytest.approx(0.3081, abs=0.01)
+
+    def test_intensities(self):
+        """Tests uniform and binary stroke intensities."""
+        binary, _ = synthetic_images(10, intensity="binary")
+        assert set(np.unique(binary)) == {0, 255}
+        uniform, _ = synthetic_images(10, intensity="uniform")
+        strokes = binary > 0
+        assert np.array_equal(uniform > 0, strokes)
+        assert len(np.unique(uniform[strokes])) > 200
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"num_images": -1}, "The input num_images must be a non-negative int."),
+            ({"num_images": 2.0}, "The input num_images must be a non-negative int."),
+            (
+                {"num_images": 2, "sparsity": 1},
+                r"The input sparsity must be in \[0, 1\).",
+            ),
+            ({"num_images": 2, "intensity": "gray"}, "must be one of mnist, uniform"),
+        ],
+    )
+    def test_inputs(self, kwargs, message):
+        """Tests invalid inputs."""
+        with raises(ValueError, match=message):
+            _ = synthetic_images(**kwargs)
+
+
+class TestSyntheticDataset:
+    """Tests for synthetic_dataset function."""
+
+    def test_dataset(self):
+        """Tests wrapping the images in an ImageArrayDataset."""
+        dataset = synthetic_dataset(
+            8, transform=torch.from_numpy, img_size=4, num_classes=3, seed=2
+        )
+        images, labels = synthetic_images(8, 4, num_classes=3, seed=2)
+        assert isinstance(dataset, ImageArrayDataset)
+        assert dataset.classes == [0, 1, 2]
+        assert torch.equal(dataset[5][0], torch.from_numpy(images[5]))
+        assert dataset[5][1] == labels[5]
+
+    def test_local_dataset(self, tmp_path):
+        """Tests loading the synthetic splits by name."""
+        train, test = load_local_dataset("synthetic", str(tmp_path), img_size=4)
+        assert (len(train), len(test)) == (60000, 10000)
+        assert train[0][0].shape == (1, 4, 4)
+        assert not np.array_equal(train.data[:10], test.data[:10])
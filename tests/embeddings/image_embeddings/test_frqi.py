@@ -20,10 +20,13 @@ import numpy as np
 import pytest
 from pytest import raises
 from qiskit.circuit import ParameterVector, QuantumCircuit
+from qiskit.circuit.library import RYGate
+from qiskit.quantum_info import Statevector
 
 from piqture.embeddings.image_embeddings.frqi import FRQI
 
 PIXEL_POS_BINARY2 = ["00", "01", "10", "11"]
+PIXEL_POS_BINARY4 = [f"{pixel:0>4b}" for pixel in range(16)]
 
 
 @pytest.fixture(name="circuit_pixel_value")
@@ -31,7 +34,7 @@ def circuit_pixel_value_fixture():
     """Fixture for embedding pixel values."""
 
     def _circuit(img_dims, pixel_vals, pixel):
-        feature_dim = int(np.sqrt(math.prod(img_dims)))
+        feature_dim = int(math.log2(math.prod(img_dims)))
         test_circuit = QuantumCircuit(int(math.prod(img_dims)))
 
         if pixel_vals is None:
@@ -40,11 +43,10 @@ def circuit_pixel_value_fixture():
             pixel_vals = [pixel for pixel_list in pixel_vals for pixel in pixel_list]
 
         # Add gates to test_circuit
-        test_circuit.cry(pixel_vals[pixel], feature_dim - 2, feature_dim)
-        test_circuit.cx(0, 1)
-        test_circuit.cry(-pixel_vals[pixel], feature_dim - 1, feature_dim)
-        test_circuit.cx(0, 1)
-        test_circuit.cry(pixel_vals[pixel], feature_dim - 1, feature_dim)
+        test_circuit.append(
+            RYGate(2 * pixel_vals[pixel]).control(feature_dim, annotated=True),
+            list(range(feature_dim + 1)),
+        )
         return test_circuit
 
     return _circuit
@@ -89,6 +91,14 @@ class TestFRQI:
         ):
             _ = FRQI(img_dims, pixel_vals)
 
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals", [((3, 3), [list(range(9))]), ((6, 6), None)]
+    )
+    def test_img_dim_power_of_2(self, img_dims, pixel_vals):
+        """Tests if image dimensions are powers of 2."""
+        with raises(ValueError, match="Image dimensions must be powers of 2."):
+            _ = FRQI(img_dims, pixel_vals)
+
     @pytest.mark.parametrize("img_dims, pixel_vals", [((2, 2), [[1, 2, 3]])])
     def test_init_len_pixel_values(self, img_dims, pixel_vals):
         # pylint: disable=duplicate-code
@@ -113,15 +123,21 @@ class TestFRQI:
         ):
             _ = FRQI(img_dims, pixel_vals)
 
-    @pytest.mark.parametrize("img_dims, pixel_vals", [((2, 2), [list(range(4))])])
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals",
+        [((2, 2), [list(range(4))]), ((4, 4), None), ((16, 16), None)],
+    )
     def test_circuit_property(self, img_dims, pixel_vals):
         """Tests the FRQI circuits initialization."""
-        test_circuit = QuantumCircuit(int(np.sqrt(math.prod(img_dims))) + 1)
+        test_circuit = QuantumCircuit(int(math.log2(math.prod(img_dims))) + 1)
         assert test_circuit == FRQI(img_dims, pixel_vals).circuit
 
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, pixel_pos_binary_list",
-        [((2, 2), [list(range(4))], PIXEL_POS_BINARY2)],
+        [
+            ((2, 2), [list(range(4))], PIXEL_POS_BINARY2),
+            ((4, 4), None, PIXEL_POS_BINARY4),
+        ],
     )
     def test_pixel_position(
         self,
@@ -147,7 +163,7 @@ class TestFRQI:
 
     @pytest.mark.parametrize(
         "img_dims, pixel_vals",
-        [((2, 2), [list(range(4))])],
+        [((2, 2), [list(range(4))]), ((4, 4), [list(range(16))])],
     )
     def test_pixel_value(self, img_dims, pixel_vals, circuit_pixel_value):
         """Tests the circuit received after pixel value embedding."""
@@ -171,6 +187,7 @@ class TestFRQI:
         [
             ((2, 2), [list(range(4))], PIXEL_POS_BINARY2),
             ((2, 2), None, PIXEL_POS_BINARY2),
+            ((4, 4), [list(range(16))], PIXEL_POS_BINARY4),
         ],
     )
 
@@ -188,7 +205,7 @@ class TestFRQI:
         mock_circuit = QuantumCircuit(int(math.prod(img_dims)))
 
         test_circuit = QuantumCircuit(int(math.prod(img_dims)))
-        test_circuit.h(list(range(int(np.sqrt(math.prod(img_dims))))))
+        test_circuit.h(list(range(int(math.log2(math.prod(img_dims))))))
         for pixel, pixel_pos_binary in enumerate(pixel_pos_binary_list):
             test_circuit.compose(
                 circuit_pixel_position(img_dims, pixel_pos_binary),
@@ -212,3 +229,63 @@ class TestFRQI:
                 test_circuit.assign_parameters(pixel_vals, inplace=True)
                 mock_circuit.assign_parameters(pixel_vals, inplace=True)
             assert mock_circuit == test_circuit
+
+    @pytest.mark.parametrize("img_dims", [(2, 2), (4, 4), (8, 8)])
+    def test_frqi_statevector(self, img_dims):
+        """Tests the amplitudes of the FRQI state."""
+        num_pixels = math.prod(img_dims)
+        feature_dim = int(math.log2(num_pixels))
+        pixel_vals = np.random.default_rng(seed=7).uniform(0, np.pi / 2, num_pixels)
+        state = Statevector(FRQI(img_dims, [pixel_vals.tolist()]).frqi()).data
+
+        # Position qubit 0 holds the most significant bit of the pixel index.
+        positions = np.array(
+            [int(f"{pixel:0>{feature_dim}b}"[::-1], 2) for pixel in range(num_pixels)]
+        )
+        amplitude = 1 / np.sqrt(num_pixels)
+        assert np.allclose(state[positions], amplitude * np.cos(pixel_vals))
+        assert np.allclose(
+            state[positions + num_pixels], amplitude * np.sin(pixel_vals)
+        )
+
+    @pytest.mark.parametrize("img_dims, block_size", [((2, 2), 1), ((4, 4), 2)])
+    def test_kernel_matrix(self, img_dims, block_size):
+        """Tests the kernel matrix against simulated FRQI state overlaps."""
+        rng = np.random.default_rng(seed=7)
+        x_vec = rng.uniform(0, np.pi / 2, (3, *img_dims))
+        y_vec = rng.uniform(0, np.pi / 2, (4, *img_dims))
+
+        x_states = [
+            Statevector(FRQI(img_dims, [x.flatten().tolist()]).frqi()) for x in x_vec
+        ]
+        y_states = [
+            Statevector(FRQI(img_dims, [y.flatten().tolist()]).frqi()) for y in y_vec
+        ]
+        test_kernel = np.array(
+            [[abs(x.inner(y)) ** 2 for y in y_states] for x in x_states]
+        )
+
+        kernel = FRQI.kernel_matrix(x_vec, y_vec, block_size=block_size)
+        assert kernel.shape == (3, 4)
+        assert np.allclose(kernel, test_kernel)
+
+    def test_kernel_matrix_symmetric(self):
+        """Tests the kernel matrix of a batch with itself."""
+        x_vec = np.random.default_rng(seed=7).uniform(0, np.pi / 2, (5, 16))
+        kernel = FRQI.kernel_matrix(x_vec.astype(np.float32))
+
+        assert kernel.dtype == np.float32
+        assert np.allclose(kernel, kernel.T)
+        assert np.allclose(np.diag(kernel), 1)
+
+    @pytest.mark.parametrize(
+        "x_vec, y_vec, block_size, message",
+        [
+            (np.zeros((2, 4)), np.zeros((2, 16)), 1, r"No. of pixels in x_vec \(4\)"),
+            (np.zeros((2, 4)), None, 0, "block_size must be a positive integer."),
+        ],
+    )
+    def test_kernel_matrix_inputs(self, x_vec, y_vec, block_size, message):
+        """Tests the kernel matrix inputs."""
+        with raises(ValueError, match=message):
+            _ = FRQI.kernel_matrix(x_vec, y_vec, block_size=block_size)
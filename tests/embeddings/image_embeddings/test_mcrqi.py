@@ -0,0 +1,75 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for MCRQI class"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from pytest import raises
+from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from piqture.embeddings.image_embeddings.mcrqi import MCRQI
+
+CHANNEL_INDEX_QUBITS = 2
+
+
+class TestMCRQI:
+    """Tests for MCRQI image representation class"""
+
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals",
+        [((3, 3), [list(range(9))]), ((6, 6), [list(range(36))])],
+    )
+    def test_img_dim_power_of_2(self, img_dims, pixel_vals):
+        """Tests if image dimensions are powers of 2."""
+        with raises(ValueError, match="Image dimensions must be powers of 2."):
+            _ = MCRQI(img_dims, pixel_vals)
+
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals",
+        [
+            ((2, 2), [list(range(4))] * 4),
+            ((4, 4), [list(range(16))] * 4),
+            ((16, 16), [list(range(256))] * 4),
+        ],
+    )
+    def test_circuit_property(self, img_dims, pixel_vals):
+        """Tests the MCRQI circuits initialization."""
+        feature_dim = int(math.log2(math.prod(img_dims)))
+        test_circuit = QuantumCircuit(feature_dim + CHANNEL_INDEX_QUBITS + 1)
+        assert MCRQI(img_dims, pixel_vals).circuit == test_circuit
+
+    @pytest.mark.parametrize("img_dims", [(2, 2), (4, 4)])
+    def test_mcrqi_statevector(self, img_dims):
+        """Tests the amplitudes of the MCRQI state."""
+        num_pixels = math.prod(img_dims)
+        feature_dim = int(math.log2(num_pixels))
+        pixel_vals = np.random.default_rng(seed=7).uniform(0, 1, (4, num_pixels))
+        state = Statevector(MCRQI(img_dims, pixel_vals.tolist()).mcrqi()).data
+
+        # Position and channel index qubits hold the most significant bit first.
+        indices = np.array(
+            [
+                int(f"{pixel:0>{feature_dim}b}{channel:0>2b}"[::-1], 2)
+                for channel in range(4)
+                for pixel in range(num_pixels)
+            ]
+        )
+        amplitude = 1 / np.sqrt(4 * num_pixels)
+        offset = 2 ** (feature_dim + CHANNEL_INDEX_QUBITS)
+        assert np.allclose(state[indices], amplitude * np.cos(pixel_vals.flatten()))
+        assert np.allclose(
+            state[indices + offset], amplitude * np.sin(pixel_vals.flatten())
+        )
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 from pytest import raises
 from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import Statevector
 
 from piqture.embeddings.image_embeddings.neqr import NEQR
 
@@ -30,7 +31,7 @@ def neqr_pixel_value_fixture():
     """Fixture for embedding pixel values."""
 
     def _circuit(img_dims, pixel_val, color_qubits):
-        feature_dim = int(np.sqrt(math.prod(img_dims)))
+        feature_dim = int(math.log2(math.prod(img_dims)))
         pixel_val_bin = f"{int(pixel_val):0>8b}"
         test_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
 
@@ -61,15 +62,28 @@ class TestNEQR:
         ):
             _ = NEQR(img_dims, pixel_vals, max_color_intensity)
 
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals",
+        [((3, 3), [list(range(9))]), ((6, 6), [list(range(36))])],
+    )
+    def test_img_dim_power_of_2(self, img_dims, pixel_vals):
+        """Tests if image dimensions are powers of 2."""
+        with raises(ValueError, match="Image dimensions must be powers of 2."):
+            _ = NEQR(img_dims, pixel_vals)
+
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, max_color_intensity",
-        [((2, 2), [list(range(251, 255))], MAX_COLOR_INTENSITY)],
+        [
+            ((2, 2), [list(range(251, 255))], MAX_COLOR_INTENSITY),
+            ((4, 4), [list(range(16))], MAX_COLOR_INTENSITY),
+            ((16, 16), [list(range(256))], MAX_COLOR_INTENSITY),
+        ],
     )
     def test_circuit_property(self, img_dims, pixel_vals, max_color_intensity):
         """Tests the FRQI circuits initialization."""
         color_qubits = int(np.ceil(math.log(max_color_intensity, 2)))
         test_circuit = QuantumCircuit(
-            np.ceil(np.sqrt(math.prod(img_dims))) + color_qubits
+            int(math.log2(math.prod(img_dims))) + color_qubits
         )
         assert NEQR(img_dims, pixel_vals).circuit == test_circuit
 
@@ -99,7 +113,10 @@ class TestNEQR:
     # pylint: disable=too-many-arguments
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, max_color_intensity",
-        [((2, 2), [list(range(1, 5))], MAX_COLOR_INTENSITY)],
+        [
+            ((2, 2), [list(range(1, 5))], MAX_COLOR_INTENSITY),
+            ((4, 4), [list(range(100, 116))], MAX_COLOR_INTENSITY),
+        ],
     )
 
     # pylint: disable=R0917
@@ -117,9 +134,10 @@ class TestNEQR:
         mock_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
 
         test_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
-        test_circuit.h(list(range(int(np.sqrt(math.prod(img_dims))))))
+        feature_dim = int(math.log2(math.prod(img_dims)))
+        test_circuit.h(list(range(feature_dim)))
         for index, pixel_val in enumerate(pixel_vals[0]):
-            pixel_pos_binary = f"{index:0>2b}"
+            pixel_pos_binary = f"{index:0>{feature_dim}b}"
             mock_circuit.clear()
             test_circuit.compose(
                 circuit_pixel_position(img_dims, pixel_pos_binary), inplace=True
@@ -137,3 +155,24 @@ class TestNEQR:
         ):
             neqr_object.neqr()
             assert mock_circuit == test_circuit
+
+    @pytest.mark.parametrize("img_dims", [(2, 2), (4, 4)])
+    def test_neqr_statevector(self, img_dims):
+        """Tests that every position holds its own color value."""
+        num_pixels = math.prod(img_dims)
+        feature_dim = int(math.log2(num_pixels))
+        pixel_vals = np.random.default_rng(seed=7).integers(0, 256, num_pixels)
+        probabilities = Statevector(
+            NEQR(img_dims, [pixel_vals.tolist()]).neqr()
+        ).probabilities_dict(decimals=10)
+        probabilities = {key: val for key, val in probabilities.items() if val > 0}
+
+        expected = {}
+        for pixel, pixel_val in enumerate(pixel_vals):
+            # Qiskit bitstrings list the highest qubit first.
+            bitstring = f"{pixel:0>{feature_dim}b}{pixel_val:0>8b}"[::-1]
+            expected[bitstring] = 1 / num_pixels
+        assert probabilities.keys() == expected.keys()
+        assert np.allclose(
+            [probabilities[key] for key in expected], list(expected.values())
+        )
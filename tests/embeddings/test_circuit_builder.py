@@ -0,0 +1,61 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for CircuitBuilder class"""
+
+from __future__ import annotations
+
+import pytest
+from qiskit.circuit import ParameterVector, QuantumCircuit
+from qiskit.circuit.library import RYGate
+
+from piqture.embeddings.circuit_builder import CircuitBuilder
+
+
+class TestCircuitBuilder:
+    """Tests for CircuitBuilder class"""
+
+    @pytest.mark.parametrize("capacity", [0, 4, 100])
+    def test_flush(self, capacity):
+        """Tests that accumulated gates match gate-by-gate construction."""
+        test_circuit = QuantumCircuit(4)
+        test_circuit.h([0, 1, 2])
+        test_circuit.x([0, 2])
+        test_circuit.mcx([0, 1, 2], 3)
+        test_circuit.x([0, 2])
+
+        circuit = QuantumCircuit(4)
+        builder = CircuitBuilder(circuit, capacity=capacity)
+        builder.h(range(3))
+        builder.x([0, 2])
+        builder.mcx([0, 1, 2], [3])
+        builder.x([0, 2])
+
+        assert len(builder) == 8
+        assert len(circuit.data) == 0
+        assert builder.flush() is circuit
+        assert len(builder) == 0
+        assert circuit == test_circuit
+
+    def test_mcry_parameters(self):
+        """Tests that parameters of accumulated gates are tracked."""
+        params = ParameterVector("test", 2)
+        test_circuit = QuantumCircuit(3)
+        test_circuit.append(RYGate(params[0]).control(2, annotated=True), [0, 1, 2])
+        test_circuit.append(RYGate(params[1]).control(1, annotated=True), [2, 0])
+
+        circuit = QuantumCircuit(3)
+        builder = CircuitBuilder(circuit)
+        builder.mcry(params[0], [0, 1], 2)
+        builder.mcry(params[1], [2], 0)
+        builder.flush()
+
+        assert set(circuit.parameters) == set(params)
+        assert circuit == test_circuit
@@ -0,0 +1,78 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for ImageMixin class"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from qiskit.circuit import QuantumCircuit
+
+from piqture.embeddings.circuit_builder import CircuitBuilder
+from piqture.mixin.image_embedding_mixin import ImageMixin
+
+
+class TestImageMixin:
+    """Tests for ImageMixin class"""
+
+    @pytest.mark.parametrize("num_qubits", [1, 2, 3, 6])
+    def test_position_x_gates(self, num_qubits):
+        """Tests the lookup table against binary position strings."""
+        table = ImageMixin.position_x_gates(num_qubits)
+        assert len(table) == 2**num_qubits
+        for pixel_pos, qubits in enumerate(table):
+            pixel_pos_binary = f"{pixel_pos:0>{num_qubits}b}"
+            expected = [
+                index for index, val in enumerate(pixel_pos_binary) if val == "0"
+            ]
+            assert qubits.tolist() == expected
+
+    def test_position_x_gates_read_only(self):
+        """Tests that the cached lookup table cannot be modified."""
+        with pytest.raises(ValueError):
+            ImageMixin.position_x_gates(2)[0][0] = 1
+
+    @pytest.mark.parametrize("num_qubits", [2, 4])
+    def test_pixel_position_int(self, num_qubits, circuit_pixel_position):
+        """Tests integer position embedding against binary string embedding."""
+        for pixel_pos in range(2**num_qubits):
+            pixel_pos_binary = f"{pixel_pos:0>{num_qubits}b}"
+            test_circuit = circuit_pixel_position((num_qubits,), pixel_pos_binary)
+
+            circuit = QuantumCircuit(num_qubits)
+            ImageMixin.pixel_position_int(circuit, pixel_pos, num_qubits)
+            assert circuit == test_circuit
+
+    @pytest.mark.parametrize("qubit_padding", [0, 3])
+    def test_channel_index_int(self, qubit_padding):
+        """Tests integer channel embedding against binary string embedding."""
+        for channel in range(4):
+            test_circuit = QuantumCircuit(qubit_padding + 2)
+            ImageMixin.channel_index(test_circuit, f"{channel:0>2b}", qubit_padding)
+
+            circuit = QuantumCircuit(qubit_padding + 2)
+            ImageMixin.channel_index_int(circuit, channel, 2, qubit_padding)
+            assert circuit == test_circuit
+            assert np.all(
+                ImageMixin.position_x_gates(2)[channel] < 2
+            ), "padding must not modify the cached table"
+
+    def test_builder(self):
+        """Tests integer embedding into a CircuitBuilder."""
+        test_circuit = QuantumCircuit(5)
+        ImageMixin.pixel_position_int(test_circuit, 2, 3)
+        ImageMixin.channel_index_int(test_circuit, 1, 2, 3)
+
+        builder = CircuitBuilder(QuantumCircuit(5))
+        ImageMixin.pixel_position_int(builder, 2, 3)
+        ImageMixin.channel_index_int(builder, 1, 2, 3)
+        assert len(builder) == 3
+        assert builder.flush() == test_circuit
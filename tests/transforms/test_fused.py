@@ -0,0 +1,127 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for fused transform pipelines"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+import torchvision
+from pytest import raises
+
+from piqture.transforms.fused import FusedPipeline
+from piqture.transforms.transforms import (
+    AngleMapping,
+    GlobalMinMaxNormalization,
+    MinMaxNormalization,
+    Quantization,
+)
+
+IMAGES = np.random.default_rng(seed=1).integers(0, 256, (6, 28, 28), dtype=np.uint8)
+
+
+def per_sample(transforms: list, images) -> torch.Tensor:
+    """Applies a chain of transforms image by image."""
+    compose = torchvision.transforms.Compose(transforms)
+    return torch.stack([compose(image) for image in images])
+
+
+class TestFusedPipeline:
+    """Tests for FusedPipeline class."""
+
+    @pytest.mark.parametrize(
+        "transforms",
+        [
+            [torchvision.transforms.ToTensor()],
+            [torchvision.transforms.ToTensor(), MinMaxNormalization(-1, 1)],
+            [
+                torchvision.transforms.ToTensor(),
+                torchvision.transforms.Resize(8),
+                MinMaxNormalization(0, np.pi / 2),
+            ],
+            [
+                torchvision.transforms.ToTensor(),
+                torchvision.transforms.Resize((4, 7)),
+                GlobalMinMaxNormalization(0, 2, 0.1, 0.9),
+                MinMaxNormalization(1, 0),
+                AngleMapping(),
+            ],
+            [
+                torchvision.transforms.ToTensor(),
+                AngleMapping(0.2, 0.8, dtype=torch.float32),
+                MinMaxNormalization(0, 1),
+            ],
+        ],
+    )
+    def test_matches_per_sample(self, transforms):
+        """Tests that fused chains match image-by-image transforms."""
+        expected = per_sample(transforms, IMAGES)
+        result = FusedPipeline(transforms)(IMAGES)
+        assert result.shape == expected.shape
+        assert result.dtype == expected.dtype
+        assert torch.allclose(result, expected, atol=1e-5)
+
+    @pytest.mark.parametrize("img_size, levels", [(4, 15), (8, 255)])
+    def test_quantization(self, img_size, levels):
+        """Tests fused resizing and quantization."""
+        transforms = [
+            torchvision.transforms.ToTensor(),
+            torchvision.transforms.Resize(img_size),
+            MinMaxNormalization(0, 1),
+            Quantization(levels),
+        ]
+        expected = per_sample(transforms, IMAGES)
+        result = FusedPipeline(torchvision.transforms.Compose(transforms))(IMAGES)
+        assert result.dtype == torch.uint8
+        # Rounding may differ by one intensity at float ties.
+        assert (result.int() - expected.int()).abs().max() <= 1
+        assert (result == expected).float().mean() > 0.99
+
+    def test_angles_after_quantization(self):
+        """Tests that angles of quantized images keep the AngleMapping dtype."""
+        transforms = [
+            torchvision.transforms.ToTensor(),
+            Quantization(15),
+            AngleMapping(0, 15),
+        ]
+        expected = per_sample(transforms, IMAGES)
+        result = FusedPipeline(transforms)(IMAGES)
+        assert expected.dtype == torch.float64
+        assert result.dtype == torch.float64
+        assert torch.allclose(result, expected)
+
+    def test_channels(self):
+        """Tests stacked HWC images."""
+        images = np.stack([IMAGES, 255 - IMAGES], axis=-1)
+        transforms = [torchvision.transforms.ToTensor(), MinMaxNormalization(0, 1)]
+        result = FusedPipeline(transforms)(images)
+        assert result.shape == (6, 2, 28, 28)
+        assert torch.allclose(result, per_sample(transforms, images), atol=1e-6)
+
+    def test_tensor_batch(self):
+        """Tests chains without ToTensor, and that inputs are not modified."""
+        batch = torch.rand(4, 1, 6, 6, generator=torch.Generator().manual_seed(2))
+        original = batch.clone()
+        transforms = [MinMaxNormalization(0, 1), lambda data: data * 2, AngleMapping()]
+        result = FusedPipeline(transforms)(batch)
+        assert torch.equal(batch, original)
+        assert torch.allclose(result, per_sample(transforms, batch))
+
+    def test_inputs(self):
+        """Tests invalid transforms and batches."""
+        with raises(TypeError, match="must be a list of callables."):
+            _ = FusedPipeline([torchvision.transforms.ToTensor(), 3])
+        with raises(ValueError, match=r"must have the shape \(N, H, W\[, C\]\)."):
+            _ = FusedPipeline([torchvision.transforms.ToTensor()])(IMAGES[0, 0])
+        assert repr(FusedPipeline([MinMaxNormalization(0, 1)])) == (
+            "FusedPipeline([MinMaxNormalization(normalize_min=0, normalize_max=1)])"
+        )
@@ -0,0 +1,113 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for Patchify transform"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+from pytest import raises
+
+from piqture.data_loader import encode_image
+from piqture.embeddings.image_embeddings.frqi import FRQI
+from piqture.transforms.patchify import Patchify
+
+BATCH = torch.arange(2 * 3 * 6 * 8, dtype=torch.float32).reshape(2, 3, 6, 8)
+
+
+class TestPatchify:
+    """Tests for Patchify transform."""
+
+    @pytest.mark.parametrize(
+        "kernel_size, stride, grid",
+        [(2, None, (3, 4)), (3, 1, (4, 6)), ((2, 4), (2, 2), (3, 3)), (6, 2, (1, 2))],
+    )
+    def test_patches(self, kernel_size, stride, grid):
+        """Tests that patches match slices of the images."""
+        patchify = Patchify(kernel_size, stride)
+        patches = patchify(BATCH)
+        (kernel_height, kernel_width), (stride_height, stride_width) = (
+            patchify.kernel_size,
+            patchify.stride,
+        )
+
+        assert patches.shape == (2, *grid, 3, kernel_height, kernel_width)
+        for row in range(grid[0]):
+            for col in range(grid[1]):
+                top, left = row * stride_height, col * stride_width
+                expected = BATCH[
+                    :, :, top : top + kernel_height, left : left + kernel_width
+                ]
+                assert torch.equal(patches[:, row, col], expected)
+
+    def test_view(self):
+        """Tests that patches share memory with the batch."""
+        batch = BATCH.clone()
+        patches = Patchify(2)(batch)
+        assert patches.data_ptr() == batch.data_ptr()
+        batch[1, 2, 5, 7] = -1
+        assert patches[1, 2, 3, 2, 1, 1] == -1
+
+    def test_image(self):
+        """Tests patches of a single image."""
+        patches = Patchify(3, 3)(BATCH[1])
+        assert patches.shape == (2, 2, 3, 3, 3)
+        assert torch.equal(patches[1, 0], BATCH[1, :, 3:6, 0:3])
+
+    def test_fold(self):
+        """Tests that per-patch outputs are reassembled in patch order."""
+        patchify = Patchify(2, 1)
+        patches = patchify(BATCH).flatten(0, 2)
+        means = patches.mean(dim=(1, 2, 3))
+        feature_maps = patchify.fold(means, (6, 8))
+
+        expected = torch.nn.AvgPool2d(2, 1)(BATCH.mean(dim=1))
+        assert feature_maps.shape == (2, 1, 5, 7)
+        assert torch.allclose(feature_maps[:, 0], expected)
+
+        features = torch.stack([means, -means], dim=1)
+        assert torch.equal(
+            patchify.fold(features.reshape(2, 5, 7, 2), (6, 8)),
+            patchify.fold(features, (6, 8)),
+        )
+        assert torch.equal(patchify.fold(features, (6, 8))[:, 1], -expected)
+
+    def test_encode_patches(self):
+        """Tests encoding every patch as a small image."""
+        patches = Patchify(2)(torch.rand(1, 1, 4, 4) * torch.pi / 2).flatten(0, 2)
+        circuits = [encode_image(FRQI, patch) for patch in patches]
+        assert len(circuits) == 4
+        assert all(circuit.num_qubits == 3 for circuit in circuits)
+
+    @pytest.mark.parametrize(
+        "kernel_size, stride, error, message",
+        [
+            (2.0, None, TypeError, "kernel_size must be of the type int or tuple"),
+            ((2, 2, 2), None, TypeError, "kernel_size must be of the type int"),
+            (2, (1, True), TypeError, "stride must be of the type int or tuple"),
+            (0, None, ValueError, "The input kernel_size must be positive."),
+            (2, -1, ValueError, "The input stride must be positive."),
+        ],
+    )
+    def test_inputs(self, kernel_size, stride, error, message):
+        """Tests the kernel_size and stride inputs."""
+        with raises(error, match=message):
+            _ = Patchify(kernel_size, stride)
+
+    def test_data_input(self):
+        """Tests inputs that cannot be patched."""
+        with raises(ValueError, match=r"must have the shape \(\[N,\] C, H, W\)."):
+            _ = Patchify(2)(BATCH[0, 0])
+        with raises(ValueError, match=r"does not fit the image size \(6, 8\)."):
+            _ = Patchify(7)(BATCH)
+        with raises(ValueError, match="must be a multiple of the 12 patches"):
+            _ = Patchify(2).fold(torch.ones(13), (6, 8))
+        assert repr(Patchify(2, 1)) == "Patchify(kernel_size=(2, 2), stride=(1, 1))"
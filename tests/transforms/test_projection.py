@@ -0,0 +1,169 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Unit test for dimensionality reduction transforms"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+from pytest import raises
+
+from piqture.transforms.projection import (
+    IncrementalPCA,
+    LinearProjection,
+    RandomProjection,
+)
+
+
+@pytest.fixture(name="images")
+def images_fixture():
+    """Fixture for correlated 6x6 images."""
+    generator = torch.Generator().manual_seed(5)
+    latent = torch.randn(200, 3, generator=generator, dtype=torch.float64)
+    mixing = torch.randn(3, 36, generator=generator, dtype=torch.float64)
+    noise = 0.01 * torch.randn(200, 36, generator=generator, dtype=torch.float64)
+    return (latent @ mixing + noise + 0.5).reshape(200, 1, 6, 6)
+
+
+class TestIncrementalPCA:
+    """Tests for IncrementalPCA transform."""
+
+    @pytest.mark.parametrize("chunk_size", [7, 64, 200])
+    def test_fit(self, images, chunk_size):
+        """Tests that chunked fits match a full eigendecomposition."""
+        pca = IncrementalPCA(3).fit(images, chunk_size=chunk_size)
+
+        flat = images.reshape(200, -1)
+        covariance = torch.cov(flat.T)
+        # pylint: disable-next=not-callable
+        eigenvalues, eigenvectors = torch.linalg.eigh(covariance)
+        assert torch.allclose(pca.mean, flat.mean(dim=0))
+        assert torch.allclose(pca.explained_variance, eigenvalues.flip(0)[:3])
+        # Components agree up to their sign.
+        overlap = (pca.weight.double().T @ eigenvectors.flip(1)[:, :3]).abs()
+        assert torch.allclose(overlap, torch.eye(3, dtype=torch.float64), atol=1e-4)
+
+    def test_refit(self, images):
+        """Tests that fit replaces an earlier fit."""
+        pca = IncrementalPCA(2).fit(images[:100] * 3)
+        pca.fit(images[100:])
+        expected = IncrementalPCA(2).fit(images[100:])
+        assert pca.num_samples == 100
+        assert torch.equal(pca.mean, expected.mean)
+        assert torch.equal(pca.weight, expected.weight)
+
+    def test_transform(self, images):
+        """Tests projecting single images and batches."""
+        pca = IncrementalPCA(3).fit(images)
+        features = pca(images)
+        assert features.shape == (200, 3)
+        assert features.dtype == torch.float32
+        assert torch.allclose(pca(images[4]), features[4], atol=1e-5)
+        # Projected features are centered.
+        assert torch.allclose(features.mean(dim=0), torch.zeros(3), atol=1e-4)
+
+    def test_single_image_batch(self, images):
+        """Tests that batches of one image keep their batch dimension."""
+        pca = IncrementalPCA(3).fit(images)
+        features = pca.project_batch(images[:1])
+        assert features.shape == (1, 3)
+        assert torch.allclose(features[0], pca(images[0]))
+        assert torch.equal(pca.project_batch(images[:2]), pca(images[:2]))
+
+        projection = RandomProjection(16, 4)
+        assert projection.project_batch(torch.rand(1, 1, 4, 4)).shape == (1, 4)
+        assert projection(torch.rand(1, 1, 4, 4)).shape == (4,)
+        loader = torch.utils.data.DataLoader(images[:5], batch_size=2)
+        assert [len(pca.project_batch(batch)) for batch in loader] == [2, 2, 1]
+
+    def test_fit_inputs(self, images):
+        """Tests fitting from datasets, loaders and batches."""
+        dataset = torch.utils.data.TensorDataset(images, torch.zeros(200))
+        loader = torch.utils.data.DataLoader(dataset, batch_size=32)
+        expected = IncrementalPCA(2).fit(images).weight
+
+        assert torch.allclose(IncrementalPCA(2).fit(dataset, 50).weight, expected)
+        assert torch.allclose(IncrementalPCA(2).fit(loader).weight, expected)
+        partial = IncrementalPCA(2)
+        for batch in images.split(64):
+            partial.partial_fit(batch)
+        assert torch.allclose(partial(images), IncrementalPCA(2).fit(images)(images))
+
+    def test_save(self, images, tmp_path):
+        """Tests reapplying a saved fit."""
+        pca = IncrementalPCA(4).fit(images)
+        pca.save(tmp_path / "pca.npz")
+        projection = LinearProjection.load(tmp_path / "pca.npz")
+        assert repr(projection) == "LinearProjection(in_features=36, out_features=4)"
+        assert torch.equal(projection(images), pca(images))
+
+    @pytest.mark.parametrize(
+        "n_components, error, message",
+        [
+            (2.0, TypeError, "The input n_components must be of the type int."),
+            (0, ValueError, "The input n_components must be positive."),
+            (40, ValueError, "must not exceed the 36 values of an image."),
+        ],
+    )
+    def test_n_components(self, images, n_components, error, message):
+        """Tests the n_components input."""
+        with raises(error, match=message):
+            IncrementalPCA(n_components).fit(images)
+
+    def test_unfitted(self, images):
+        """Tests applying or extending a fit with mismatched images."""
+        with raises(ValueError, match="must be fitted before it is applied."):
+            _ = IncrementalPCA(2)(images)
+        pca = IncrementalPCA(2).fit(images)
+        with raises(ValueError, match="Images with 16 values do not match"):
+            pca.partial_fit(torch.ones(3, 4, 4))
+
+
+class TestRandomProjection:
+    """Tests for RandomProjection transform."""
+
+    def test_seed(self, images):
+        """Tests that projections are reproducible per seed."""
+        projection = RandomProjection(36, 8, seed=3)
+        assert torch.equal(projection.weight, RandomProjection(36, 8, seed=3).weight)
+        assert not torch.equal(projection.weight, RandomProjection(36, 8).weight)
+        assert projection(images).shape == (200, 8)
+        assert repr(projection) == (
+            "RandomProjection(in_features=36, n_components=8, seed=3)"
+        )
+
+    def test_distances(self):
+        """Tests that distances are preserved approximately."""
+        generator = torch.Generator().manual_seed(0)
+        points = torch.randn(20, 784, generator=generator)
+        features = RandomProjection(784, 256)(points)
+        ratio = torch.pdist(features) / torch.pdist(points)
+        assert np.isclose(ratio.mean().item(), 1, atol=0.05)
+
+    def test_save(self, images, tmp_path):
+        """Tests reapplying a saved projection."""
+        projection = RandomProjection(36, 5)
+        projection.save(tmp_path / "projection.npz")
+        loaded = LinearProjection.load(tmp_path / "projection.npz")
+        assert torch.equal(loaded(images), projection(images))
+
+    @pytest.mark.parametrize(
+        "weight, bias, message",
+        [
+            (torch.ones(4), None, "The input weight must be a matrix."),
+            (torch.ones(4, 2), torch.ones(3), r"must have the shape \(2,\)."),
+        ],
+    )
+    def test_linear_projection_input(self, weight, bias, message):
+        """Tests the weight and bias inputs."""
+        with raises(ValueError, match=message):
+            _ = LinearProjection(weight, bias)
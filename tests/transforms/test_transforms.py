@@ -17,7 +17,15 @@ import pytest
 import torch
 from pytest import raises
 
-from piqture.transforms.transforms import MinMaxNormalization
+from piqture.data_loader import DatasetStatistics
+from piqture.embeddings.image_embeddings.frqi import FRQI
+from piqture.embeddings.image_embeddings.neqr import NEQR
+from piqture.transforms.transforms import (
+    AngleMapping,
+    GlobalMinMaxNormalization,
+    MinMaxNormalization,
+    Quantization,
+)
 
 
 class TestMinMaxNormalization:
@@ -73,3 +81,198 @@ class TestMinMaxNormalization:
         transform = MinMaxNormalization(normalize_min, normalize_max)
         result = transform(data)
         assert torch.allclose(result, output, atol=1e-5, rtol=1e-4)
+
+    def test_constant_data(self):
+        """Tests that constant data is mapped to normalize_min."""
+        result = MinMaxNormalization(0.5, 1)(torch.full((2, 3), 7.0))
+        assert torch.equal(result, torch.full((2, 3), 0.5))
+
+    def test_integer_data(self):
+        """Tests that integer data is normalized to floats."""
+        result = MinMaxNormalization(0, 1)(
+            torch.tensor([0, 51, 255], dtype=torch.uint8)
+        )
+        assert torch.allclose(result, torch.Tensor([0, 0.2, 1]))
+
+
+class TestMinMaxNormalizationBatch:
+    """Test class for the batched MinMaxNormalization mode."""
+
+    @pytest.mark.parametrize("shape", [(3, 4), (5, 1, 4, 4), (2, 3, 2, 2)])
+    def test_matches_per_sample(self, shape):
+        """Tests that the batch mode normalizes every sample separately."""
+        transform = MinMaxNormalization(-np.pi, np.pi)
+        batch = torch.rand(shape) * 10
+        expected = torch.stack([transform(sample) for sample in batch])
+        assert torch.allclose(transform.normalize_batch(batch), expected)
+
+    def test_inplace(self):
+        """Tests in-place normalization of a batch."""
+        batch = torch.rand(4, 1, 2, 2)
+        expected = MinMaxNormalization(0, 1).normalize_batch(batch)
+        result = MinMaxNormalization(0, 1).normalize_batch(batch, inplace=True)
+        assert result.data_ptr() == batch.data_ptr()
+        assert torch.allclose(batch, expected)
+
+    def test_constant_samples(self):
+        """Tests that constant samples are mapped to normalize_min."""
+        batch = torch.stack([torch.zeros(2, 2), torch.Tensor([[0, 1], [2, 4]])])
+        result = MinMaxNormalization(1, 2).normalize_batch(batch)
+        assert torch.isfinite(result).all()
+        assert torch.equal(result[0], torch.ones(2, 2))
+        assert torch.allclose(result[1], torch.Tensor([[1, 1.25], [1.5, 2]]))
+
+    def test_integer_batch(self):
+        """Tests integer batches, which cannot be normalized in place."""
+        batch = torch.tensor([[0, 5, 10], [2, 2, 4]], dtype=torch.uint8)
+        result = MinMaxNormalization(0, 1).normalize_batch(batch)
+        assert torch.allclose(result, torch.Tensor([[0, 0.5, 1], [0, 0, 1]]))
+
+        with raises(TypeError, match="requires a floating point batch."):
+            MinMaxNormalization(0, 1).normalize_batch(batch, inplace=True)
+
+
+class TestGlobalMinMaxNormalization:
+    """Test class for GlobalMinMaxNormalization transform."""
+
+    def test_repr(self):
+        """Tests GlobalMinMaxNormalization class representation."""
+        assert repr(GlobalMinMaxNormalization(0, 1, 0.0, 255.0)) == (
+            "GlobalMinMaxNormalization(normalize_min=0, normalize_max=1, "
+            "data_min=0.0, data_max=255.0)"
+        )
+
+    @pytest.mark.parametrize(
+        "data_min, data_max, error, message",
+        [
+            ("0", 1, TypeError, "The input data_min must be of the type int or float."),
+            (
+                0,
+                None,
+                TypeError,
+                "The input data_max must be of the type int or float.",
+            ),
+            (2, 1, ValueError, "The input data_max must not be less than data_min."),
+        ],
+    )
+    def test_invalid_bounds(self, data_min, data_max, error, message):
+        """Tests invalid data bounds."""
+        with raises(error, match=message):
+            _ = GlobalMinMaxNormalization(0, 1, data_min, data_max)
+
+    def test_fixed_bounds(self):
+        """Tests that all samples are scaled with the same bounds."""
+        transform = GlobalMinMaxNormalization(0, np.pi, 0, 10)
+        batch = torch.Tensor([[0, 5], [2, 4]])
+        expected = torch.Tensor([[0, np.pi / 2], [np.pi / 5, 2 * np.pi / 5]])
+
+        assert torch.allclose(transform(batch[1]), expected[1])
+        assert torch.allclose(transform.normalize_batch(batch), expected)
+        assert torch.allclose(transform.normalize_batch(batch, inplace=True), expected)
+        assert torch.allclose(batch, expected)
+
+    def test_from_statistics(self):
+        """Tests creating the transform from dataset statistics."""
+        statistics = DatasetStatistics((2,), 4, (0, 1))
+        statistics.update(torch.Tensor([[0.25, 0.5], [0.75, 0.5]]))
+        transform = GlobalMinMaxNormalization.from_statistics(statistics, -1, 1)
+        assert (transform.data_min, transform.data_max) == (0.25, 0.75)
+        assert torch.allclose(
+            transform(torch.Tensor([0.25, 0.5, 0.75])), torch.Tensor([-1, 0, 1])
+        )
+
+
+class TestAngleMapping:
+    """Test class for AngleMapping transform."""
+
+    def test_repr(self):
+        """Tests AngleMapping class representation."""
+        assert repr(AngleMapping(0, 255)) == (
+            "AngleMapping(data_min=0, data_max=255, "
+            f"max_angle={np.pi / 2}, dtype=torch.float64)"
+        )
+
+    def test_dtype(self):
+        """Tests that a floating point dtype is required."""
+        with raises(TypeError, match="must be a floating point torch.dtype."):
+            _ = AngleMapping(dtype=torch.int64)
+
+    @pytest.mark.parametrize(
+        "data_min, data_max, data, output",
+        [
+            (0, 1, torch.Tensor([0, 0.5, 1]), [0, np.pi / 4, np.pi / 2]),
+            (0, 255, torch.tensor([0, 51, 255], dtype=torch.uint8), [0, 0.1, 0.5]),
+            (0, 1, np.array([-0.5, 0.25, 2]), [0, np.pi / 8, np.pi / 2]),
+        ],
+    )
+    def test_mapping(self, data_min, data_max, data, output):
+        """Tests mapping values to angles, clamped to [0, pi/2]."""
+        result = AngleMapping(data_min, data_max)(data)
+        assert result.dtype == torch.float64
+        expected = torch.tensor(output, dtype=torch.float64)
+        if data_max == 255:
+            expected = expected * np.pi
+        assert torch.allclose(result, expected)
+
+    def test_batch(self):
+        """Tests mapping a batch of images in place."""
+        transform = AngleMapping(max_angle=np.pi, dtype=torch.float32)
+        batch = torch.rand(4, 1, 2, 2)
+        expected = batch * np.pi
+        result = transform.normalize_batch(batch, inplace=True)
+        assert result.data_ptr() == batch.data_ptr()
+        assert torch.allclose(result, expected)
+
+    def test_frqi(self):
+        """Tests that mapped images can be embedded with FRQI."""
+        image = torch.rand(1, 2, 2)
+        angles = AngleMapping()(image)
+        circuit = FRQI((2, 2), angles.reshape(1, -1).tolist()).frqi()
+        assert circuit.num_parameters == 0
+
+
+class TestQuantization:
+    """Test class for Quantization transform."""
+
+    def test_repr(self):
+        """Tests Quantization class representation."""
+        assert repr(Quantization(15)) == (
+            "Quantization(max_color_intensity=15, data_min=0.0, data_max=1.0)"
+        )
+
+    @pytest.mark.parametrize(
+        "max_color_intensity, error, message",
+        [
+            (2.5, TypeError, "The input max_color_intensity must be of the type int."),
+            (True, TypeError, "The input max_color_intensity must be of the type int."),
+            (256, ValueError, "cannot be less than 0 or greater than 255."),
+            (-1, ValueError, "cannot be less than 0 or greater than 255."),
+        ],
+    )
+    def test_max_color_intensity(self, max_color_intensity, error, message):
+        """Tests the max_color_intensity input."""
+        with raises(error, match=message):
+            _ = Quantization(max_color_intensity)
+
+    @pytest.mark.parametrize(
+        "max_color_intensity, data_min, data_max, data, output",
+        [
+            (255, 0, 1, torch.Tensor([0, 0.5, 1]), [0, 128, 255]),
+            (3, 0, 1, torch.Tensor([[0.1, 0.4], [0.6, 1.2]]), [[0, 1], [2, 3]]),
+            (255, 0, 255, torch.tensor([0, 7, 255], dtype=torch.uint8), [0, 7, 255]),
+            (1, -1, 1, torch.Tensor([-2, -0.1, 0.1]), [0, 0, 1]),
+        ],
+    )
+    def test_quantization(self, max_color_intensity, data_min, data_max, data, output):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """Tests quantizing values to integer intensities."""
+        result = Quantization(max_color_intensity, data_min, data_max)(data)
+        assert result.dtype == torch.uint8
+        assert result.tolist() == output
+
+    def test_neqr(self):
+        """Tests that quantized images can be embedded with NEQR."""
+        image = torch.rand(1, 2, 2)
+        intensities = Quantization(15)(image)
+        embedding = NEQR((2, 2), intensities.reshape(1, -1).tolist(), 15)
+        assert embedding.neqr().num_qubits == 2 + 4